@@ -1,5 +1,8 @@
 # pylint: disable=wrong-import-position
 
+import importlib
+import typing as t
+
 from composio.utils import sentry
 
 
@@ -8,30 +11,33 @@ sentry.init()
 import atexit  # noqa: E402
 
 from composio.__version__ import __version__  # noqa: E402
-from composio.client import Composio  # noqa: E402
-from composio.client.collections import CustomAuthObject  # noqa: E402
-from composio.client.enums import (  # noqa: E402
-    Action,
-    ActionType,
-    App,
-    AppType,
-    Tag,
-    TagType,
-    Trigger,
-    TriggerType,
-)
-from composio.tools import RETRY, ComposioToolSet  # noqa: E402
-from composio.tools.base.runtime import action  # noqa: E402
-from composio.tools.env.factory import (  # noqa: E402
-    WorkspaceConfigType,
-    WorkspaceFactory,
-    WorkspaceType,
-)
-from composio.tools.env.host.shell import Shell  # noqa: E402
-from composio.utils.logging import LogLevel  # noqa: E402
 from composio.utils.warnings import create_latest_version_warning_hook  # noqa: E402
 
 
+if t.TYPE_CHECKING:
+    from composio.client import AsyncComposio, Composio
+    from composio.client.collections import CustomAuthObject
+    from composio.client.enums import (
+        Action,
+        ActionType,
+        App,
+        AppType,
+        Tag,
+        TagType,
+        Trigger,
+        TriggerType,
+    )
+    from composio.tools import RETRY, ComposioToolSet
+    from composio.tools.base.runtime import action
+    from composio.tools.env.factory import (
+        WorkspaceConfigType,
+        WorkspaceFactory,
+        WorkspaceType,
+    )
+    from composio.tools.env.host.shell import Shell
+    from composio.utils.logging import LogLevel
+
+
 __all__ = (
     "Tag",
     "App",
@@ -40,6 +46,7 @@ __all__ = (
     "Trigger",
     "TagType",
     "Composio",
+    "AsyncComposio",
     "ActionType",
     "TriggerType",
     "ComposioToolSet",
@@ -53,4 +60,42 @@ __all__ = (
     "LogLevel",
 )
 
+# The public names are imported on first access, so `import composio` stays
+# cheap for processes which only need a part of the SDK.
+_LAZY_ATTRIBUTES = {
+    "Composio": "composio.client",
+    "AsyncComposio": "composio.client",
+    "CustomAuthObject": "composio.client.collections",
+    "Action": "composio.client.enums",
+    "ActionType": "composio.client.enums",
+    "App": "composio.client.enums",
+    "AppType": "composio.client.enums",
+    "Tag": "composio.client.enums",
+    "TagType": "composio.client.enums",
+    "Trigger": "composio.client.enums",
+    "TriggerType": "composio.client.enums",
+    "ComposioToolSet": "composio.tools",
+    "RETRY": "composio.tools",
+    "action": "composio.tools.base.runtime",
+    "WorkspaceConfigType": "composio.tools.env.factory",
+    "WorkspaceFactory": "composio.tools.env.factory",
+    "WorkspaceType": "composio.tools.env.factory",
+    "Shell": "composio.tools.env.host.shell",
+    "LogLevel": "composio.utils.logging",
+}
+
+
+def __getattr__(name: str) -> t.Any:
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(_LAZY_ATTRIBUTES[name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> t.List[str]:
+    return sorted(set(globals()) | set(__all__))
+
+
 atexit.register(create_latest_version_warning_hook(version=__version__))
@@ -6,25 +6,23 @@ Usage:
 """
 
 import ast
+import hashlib
 import os.path
-import shutil
+import typing as t
+from pathlib import Path
 
 import click
 
-from composio import constants
 from composio.cli.context import Context, pass_context
 from composio.cli.utils.decorators import handle_exceptions
 from composio.cli.utils.helpfulcmd import HelpfulCmdBase
 from composio.client import Composio
-from composio.client.enums.base import (
-    ACTIONS_CACHE,
-    APPS_CACHE,
-    TAGS_CACHE,
-    TRIGGERS_CACHE,
-)
-from composio.client.utils import update_actions, update_apps, update_triggers
+from composio.client.enums import Action, App, Tag, Trigger
+from composio.client.enums.store import get_enum_store
+from composio.client.utils import refresh_cache
 from composio.core.cls.did_you_mean import DYMGroup
 from composio.exceptions import ComposioSDKError
+from composio.utils.atomic import atomic_write
 
 
 class AppsExamples(HelpfulCmdBase, DYMGroup):
@@ -85,20 +83,73 @@ def _update(context: Context) -> None:
 def _generate_types(context: Context) -> None:
     """Updates the local type stubs with the latest app data."""
     context.console.print("Fetching latest data from Composio API...")
-    generate_type_stubs(context.client)
+    changes = generate_type_stubs(context.client)
+    for name, change in changes.items():
+        if not change.written:
+            context.console.print(f"{name} is up to date")
+            continue
+        context.console.print(
+            f"Updated {name} ({len(change.added)} added, "
+            f"{len(change.removed)} removed)"
+        )
     context.console.print(
         "[green]Successfully updated type stubs for Apps, Actions, and Triggers[/green]"
     )
 
 
-def generate_type_stub(enum_file: str, cache_folder: os.PathLike) -> None:
-    # Get all enum filenames
-    enum_names = sorted(os.listdir(cache_folder))
+STUB_DIGEST_PREFIX = "# composio-stub-digest: "
+"""
+Prefix of the first line of a generated stub, which records the digest of
+the enum source and members the stub was generated from.
+"""
+
+_MEMBERS_PLACEHOLDER = "__COMPOSIO_ENUM_MEMBERS__"
 
-    # Get the enum class
-    with open(enum_file, encoding="utf-8") as f:
-        tree = ast.parse(f.read())
 
+class StubChange(t.NamedTuple):
+    """Changes made to a type stub."""
+
+    added: t.List[str]
+    """Enum members added since the last cache refresh."""
+
+    removed: t.List[str]
+    """Enum members removed since the last cache refresh."""
+
+    written: bool
+    """Whether the stub file was rewritten."""
+
+
+def _stub_digest(source: bytes, enum_names: t.Sequence[str]) -> str:
+    digest = hashlib.sha256(source)
+    digest.update("\n".join(enum_names).encode())
+    return digest.hexdigest()
+
+
+def generate_type_stub(enum_file: str, enum_names: t.List[str]) -> bool:
+    """
+    Generate the type stub for an enum module.
+
+    The stub is only rewritten when the enum source or the members changed
+    since it was generated.
+
+    :param enum_file: Path to the module defining the enum class
+    :param enum_names: Names of the enum members
+    :return: `True` if the stub was written
+    """
+    with open(enum_file, "rb") as f:
+        source = f.read()
+
+    stub_file = Path(enum_file + "i")
+    digest = _stub_digest(source=source, enum_names=enum_names)
+    try:
+        with stub_file.open(encoding="utf-8") as f:
+            if f.readline().rstrip("\n") == STUB_DIGEST_PREFIX + digest:
+                return False
+    except OSError:
+        pass
+
+    # Get the enum class
+    tree = ast.parse(source)
     enum_classes = [
         node
         for node in tree.body
@@ -118,43 +169,52 @@ def generate_type_stub(enum_file: str, cache_folder: os.PathLike) -> None:
         if isinstance(node, ast.FunctionDef):
             node.body = [ast.Expr(ast.Constant(...))]
 
-    # Add all enum names as class attributes
-    for enum_name in enum_names:
-        enum_class.body.append(
-            ast.AnnAssign(
-                target=ast.Name(id=enum_name, ctx=ast.Store()),
-                annotation=ast.Constant(value=f"{enum_class.name}"),
-                value=None,
-                simple=1,
-            )
-        )
+    # Enum names are added as class attributes, they're rendered as text
+    # in place of a placeholder rather than unparsed one node at a time
+    enum_class.body.append(ast.Expr(ast.Name(id=_MEMBERS_PLACEHOLDER)))
+    members = "\n".join(
+        f"    {enum_name}: {enum_class.name!r}" for enum_name in enum_names
+    )
+    stub = ast.unparse(tree).replace(f"    {_MEMBERS_PLACEHOLDER}", members, 1)
 
     # Write the type stub
-    with open(enum_file + "i", "w", encoding="utf-8") as f:
-        f.write(ast.unparse(tree))
-
+    atomic_write(stub_file, f"{STUB_DIGEST_PREFIX}{digest}\n{stub}")
+    return True
+
+
+def generate_type_stubs(client: Composio) -> t.Dict[str, StubChange]:
+    """
+    Refresh the local cache and update the type stubs of the enums.
+
+    The cache refresh only downloads the listings which changed, and only
+    the stubs whose members changed are rewritten.
+
+    :param client: Composio client to fetch the catalogue with
+    :return: Changes by stub file name
+    """
+    store = get_enum_store()
+    enum_classes = (
+        ("app.py", App),
+        ("action.py", Action),
+        ("trigger.py", Trigger),
+        ("tag.py", Tag),
+    )
+    previous = {
+        enum_class: set(store.slugs(enum_class.cache_folder))
+        for _, enum_class in enum_classes
+    }
 
-def generate_type_stubs(client: Composio) -> None:
     # Update local cache first
-    for cache_folder in ["apps", "actions", "triggers", "tags"]:
-        shutil.rmtree(
-            constants.LOCAL_CACHE_DIRECTORY / cache_folder,
-            ignore_errors=True,
-        )
-    apps = update_apps(client)
-    update_actions(client, apps)
-    update_triggers(client, apps)
+    refresh_cache(client)
 
     enums_folder = os.path.join(os.path.dirname(__file__), "..", "client", "enums")
-    apps_enum = os.path.join(enums_folder, "app.py")
-    actions_enum = os.path.join(enums_folder, "action.py")
-    triggers_enum = os.path.join(enums_folder, "trigger.py")
-    tags_enum = os.path.join(enums_folder, "tag.py")
-
-    for enum_file, cache_folder_path in [
-        (apps_enum, APPS_CACHE),
-        (actions_enum, ACTIONS_CACHE),
-        (triggers_enum, TRIGGERS_CACHE),
-        (tags_enum, TAGS_CACHE),
-    ]:
-        generate_type_stub(enum_file, cache_folder_path)
+    changes = {}
+    for enum_file, enum_class in enum_classes:
+        enum_names = store.slugs(enum_class.cache_folder)
+        written = generate_type_stub(os.path.join(enums_folder, enum_file), enum_names)
+        changes[enum_file + "i"] = StubChange(
+            added=sorted(set(enum_names) - previous[enum_class]),
+            removed=sorted(previous[enum_class] - set(enum_names)),
+            written=written,
+        )
+    return changes
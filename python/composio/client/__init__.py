@@ -6,10 +6,18 @@ import os
 import sys
 import typing as t
 from datetime import datetime
-from pathlib import Path
 
 import requests
 
+from composio.client.async_collections import (
+    AsyncActions,
+    AsyncActiveTriggers,
+    AsyncApps,
+    AsyncConnectedAccounts,
+    AsyncIntegrations,
+    AsyncTriggers,
+)
+from composio.client.cache import client_scope, connected_account_cache
 from composio.client.collections import (
     AUTH_SCHEMES,
     Actions,
@@ -37,11 +45,12 @@ from composio.client.enums import (
     TriggerType,
 )
 from composio.client.exceptions import ComposioClientError, HTTPError, NoItemsFound
-from composio.client.http import HttpClient
+from composio.client.http import AsyncHttpClient, HttpClient, RetryPolicy
+from composio.client.metrics import MetricsCollector, RequestHook, RequestInfo
 from composio.constants import (
     DEFAULT_ENTITY_ID,
     ENV_COMPOSIO_API_KEY,
-    LOCAL_CACHE_DIRECTORY_NAME,
+    LOCAL_CACHE_DIRECTORY,
     USER_DATA_FILE_NAME,
 )
 from composio.exceptions import ApiKeyNotProvidedError
@@ -55,6 +64,18 @@ _valid_keys: t.Set[str] = set()
 _clients: t.List["Composio"] = []
 
 
+def _load_api_key() -> t.Optional[str]:
+    """Load API key from the user data file or the environment."""
+    user_data_path = LOCAL_CACHE_DIRECTORY / USER_DATA_FILE_NAME
+    user_data = UserData.load(path=user_data_path) if user_data_path.exists() else None
+    env_api_key = (
+        user_data.api_key
+        if user_data is not None and user_data.api_key is not None
+        else os.environ.get(ENV_COMPOSIO_API_KEY)
+    )
+    return env_api_key or None
+
+
 class Composio:
     """Composio SDK Client."""
 
@@ -68,6 +89,9 @@ class Composio:
         api_key: t.Optional[str] = None,
         base_url: t.Optional[str] = None,
         runtime: t.Optional[str] = None,
+        retry_policy: t.Optional[RetryPolicy] = None,
+        request_hooks: t.Optional[t.Sequence[RequestHook]] = None,
+        collect_metrics: bool = False,
     ) -> None:
         """
         Initialize Composio SDK client
@@ -75,9 +99,19 @@ class Composio:
         :param api_key: Authentication key for Composio server
         :param base_url: Base URL for Composio server
         :param runtime: Runtime specifier
+        :param retry_policy: Policy for retrying failed requests
+        :param request_hooks: Hooks called around every API request attempt
+        :param collect_metrics: Record metrics for the API requests, see
+            `metrics()`
         """
         self._api_key = api_key
         self.runtime = runtime
+        self.retry_policy = retry_policy
+        self._metrics = MetricsCollector() if collect_metrics else None
+        self.request_hooks: t.List[RequestHook] = [
+            *([self._metrics] if self._metrics is not None else []),
+            *(request_hooks or []),
+        ]
         self.base_url = base_url or get_api_url_base()
 
         self.apps = Apps(client=self)
@@ -99,18 +133,7 @@ class Composio:
     @property
     def api_key(self) -> str:
         if self._api_key is None:
-            cache_dir = Path.home() / LOCAL_CACHE_DIRECTORY_NAME
-            user_data_path = cache_dir / USER_DATA_FILE_NAME
-            user_data = (
-                UserData.load(path=user_data_path) if user_data_path.exists() else None
-            )
-            env_api_key = (
-                user_data.api_key
-                if user_data is not None and user_data.api_key is not None
-                else os.environ.get(ENV_COMPOSIO_API_KEY)
-            )
-            if env_api_key:
-                self._api_key = env_api_key
+            self._api_key = _load_api_key()
 
         if self._api_key is None:
             raise ApiKeyNotProvidedError()
@@ -133,6 +156,8 @@ class Composio:
                 base_url=self.base_url,
                 api_key=self.api_key,
                 runtime=self.runtime,
+                retry_policy=self.retry_policy,
+                request_hooks=self.request_hooks,
             )
         return self._http
 
@@ -148,6 +173,8 @@ class Composio:
                 api_key=self.api_key,
                 runtime=self.runtime,
                 timeout=180.0,
+                retry_policy=self.retry_policy,
+                request_hooks=self.request_hooks,
             )
         return self._long_timeout_http
 
@@ -155,6 +182,18 @@ class Composio:
     def long_timeout_http(self, value: HttpClient) -> None:
         self._long_timeout_http = value
 
+    def metrics(self) -> t.Optional[MetricsCollector]:
+        """
+        Get the metrics recorded for the API requests made by this client.
+
+        Use `snapshot()` on the returned collector to read the metrics, or
+        `to_prometheus()` to export them in the Prometheus text format.
+
+        :return: Metrics collector, `None` unless the client was created with
+            `collect_metrics=True`
+        """
+        return self._metrics
+
     @staticmethod
     def validate_api_key(key: str, base_url: t.Optional[str] = None) -> str:
         """Validate given API key."""
@@ -230,6 +269,49 @@ class Composio:
         return Entity(id=id, client=self)
 
 
+def _get_latest_connections(
+    connected_accounts: t.List[ConnectedAccountModel],
+) -> t.Dict[str, ConnectedAccountModel]:
+    """Get the most recently created connection for every app."""
+    latest: t.Dict[str, t.Tuple[datetime, ConnectedAccountModel]] = {}
+    for connected_account in connected_accounts:
+        creation_date = datetime.fromisoformat(
+            connected_account.createdAt.replace("Z", "+00:00")
+        )
+        app = connected_account.appUniqueId
+        if app not in latest or creation_date > latest[app][0]:
+            latest[app] = (creation_date, connected_account)
+    return {app: account for app, (_, account) in latest.items()}
+
+
+def _no_connection_found(
+    app: str,
+    entity: str,
+    connected_account_id: t.Optional[str] = None,
+) -> NoItemsFound:
+    """Build the error raised when an entity has no connection for an app."""
+    suggestion = (
+        f"composio add {app}"
+        if entity == DEFAULT_ENTITY_ID
+        else f"composio add {app} -e {entity}"
+    )
+    note = f"Run this command to create a new connection: {suggestion}"
+    doc_note = "Read more here: https://dub.composio.dev/auth-help"
+    if sys.version_info >= (3, 11):
+        exception = NoItemsFound(
+            f"Could not find a connection with {app=},"
+            f" {connected_account_id=} and {entity=}."
+        )
+        exception.add_note(note)
+        exception.add_note(doc_note)
+    else:
+        exception = NoItemsFound(
+            f"Could not find a connection with {app=},"
+            f" {connected_account_id=} and {entity=}.\n{note}\n{doc_note}"
+        )
+    return exception
+
+
 class Entity:
     """Class to represent Entity object."""
 
@@ -327,51 +409,39 @@ class Entity:
         :return: Connected account object
         :raises: If no connected account found for given entity ID
         """
+        scope = client_scope(self.client)
         if connected_account_id is not None:
-            return self.client.connected_accounts.get(
-                connection_id=connected_account_id
+            account = connected_account_cache.get_account(
+                scope=scope,
+                connected_account_id=connected_account_id,
             )
+            if account is None:
+                account = self.client.connected_accounts.get(
+                    connection_id=connected_account_id
+                )
+                connected_account_cache.set_account(scope=scope, account=account)
+            return account
 
-        latest_account = None
-        latest_creation_date = datetime.fromtimestamp(0.0)
-        connected_accounts = self.client.connected_accounts.get(
-            entity_ids=[self.id],
-            active=True,
-        )
         app = str(app).lower()
-        for connected_account in connected_accounts:
-            if app == connected_account.appUniqueId:
-                creation_date = datetime.fromisoformat(
-                    connected_account.createdAt.replace("Z", "+00:00")
-                )
-                if latest_account is None or creation_date > latest_creation_date:
-                    latest_creation_date = creation_date
-                    latest_account = connected_account
-
-        if latest_account is None:
-            entity = self.id
-            suggestion = (
-                f"composio add {app}"
-                if entity == DEFAULT_ENTITY_ID
-                else f"composio add {app} -e {entity}"
-            )
-            note = f"Run this command to create a new connection: {suggestion}"
-            doc_note = "Read more here: https://dub.composio.dev/auth-help"
-            if sys.version_info >= (3, 11):
-                exception = NoItemsFound(
-                    f"Could not find a connection with {app=},"
-                    f" {connected_account_id=} and {entity=}."
-                )
-                exception.add_note(note)
-                exception.add_note(doc_note)
-            else:
-                exception = NoItemsFound(
-                    f"Could not find a connection with {app=},"
-                    f" {connected_account_id=} and {entity=}.\n{note}\n{doc_note}"
-                )
-            raise exception
+        account = connected_account_cache.get(scope=scope, entity_id=self.id, app=app)
+        if account is not None:
+            return account
+
+        latest_accounts = _get_latest_connections(
+            connected_accounts=self.client.connected_accounts.get(
+                entity_ids=[self.id],
+                active=True,
+            ),
+        )
+        connected_account_cache.set(
+            scope=scope,
+            entity_id=self.id,
+            accounts=latest_accounts,
+        )
+        if app not in latest_accounts:
+            raise _no_connection_found(app=app, entity=self.id)
 
-        return latest_account
+        return latest_accounts[app]
 
     def get_connections(self) -> t.List[ConnectedAccountModel]:
         """
@@ -480,6 +550,250 @@ class Entity:
         )
 
 
+class AsyncComposio:
+    """
+    Composio SDK client for use with `asyncio`.
+
+    Mirrors `Composio`, but the collections perform requests through a pooled
+    `AsyncHttpClient` and have to be awaited.
+
+    Example:
+    ```python
+        async with AsyncComposio() as client:
+            accounts = await client.connected_accounts.get(entity_ids=["default"])
+    ```
+    """
+
+    local: t.Any
+    _api_key: t.Optional[str] = None
+    _http: t.Optional[AsyncHttpClient] = None
+    _long_timeout_http: t.Optional[AsyncHttpClient] = None
+
+    def __init__(
+        self,
+        api_key: t.Optional[str] = None,
+        base_url: t.Optional[str] = None,
+        runtime: t.Optional[str] = None,
+        retry_policy: t.Optional[RetryPolicy] = None,
+        request_hooks: t.Optional[t.Sequence[RequestHook]] = None,
+        collect_metrics: bool = False,
+    ) -> None:
+        """
+        Initialize async Composio SDK client
+
+        :param api_key: Authentication key for Composio server
+        :param base_url: Base URL for Composio server
+        :param runtime: Runtime specifier
+        :param retry_policy: Policy for retrying failed requests
+        :param request_hooks: Hooks called around every API request attempt
+        :param collect_metrics: Record metrics for the API requests, see
+            `metrics()`
+        """
+        self._api_key = api_key
+        self.runtime = runtime
+        self.retry_policy = retry_policy
+        self._metrics = MetricsCollector() if collect_metrics else None
+        self.request_hooks: t.List[RequestHook] = [
+            *([self._metrics] if self._metrics is not None else []),
+            *(request_hooks or []),
+        ]
+        self.base_url = base_url or get_api_url_base()
+
+        self.apps = AsyncApps(client=self)
+        self.actions = AsyncActions(client=self)
+        self.triggers = AsyncTriggers(client=self)
+        self.integrations = AsyncIntegrations(client=self)
+        self.active_triggers = AsyncActiveTriggers(client=self)
+        self.connected_accounts = AsyncConnectedAccounts(client=self)
+
+    @property
+    def api_key(self) -> str:
+        """
+        API key for the client.
+
+        The key is not validated here since that would require a blocking
+        request, an invalid key will surface as an `HTTPError` on first use.
+        """
+        if self._api_key is None:
+            self._api_key = _load_api_key()
+
+        if self._api_key is None:
+            raise ApiKeyNotProvidedError()
+
+        return self._api_key
+
+    @property
+    def http(self) -> AsyncHttpClient:
+        if not self._http:
+            self._http = AsyncHttpClient(
+                base_url=self.base_url,
+                api_key=self.api_key,
+                runtime=self.runtime,
+                retry_policy=self.retry_policy,
+                request_hooks=self.request_hooks,
+            )
+        return self._http
+
+    @property
+    def long_timeout_http(self) -> AsyncHttpClient:
+        if not self._long_timeout_http:
+            self._long_timeout_http = AsyncHttpClient(
+                base_url=self.base_url,
+                api_key=self.api_key,
+                runtime=self.runtime,
+                timeout=180.0,
+                retry_policy=self.retry_policy,
+                request_hooks=self.request_hooks,
+            )
+        return self._long_timeout_http
+
+    def metrics(self) -> t.Optional[MetricsCollector]:
+        """
+        Get the metrics recorded for the API requests made by this client.
+
+        Use `snapshot()` on the returned collector to read the metrics, or
+        `to_prometheus()` to export them in the Prometheus text format.
+
+        :return: Metrics collector, `None` unless the client was created with
+            `collect_metrics=True`
+        """
+        return self._metrics
+
+    async def close(self) -> None:
+        """Close the HTTP sessions and release pooled connections."""
+        for http in (self._http, self._long_timeout_http):
+            if http is not None:
+                await http.close()
+
+    async def __aenter__(self) -> "AsyncComposio":
+        return self
+
+    async def __aexit__(self, *args: t.Any) -> None:
+        await self.close()
+
+    def get_entity(self, id: str = DEFAULT_ENTITY_ID) -> "AsyncEntity":
+        """
+        Create AsyncEntity object.
+
+        :param id: Entity ID
+        :return: AsyncEntity object.
+        """
+        return AsyncEntity(id=id, client=self)
+
+
+class AsyncEntity:
+    """Class to represent Entity object, for use with `AsyncComposio`."""
+
+    def __init__(
+        self,
+        client: AsyncComposio,
+        id: str = DEFAULT_ENTITY_ID,
+    ) -> None:
+        """
+        Initialize AsyncEntity object.
+
+        :param client: AsyncComposio client object.
+        :param id: Entity ID string
+        """
+        self.client = client
+        self.id = id
+
+    async def _execute(
+        self,
+        action: Action,
+        params: t.Dict,
+        connected_account_id: t.Optional[str] = None,
+        session_id: t.Optional[str] = None,
+        text: t.Optional[str] = None,
+        auth: t.Optional[CustomAuthObject] = None,
+    ) -> t.Dict:
+        if action.no_auth or auth is not None:
+            return await self.client.actions.execute(
+                action=action,
+                params=params,
+                entity_id=self.id,
+                session_id=session_id,
+                text=text,
+                auth=auth,
+            )
+
+        connected_account = await self.get_connection(
+            app=action.app,
+            connected_account_id=connected_account_id,
+        )
+        return await self.client.actions.execute(
+            action=action,
+            params=params,
+            entity_id=t.cast(str, connected_account.clientUniqueUserId),
+            connected_account=connected_account.id,
+            session_id=session_id,
+            text=text,
+            auth=auth,
+        )
+
+    async def get_connection(
+        self,
+        app: t.Optional[AppType] = None,
+        connected_account_id: t.Optional[str] = None,
+    ) -> ConnectedAccountModel:
+        """
+        Get connected account for an action.
+
+        :param app: App name
+        :param connected_account_id: Connected account ID to use as filter
+        :return: Connected account object
+        :raises: If no connected account found for given entity ID
+        """
+        scope = client_scope(self.client)
+        if connected_account_id is not None:
+            account = connected_account_cache.get_account(
+                scope=scope,
+                connected_account_id=connected_account_id,
+            )
+            if account is None:
+                account = t.cast(
+                    ConnectedAccountModel,
+                    await self.client.connected_accounts.get(
+                        connection_id=connected_account_id
+                    ),
+                )
+                connected_account_cache.set_account(scope=scope, account=account)
+            return account
+
+        app = str(app).lower()
+        account = connected_account_cache.get(scope=scope, entity_id=self.id, app=app)
+        if account is not None:
+            return account
+
+        latest_accounts = _get_latest_connections(
+            connected_accounts=t.cast(
+                t.List[ConnectedAccountModel],
+                await self.client.connected_accounts.get(
+                    entity_ids=[self.id],
+                    active=True,
+                ),
+            ),
+        )
+        connected_account_cache.set(
+            scope=scope,
+            entity_id=self.id,
+            accounts=latest_accounts,
+        )
+        if app not in latest_accounts:
+            raise _no_connection_found(app=app, entity=self.id)
+
+        return latest_accounts[app]
+
+    async def get_connections(self) -> t.List[ConnectedAccountModel]:
+        """
+        Get all connections for an entity.
+        """
+        return t.cast(
+            t.List[ConnectedAccountModel],
+            await self.client.connected_accounts.get(entity_ids=[self.id], active=True),
+        )
+
+
 __all__ = (
     "Action",
     "App",
@@ -489,4 +803,9 @@ __all__ = (
     "Trigger",
     "TriggerType",
     "Composio",
+    "AsyncComposio",
+    "RetryPolicy",
+    "RequestHook",
+    "RequestInfo",
+    "MetricsCollector",
 )
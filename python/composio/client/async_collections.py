@@ -0,0 +1,454 @@
+"""
+Composio server object collections, over the async HTTP client.
+"""
+
+import asyncio
+import json
+import typing as t
+
+from composio.client.base import AsyncCollection
+from composio.client.cache import (
+    action_schema_cache,
+    client_scope,
+    connected_account_cache,
+)
+from composio.client.collections import (
+    ActionModel,
+    Actions,
+    ActiveTriggerModel,
+    ActiveTriggers,
+    AppModel,
+    Apps,
+    AuthSchemeType,
+    ConnectedAccountModel,
+    ConnectedAccounts,
+    ConnectionParams,
+    ConnectionRequestModel,
+    CustomAuthObject,
+    IntegrationModel,
+    Integrations,
+    TriggerModel,
+    Triggers,
+    to_trigger_names,
+)
+from composio.client.enums import Action, ActionType, AppType, TagType, TriggerType
+from composio.client.exceptions import ComposioClientError
+from composio.utils import fastjson
+from composio.utils.files import dump_json
+
+
+class AsyncConnectedAccounts(AsyncCollection[ConnectedAccountModel]):
+    """Collection of connected accounts."""
+
+    model = ConnectedAccountModel
+    endpoint = ConnectedAccounts.endpoint
+
+    async def get(  # type: ignore[override]
+        self,
+        connection_id: t.Optional[str] = None,
+        entity_ids: t.Optional[t.Sequence[str]] = None,
+        active: bool = False,
+    ) -> t.Union[ConnectedAccountModel, t.List[ConnectedAccountModel]]:
+        """
+        Get a list of connected accounts.
+
+        :param entity_ids: List of entity IDs to filter by
+        :param connection_id: Return the connected account by a specific
+                connection ID
+        :param active: Returns account which are currently active
+        :return: List of connected accounts
+        """
+        entity_ids = entity_ids or ()
+        if connection_id is not None and len(entity_ids) > 0:
+            raise ComposioClientError(
+                message="Cannot use both `connection_id` and `entity_ids` parameters as filter"
+            )
+
+        if connection_id is not None:
+            response = self._raise_if_required(
+                await self.client.http.get(
+                    url=str(self.endpoint / connection_id),
+                )
+            )
+            return self.model(**response.json())
+
+        queries = {}
+        if len(entity_ids) > 0:
+            queries["user_uuid"] = ",".join(entity_ids)
+
+        if active:
+            queries["showActiveOnly"] = "true"
+
+        response = self._raise_if_required(
+            await self.client.http.get(
+                url=str(self.endpoint(queries=queries)),
+            )
+        )
+        return [self.model(**account) for account in response.json().get("items", [])]
+
+    async def initiate(
+        self,
+        integration_id: str,
+        entity_id: t.Optional[str] = None,
+        params: t.Optional[t.Dict] = None,
+        labels: t.Optional[t.List] = None,
+        redirect_url: t.Optional[str] = None,
+    ) -> ConnectionRequestModel:
+        """Initiate a new connected account."""
+        response = self._raise_if_required(
+            response=await self.client.http.post(
+                url=str(self.endpoint),
+                json={
+                    "integrationId": integration_id,
+                    "userUuid": entity_id,
+                    "data": params or {},
+                    "labels": labels or [],
+                    "redirectUri": redirect_url,
+                },
+            )
+        )
+        connected_account_cache.invalidate(
+            scope=client_scope(self.client),
+            entity_id=entity_id,
+        )
+        return ConnectionRequestModel(**response.json())
+
+    async def info(self, connection_id: str) -> ConnectionParams:
+        response = self._raise_if_required(
+            await self.client.http.get(
+                url=str(self.endpoint / connection_id / "info"),
+            )
+        )
+        return ConnectionParams(**response.json())
+
+
+class AsyncApps(AsyncCollection[AppModel]):
+    """Collection of composio apps.."""
+
+    model = AppModel
+    endpoint = Apps.endpoint
+
+    async def get(  # type: ignore[override]
+        self,
+        name: t.Optional[str] = None,
+    ) -> t.Union[AppModel, t.List[AppModel]]:
+        """Get apps."""
+        if name is not None:
+            return self.model(
+                **self._raise_if_required(
+                    response=await self.client.http.get(
+                        url=str(self.endpoint / name),
+                    )
+                ).json()
+            )
+
+        return await super().get(queries={})
+
+
+class AsyncTriggers(AsyncCollection[TriggerModel]):
+    """Collection of triggers."""
+
+    model = TriggerModel
+    endpoint = Triggers.endpoint
+
+    async def get(  # type: ignore[override]
+        self,
+        trigger_names: t.Optional[t.List[TriggerType]] = None,
+        apps: t.Optional[t.List[str]] = None,
+    ) -> t.List[TriggerModel]:
+        """
+        List active triggers
+
+        :param trigger_names: Trigger names to filter by, can be a list of strings or Trigger objects
+        :param app_names: App names to filter by
+        :return: List of triggers filtered by provided parameters
+        """
+        queries = {}
+        if trigger_names is not None and len(trigger_names) > 0:
+            queries["triggerIds"] = to_trigger_names(trigger_names)
+        if apps is not None and len(apps) > 0:
+            queries["appNames"] = ",".join(apps)
+        return await super().get(queries=queries)
+
+    async def enable(
+        self, name: str, connected_account_id: str, config: t.Dict[str, t.Any]
+    ) -> t.Dict:
+        """
+        Enable a trigger
+
+        :param name: Name of the trigger
+        :param connected_account_id: ID of the relevant connected account
+        """
+        response = self._raise_if_required(
+            await self.client.http.post(
+                url=str(self.endpoint.enable / connected_account_id / name),
+                json={"triggerConfig": config},
+            )
+        )
+        return response.json()
+
+    async def disable(self, id: str) -> t.Dict:
+        """
+        Disable a trigger
+
+        :param id: ID of the trigger instance
+        """
+        response = self._raise_if_required(
+            await self.client.http.patch(
+                url=str(self.endpoint / "instance" / id / "status"),
+                json={
+                    "enabled": False,
+                },
+            )
+        )
+        return response.json()
+
+
+class AsyncActiveTriggers(AsyncCollection[ActiveTriggerModel]):
+    """Collection of active triggers."""
+
+    model = ActiveTriggerModel
+    endpoint = ActiveTriggers.endpoint
+
+    _list_key = "triggers"
+
+    async def get(  # type: ignore[override]
+        self,
+        trigger_ids: t.Optional[t.List[str]] = None,
+        connected_account_ids: t.Optional[t.List[str]] = None,
+        integration_ids: t.Optional[t.List[str]] = None,
+        trigger_names: t.Optional[t.List[TriggerType]] = None,
+    ) -> t.List[ActiveTriggerModel]:
+        """List active triggers."""
+        queries = {}
+        if trigger_ids:
+            queries["triggerIds"] = ",".join(trigger_ids)
+        if connected_account_ids:
+            queries["connectedAccountIds"] = ",".join(connected_account_ids)
+        if integration_ids:
+            queries["integrationIds"] = ",".join(integration_ids)
+        if trigger_names:
+            queries["triggerNames"] = to_trigger_names(trigger_names)
+        return await super().get(queries=queries)
+
+
+class AsyncActions(AsyncCollection[ActionModel]):
+    """Collection of composio actions.."""
+
+    model = ActionModel
+    endpoint = Actions.endpoint
+
+    # Request building and response filtering are shared with the sync
+    # collection, only the transport differs.
+    _build_query = Actions._build_query
+    _get_local_items = Actions._get_local_items
+    _filter_items = Actions._filter_items
+    _build_execute_request = Actions._build_execute_request
+    _cache_schema = Actions._cache_schema
+    _revalidation_headers = staticmethod(Actions._revalidation_headers)
+    _process_file_params = staticmethod(Actions._process_file_params)
+    _serialize_auth = staticmethod(Actions._serialize_auth)
+
+    async def get(  # type: ignore[override]
+        self,
+        actions: t.Optional[t.Sequence[ActionType]] = None,
+        apps: t.Optional[t.Sequence[AppType]] = None,
+        tags: t.Optional[t.Sequence[TagType]] = None,
+        limit: t.Optional[int] = None,
+        use_case: t.Optional[str] = None,
+        allow_all: bool = False,
+    ) -> t.List[ActionModel]:
+        """
+        Get a list of apps by the specified filters.
+
+        :param actions: Filter by the list of Actions.
+        :param apps: Filter by the list of Apps.
+        :param tags: Filter by the list of given Tags.
+        :param limit: Limit the number of actions to a specific number.
+        :param use_case: Filter by use case.
+        :param allow_all: Allow querying all of the actions for a specific
+                        app
+        :return: List of actions
+        """
+        query = self._build_query(
+            actions=actions,
+            apps=apps,
+            tags=tags,
+            limit=limit,
+            use_case=use_case,
+            allow_all=allow_all,
+        )
+        if query.url is None:
+            return self._get_local_items(query=query)
+
+        response = self._raise_if_required(
+            response=await self.client.http.get(url=query.url),
+        )
+        return self._filter_items(
+            query=query,
+            items=fastjson.validate_list(
+                data=response.content,
+                model=self.model,
+                key="items",
+            )
+            or [],
+        )
+
+    async def get_schema(self, action: Action) -> ActionModel:
+        """
+        Get the schema for an action, using the process-wide schema cache.
+
+        :param action: Action to get the schema for.
+        :return: Action schema.
+        """
+        entry = action_schema_cache.get(
+            scope=client_scope(self.client), slug=action.slug
+        )
+        if entry is not None and entry.fresh:
+            return entry.model
+
+        response = await self.client.http.get(
+            url=str(self.endpoint / action.slug),
+            headers=self._revalidation_headers(entry=entry),
+        )
+        return self._cache_schema(action=action, response=response)
+
+    async def execute(
+        self,
+        action: Action,
+        params: t.Dict,
+        entity_id: str = "default",
+        connected_account: t.Optional[str] = None,
+        session_id: t.Optional[str] = None,
+        text: t.Optional[str] = None,
+        auth: t.Optional[CustomAuthObject] = None,
+    ) -> t.Dict:
+        """
+        Execute an action on the specified entity with optional connected account.
+
+        :param action: The Action object to be executed.
+        :param params: A dictionary of parameters to be passed to the action.
+        :param entity_id: The unique identifier of the entity on which the action is executed.
+        :param connected_account: Optional connected account ID if required for the action.
+        :param session_id: ID of the current workspace session
+        :return: A dictionary containing the response from the executed action.
+        """
+        if action.is_local:
+            raise ComposioClientError(
+                f"Action {action} is a local action and cannot be executed remotely"
+            )
+
+        action_model = await self.get_schema(action=action)
+        # Files are read while the body is written, so keep it off the loop
+        body = await asyncio.to_thread(
+            lambda: dump_json(
+                self._build_execute_request(
+                    action=action,
+                    action_model=action_model,
+                    params=params,
+                    entity_id=entity_id,
+                    connected_account=connected_account,
+                    session_id=session_id,
+                    text=text,
+                    auth=auth,
+                )
+            )
+        )
+        with body:
+            response = await self.client.long_timeout_http.post(
+                url=str(self.endpoint / action.slug / "execute"),
+                data=body,
+                headers={"Content-Type": "application/json"},
+            )
+        return self._raise_if_required(response).json()
+
+
+class AsyncIntegrations(AsyncCollection[IntegrationModel]):
+    """
+    Collection of composio integrations.
+    """
+
+    model = IntegrationModel
+    endpoint = Integrations.endpoint
+
+    async def create(
+        self,
+        app_id: str,
+        name: t.Optional[str] = None,
+        auth_mode: t.Optional[AuthSchemeType] = None,
+        auth_config: t.Optional[t.Dict[str, t.Any]] = None,
+        use_composio_auth: bool = False,
+        force_new_integration: bool = False,
+    ) -> IntegrationModel:
+        """
+        Create a new integration
+
+        :param app_id: App ID string.
+        :param name: Name of the integration.
+        :param auth_param: Auth mode string.
+        :param auth_config: Authentication configuration.
+        :param use_composio_auth: Whether to use default composio auth or not
+        :return: Integration model created by the request.
+        """
+        request: t.Dict[str, t.Any] = {
+            "appId": app_id,
+            "useComposioAuth": use_composio_auth,
+        }
+
+        if name is not None:
+            request["name"] = name
+
+        if auth_mode is not None:
+            request["authScheme"] = auth_mode
+
+        if auth_config is not None:
+            request["authConfig"] = auth_config or {}
+
+        if force_new_integration:
+            request["forceNewIntegration"] = force_new_integration
+
+        response = self._raise_if_required(
+            response=await self.client.http.post(
+                url=str(self.endpoint),
+                json=request,
+            )
+        )
+        return IntegrationModel(**response.json())
+
+    async def remove(self, id: str) -> None:
+        await self.client.http.delete(url=str(self.endpoint / id))
+
+    async def get(  # type: ignore[override]
+        self,
+        id: t.Optional[str] = None,
+        *,
+        page_size: t.Optional[int] = None,
+        page: t.Optional[int] = None,
+        app_id: t.Optional[str] = None,
+        app_name: t.Optional[str] = None,
+        show_disabled: t.Optional[bool] = None,
+    ) -> t.Union[t.List[IntegrationModel], IntegrationModel]:
+        if id is not None:
+            return IntegrationModel(
+                **self._raise_if_required(
+                    await self.client.http.get(url=str(self.endpoint / id))
+                ).json()
+            )
+
+        quries = {}
+        if page_size is not None:
+            quries["pageSize"] = json.dumps(page_size)
+
+        if page is not None:
+            quries["page"] = json.dumps(page)
+
+        if app_id is not None:
+            quries["appId"] = app_id
+
+        if app_name is not None:
+            quries["appName"] = app_name
+
+        if show_disabled is not None:
+            quries["showDisabled"] = json.dumps(show_disabled)
+
+        return await super().get(queries=quries)
@@ -6,16 +6,19 @@ import typing as t
 
 import requests
 
+from composio.client.cache import client_scope, connected_account_cache
 from composio.client.endpoints import Endpoint
 from composio.client.exceptions import HTTPError
-from composio.utils import logging
+from composio.client.http import AsyncResponse
+from composio.utils import fastjson, logging
 
 
 if t.TYPE_CHECKING:
-    from composio.client import Composio
+    from composio.client import AsyncComposio, Composio
 
 ModelType = t.TypeVar("ModelType")
 CollectionType = t.TypeVar("CollectionType", list, dict)
+ResponseType = t.TypeVar("ResponseType", requests.Response, AsyncResponse)
 
 
 class Collection(t.Generic[ModelType], logging.WithLogger):
@@ -33,9 +36,9 @@ class Collection(t.Generic[ModelType], logging.WithLogger):
 
     def _raise_if_required(
         self,
-        response: requests.Response,
+        response: ResponseType,
         status_code: int = 200,
-    ) -> requests.Response:
+    ) -> ResponseType:
         """
         Raise if HTTP response is not expected.
 
@@ -45,6 +48,9 @@ class Collection(t.Generic[ModelType], logging.WithLogger):
                 not match with the expected status code
         """
         if response.status_code != status_code:
+            if response.status_code == 401:
+                # Credentials were revoked, cached accounts can't be trusted
+                connected_account_cache.invalidate(scope=client_scope(self.client))
             raise HTTPError(
                 message=response.content.decode(encoding="utf-8"),
                 status_code=response.status_code,
@@ -58,15 +64,48 @@ class Collection(t.Generic[ModelType], logging.WithLogger):
                 url=str(self.endpoint(queries=queries or {})),
             ),
         )
+        return self._parse_items(response=request)
+
+    def _parse_items(self, response: ResponseType) -> t.List[ModelType]:
+        """Parse list of models from the response."""
+        if fastjson.is_json_list(response.content):
+            return t.cast(
+                t.List[ModelType],
+                fastjson.validate_list(data=response.content, model=self.model),
+            )
 
-        data = request.json()
-        if isinstance(data, list):
-            return [self.model(**item) for item in data]
-
-        if self._list_key in data:
-            return [self.model(**item) for item in data[self._list_key]]
+        items = fastjson.validate_list(
+            data=response.content,
+            model=self.model,
+            key=self._list_key,
+        )
+        if items is not None:
+            return items
 
         raise HTTPError(
-            message=f"Received invalid data object: {request.content.decode()}",
-            status_code=request.status_code,
+            message=f"Received invalid data object: {response.content.decode()}",
+            status_code=response.status_code,
+        )
+
+
+class AsyncCollection(Collection[ModelType]):
+    """Data model collection for representing server objects, over `AsyncHttpClient`."""
+
+    client: "AsyncComposio"  # type: ignore[assignment]
+
+    def __init__(self, client: "AsyncComposio") -> None:  # type: ignore[override]
+        """Initialize async collection namespace."""
+        logging.WithLogger.__init__(self)
+        self.client = client
+
+    async def get(  # type: ignore[override]
+        self,
+        queries: t.Optional[t.Dict[str, str]] = None,
+    ) -> t.List[ModelType]:
+        """List available models."""
+        response = self._raise_if_required(
+            response=await self.client.http.get(
+                url=str(self.endpoint(queries=queries or {})),
+            ),
         )
+        return self._parse_items(response=response)
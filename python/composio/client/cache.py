@@ -0,0 +1,330 @@
+"""
+In-process caches for server objects.
+"""
+
+import hashlib
+import os
+import threading
+import time
+import typing as t
+from collections import OrderedDict
+from dataclasses import dataclass, field
+
+
+if t.TYPE_CHECKING:
+    from composio.client import AsyncComposio, Composio
+    from composio.client.collections import ActionModel, ConnectedAccountModel
+
+
+ENV_COMPOSIO_ACTION_SCHEMA_CACHE_TTL = "COMPOSIO_ACTION_SCHEMA_CACHE_TTL"
+"""
+Environment variable for the number of seconds an action schema is used
+for before it is revalidated.
+"""
+
+DEFAULT_ACTION_SCHEMA_CACHE_TTL = 600.0
+
+ENV_COMPOSIO_CONNECTED_ACCOUNT_CACHE_TTL = "COMPOSIO_CONNECTED_ACCOUNT_CACHE_TTL"
+"""
+Environment variable for the number of seconds a connected account lookup
+is cached for, set to `0` to disable the cache.
+"""
+
+DEFAULT_CONNECTED_ACCOUNT_CACHE_TTL = 60.0
+
+DEFAULT_CONNECTED_ACCOUNT_CACHE_SIZE = 4096
+
+_AccountEntry = t.Tuple[float, "ConnectedAccountModel"]
+
+
+@dataclass
+class CacheEntry:
+    """Cached action schema."""
+
+    model: "ActionModel"
+    "Action schema."
+
+    expires_at: float
+    "Monotonic time after which the entry needs revalidation."
+
+    etag: t.Optional[str] = None
+    "ETag returned by the server, used for conditional revalidation."
+
+    @property
+    def fresh(self) -> bool:
+        return time.monotonic() < self.expires_at
+
+
+def client_scope(client: t.Union["Composio", "AsyncComposio"]) -> str:
+    """
+    Get the scope of a client in the process-wide caches.
+
+    The scope is derived from the base URL and a digest of the API key, so
+    clients for different servers or projects never share entries and the
+    caches don't hold on to API keys.
+    """
+    digest = hashlib.sha256(str(client.api_key).encode("utf-8")).hexdigest()
+    return f"{str(client.base_url).rstrip('/')}#{digest}"
+
+
+@dataclass
+class ActionSchemaCache:
+    """
+    Process-wide action schema cache keyed by client scope and action slug.
+
+    The scope is derived from the base URL and the API key of the client
+    (see `client_scope`), so clients for different servers or projects never
+    see each other's schemas. The cache only stores what the server returned;
+    fetching and conditional revalidation is left to the sync and async
+    `Actions` collections.
+    """
+
+    ttl: float = DEFAULT_ACTION_SCHEMA_CACHE_TTL
+    "Number of seconds an entry is considered fresh."
+
+    _entries: t.Dict[t.Tuple[str, str], CacheEntry] = field(default_factory=dict)
+    _lock: threading.Lock = field(default_factory=threading.Lock)
+
+    def get(self, scope: str, slug: str) -> t.Optional[CacheEntry]:
+        """Get cached entry for the action, fresh or not."""
+        with self._lock:
+            return self._entries.get((scope, slug.upper()))
+
+    def set(
+        self,
+        scope: str,
+        slug: str,
+        model: "ActionModel",
+        etag: t.Optional[str] = None,
+    ) -> CacheEntry:
+        """Store the action schema."""
+        entry = CacheEntry(
+            model=model,
+            expires_at=time.monotonic() + self.ttl,
+            etag=etag,
+        )
+        with self._lock:
+            self._entries[(scope, slug.upper())] = entry
+        return entry
+
+    def seed(self, scope: str, models: t.Iterable["ActionModel"]) -> None:
+        """Store schemas received from an action listing."""
+        for model in models:
+            self.set(scope=scope, slug=model.name, model=model.model_copy(deep=True))
+
+    def revalidated(self, scope: str, slug: str) -> t.Optional[CacheEntry]:
+        """Mark the entry as fresh after the server reported it unchanged."""
+        with self._lock:
+            entry = self._entries.get((scope, slug.upper()))
+            if entry is not None:
+                entry.expires_at = time.monotonic() + self.ttl
+            return entry
+
+    def invalidate(
+        self,
+        scope: t.Optional[str] = None,
+        slug: t.Optional[str] = None,
+    ) -> None:
+        """
+        Drop the entry for the action, every entry of the scope if `slug` is
+        `None`, or every entry if `scope` is `None` as well.
+        """
+        slug = None if slug is None else slug.upper()
+        with self._lock:
+            for key in list(self._entries):
+                if scope in (None, key[0]) and slug in (None, key[1]):
+                    del self._entries[key]
+
+
+action_schema_cache = ActionSchemaCache(
+    ttl=float(
+        os.environ.get(
+            ENV_COMPOSIO_ACTION_SCHEMA_CACHE_TTL,
+            DEFAULT_ACTION_SCHEMA_CACHE_TTL,
+        )
+    )
+)
+"""Action schema cache shared by every client in the process."""
+
+
+@dataclass
+class ActionSchemasCache:
+    """
+    Memoized action schema listings of a toolset, as handed to the LLM.
+
+    Entries are keyed by everything the processed schemas depend on and are
+    used until they expire, the least recently used ones are dropped when
+    the cache is full. The cached schemas are copied on the way in and out,
+    so callers are free to modify the schemas they get.
+    """
+
+    ttl: float = DEFAULT_ACTION_SCHEMA_CACHE_TTL
+    "Number of seconds an entry is used for."
+
+    maxsize: int = 64
+    "Maximum number of entries."
+
+    _entries: "OrderedDict[t.Hashable, t.Tuple[float, t.List[ActionModel]]]" = field(
+        default_factory=OrderedDict
+    )
+    _lock: threading.Lock = field(default_factory=threading.Lock)
+
+    def get(self, key: t.Hashable) -> t.Optional[t.List["ActionModel"]]:
+        """Get a copy of the cached schemas, `None` if missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if time.monotonic() >= entry[0]:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+        return [model.model_copy(deep=True) for model in entry[1]]
+
+    def set(self, key: t.Hashable, models: t.List["ActionModel"]) -> None:
+        """Store a copy of the schemas."""
+        if self.ttl <= 0:
+            return
+        entry = (
+            time.monotonic() + self.ttl,
+            [model.model_copy(deep=True) for model in models],
+        )
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        with self._lock:
+            self._entries.clear()
+
+
+@dataclass
+class ConnectedAccountCache:
+    """
+    Process-wide connected account cache.
+
+    Accounts are indexed by `(entity_id, app)` and by connected account ID.
+    Every entry is scoped by the client it was fetched with (see
+    `client_scope`), so clients for different projects never see each
+    other's accounts. Only lookups which found an account are cached.
+
+    Both indexes hold at most `maxsize` entries, the oldest ones are dropped
+    first. Since every entry lives for `ttl` seconds, the oldest entries are
+    also the first to expire, and expired entries are pruned on writes.
+    """
+
+    ttl: float = DEFAULT_CONNECTED_ACCOUNT_CACHE_TTL
+    "Number of seconds an entry is used for."
+
+    maxsize: int = DEFAULT_CONNECTED_ACCOUNT_CACHE_SIZE
+    "Maximum number of entries per index."
+
+    _by_app: "OrderedDict[t.Tuple[str, str, str], _AccountEntry]" = field(
+        default_factory=OrderedDict
+    )
+    _by_id: "OrderedDict[t.Tuple[str, str], _AccountEntry]" = field(
+        default_factory=OrderedDict
+    )
+    _lock: threading.Lock = field(default_factory=threading.Lock)
+
+    @staticmethod
+    def _lookup(
+        index: "OrderedDict[t.Any, _AccountEntry]",
+        key: t.Tuple[str, ...],
+    ) -> t.Optional["ConnectedAccountModel"]:
+        entry = index.get(key)
+        if entry is None or time.monotonic() >= entry[0]:
+            return None
+        return entry[1]
+
+    def _store(
+        self,
+        index: "OrderedDict[t.Any, _AccountEntry]",
+        key: t.Tuple[str, ...],
+        entry: _AccountEntry,
+    ) -> None:
+        # Re-inserted entries move to the end, keeping the index ordered by
+        # expiry time
+        index.pop(key, None)
+        index[key] = entry
+        now = time.monotonic()
+        while index and (
+            len(index) > self.maxsize or next(iter(index.values()))[0] <= now
+        ):
+            index.popitem(last=False)
+
+    def get(
+        self,
+        scope: str,
+        entity_id: str,
+        app: str,
+    ) -> t.Optional["ConnectedAccountModel"]:
+        """Get the latest connected account of the entity for the app."""
+        with self._lock:
+            return self._lookup(self._by_app, (scope, entity_id, app.lower()))
+
+    def set(
+        self,
+        scope: str,
+        entity_id: str,
+        accounts: t.Dict[str, "ConnectedAccountModel"],
+    ) -> None:
+        """Store the latest connected account of the entity for every app."""
+        if self.ttl <= 0:
+            return
+        expires_at = time.monotonic() + self.ttl
+        with self._lock:
+            for app, account in accounts.items():
+                self._store(
+                    self._by_app,
+                    (scope, entity_id, app.lower()),
+                    (expires_at, account),
+                )
+
+    def get_account(
+        self,
+        scope: str,
+        connected_account_id: str,
+    ) -> t.Optional["ConnectedAccountModel"]:
+        """Get connected account by ID."""
+        with self._lock:
+            return self._lookup(self._by_id, (scope, connected_account_id))
+
+    def set_account(self, scope: str, account: "ConnectedAccountModel") -> None:
+        """Store connected account fetched by ID."""
+        if self.ttl <= 0:
+            return
+        with self._lock:
+            self._store(
+                self._by_id,
+                (scope, account.id),
+                (time.monotonic() + self.ttl, account),
+            )
+
+    def invalidate(self, scope: str, entity_id: t.Optional[str] = None) -> None:
+        """
+        Drop the app lookups of an entity, or every entry of the scope if
+        `entity_id` is `None`.
+        """
+        with self._lock:
+            for key in list(self._by_app):
+                if key[0] == scope and entity_id in (None, key[1]):
+                    del self._by_app[key]
+            if entity_id is None:
+                for key in list(self._by_id):
+                    if key[0] == scope:
+                        del self._by_id[key]
+
+
+connected_account_cache = ConnectedAccountCache(
+    ttl=float(
+        os.environ.get(
+            ENV_COMPOSIO_CONNECTED_ACCOUNT_CACHE_TTL,
+            DEFAULT_CONNECTED_ACCOUNT_CACHE_TTL,
+        )
+    )
+)
+"""Connected account cache shared by every client in the process."""
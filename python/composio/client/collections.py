@@ -2,7 +2,6 @@
 Composio server object collections
 """
 
-import base64
 import difflib
 import json
 import os
@@ -11,6 +10,7 @@ import traceback
 import typing as t
 import warnings
 from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
 from unittest import mock
 
 import pysher
@@ -21,6 +21,12 @@ from pysher.channel import Channel as PusherChannel
 from pysher.connection import Connection as PusherConnection
 
 from composio.client.base import Collection
+from composio.client.cache import (
+    CacheEntry,
+    action_schema_cache,
+    client_scope,
+    connected_account_cache,
+)
 from composio.client.endpoints import v1, v2
 from composio.client.enums import (
     Action,
@@ -33,8 +39,10 @@ from composio.client.enums import (
     TriggerType,
 )
 from composio.client.exceptions import ComposioClientError, ComposioSDKError
+from composio.client.http import AsyncResponse
 from composio.constants import PUSHER_CLUSTER, PUSHER_KEY
-from composio.utils import help_msg, logging
+from composio.utils import fastjson, help_msg, logging
+from composio.utils.files import FileContent, dump_json
 from composio.utils.shared import generate_request_id
 
 
@@ -141,6 +149,11 @@ class ConnectionRequestModel(BaseModel):
                 connection_id=self.connectedAccountId,
             )
             if connection.status == "ACTIVE":
+                # The account is the latest one for the app from now on
+                connected_account_cache.invalidate(
+                    scope=client_scope(client),
+                    entity_id=connection.clientUniqueUserId,
+                )
                 return connection
             time.sleep(1)
 
@@ -264,6 +277,10 @@ class ConnectedAccounts(Collection[ConnectedAccountModel]):
                 },
             )
         )
+        connected_account_cache.invalidate(
+            scope=client_scope(self.client),
+            entity_id=entity_id,
+        )
         return ConnectionRequestModel(**response.json())
 
     def info(self, connection_id: str) -> ConnectionParams:
@@ -569,10 +586,10 @@ class TriggerSubscription(logging.WithLogger):
                 slug = slug.upper()
 
                 # Ensure the app exists
-                app_names = list(App.iter())
+                app_names = App.index()
                 if slug not in app_names:
                     error_msg = f"App {slug!r} does not exist."
-                    possible_values = difflib.get_close_matches(slug, app_names, n=1)
+                    possible_values = app_names.suggest(slug, n=1)
                     if possible_values:
                         (possible_value,) = possible_values
                         error_msg += f" Did you mean {possible_value!r}?"
@@ -609,12 +626,10 @@ class TriggerSubscription(logging.WithLogger):
                 slug = slug.upper()
 
                 # Ensure the trigger exists
-                trigger_names = list(Trigger.iter())
+                trigger_names = Trigger.index()
                 if slug not in trigger_names:
                     error_msg = f"Trigger {slug!r} does not exist."
-                    possible_values = difflib.get_close_matches(
-                        slug, trigger_names, n=1
-                    )
+                    possible_values = trigger_names.suggest(slug, n=1)
                     if possible_values:
                         (possible_value,) = possible_values
                         error_msg += f" Did you mean {possible_value!r}?"
@@ -1073,6 +1088,32 @@ class SearchResultTask(BaseModel):
     )
 
 
+@dataclass
+class _ActionsQuery:
+    """Normalised filters for listing actions."""
+
+    actions: t.List[Action]
+    "Remote actions to filter by."
+
+    apps: t.List[App]
+    "Remote apps to filter by."
+
+    tags: t.List[t.Any]
+    "Tags to filter by."
+
+    local_apps: t.List[App]
+    "Local apps to include."
+
+    local_actions: t.List[Action]
+    "Local actions to include."
+
+    url: t.Optional[str] = None
+    "Listing URL, `None` if only local items were requested."
+
+    list_all: bool = False
+    "If set `True` all items from the listing are returned as is."
+
+
 class Actions(Collection[ActionModel]):
     """Collection of composio actions.."""
 
@@ -1101,6 +1142,40 @@ class Actions(Collection[ActionModel]):
                         app
         :return: List of actions
         """
+        query = self._build_query(
+            actions=actions,
+            apps=apps,
+            tags=tags,
+            limit=limit,
+            use_case=use_case,
+            allow_all=allow_all,
+        )
+        if query.url is None:
+            return self._get_local_items(query=query)
+
+        response = self._raise_if_required(
+            response=self.client.http.get(url=query.url),
+        )
+        return self._filter_items(
+            query=query,
+            items=fastjson.validate_list(
+                data=response.content,
+                model=self.model,
+                key="items",
+            )
+            or [],
+        )
+
+    def _build_query(
+        self,
+        actions: t.Optional[t.Sequence[ActionType]] = None,
+        apps: t.Optional[t.Sequence[AppType]] = None,
+        tags: t.Optional[t.Sequence[TagType]] = None,
+        limit: t.Optional[int] = None,
+        use_case: t.Optional[str] = None,
+        allow_all: bool = False,
+    ) -> _ActionsQuery:
+        """Validate and normalise the filters for listing actions."""
 
         def is_action(obj):
             try:
@@ -1118,23 +1193,29 @@ class Actions(Collection[ActionModel]):
         apps = t.cast(t.List[App], [App(app) for app in apps or []])
         tags = t.cast(t.List[Tag], [Tag(tag) for tag in tags or []])
 
+        # Resolve the enum metadata in bulk before reading it below
+        Action.load_many(action for action in actions if isinstance(action, Action))
+        App.load_many(apps)
+
         # Filter out local apps and actions
         local_apps = [app for app in apps if app.is_local]
         local_actions = [action for action in actions if action.is_local]
         apps = [app for app in apps if not app.is_local]
         actions = [action for action in actions if not action.is_local]
+        query = _ActionsQuery(
+            actions=actions,
+            apps=apps,
+            tags=tags,
+            local_apps=local_apps,
+            local_actions=local_actions,
+        )
         only_local_apps = (
             len(apps) == 0
             and len(actions) == 0
             and (len(local_apps) > 0 or len(local_actions) > 0)
         )
         if only_local_apps:
-            local_items = self.client.local.get_action_schemas(
-                apps=local_apps,
-                actions=local_actions,
-                tags=tags,
-            )
-            return [self.model(**item) for item in local_items]
+            return query
 
         if len(actions) > 0 and len(apps) > 0:
             raise ComposioClientError(
@@ -1155,7 +1236,7 @@ class Actions(Collection[ActionModel]):
                 + help_msg(),
                 UserWarning,
             )
-            tags = ["important"]
+            query.tags = ["important"]
 
         if (
             len(actions) == 0
@@ -1165,12 +1246,9 @@ class Actions(Collection[ActionModel]):
             and len(local_apps) == 0
             and len(local_actions) == 0
         ):
-            response = self._raise_if_required(
-                response=self.client.http.get(
-                    url=str(self.endpoint),
-                )
-            )
-            return [self.model(**action) for action in response.json().get("items")]
+            query.url = str(self.endpoint)
+            query.list_all = True
+            return query
 
         queries: t.Dict[str, str] = {}
         if use_case is not None and use_case != "":
@@ -1187,24 +1265,35 @@ class Actions(Collection[ActionModel]):
         if limit is not None:
             queries["limit"] = str(limit)
 
-        response = self._raise_if_required(
-            response=self.client.http.get(
-                url=str(
-                    self.endpoint(
-                        queries=queries,
-                    )
-                )
-            )
+        query.url = str(self.endpoint(queries=queries))
+        return query
+
+    def _get_local_items(self, query: _ActionsQuery) -> t.List[ActionModel]:
+        """Get schemas for the local apps and actions in the query."""
+        local_items = self.client.local.get_action_schemas(
+            apps=query.local_apps,
+            actions=query.local_actions,
+            tags=query.tags,
         )
+        return [self.model(**item) for item in local_items]
 
-        response_json = response.json()
-        items = [self.model(**action) for action in response_json.get("items")]
-        if len(actions) > 0:
-            required = [t.cast(Action, action).slug for action in actions]
+    def _filter_items(
+        self,
+        query: _ActionsQuery,
+        items: t.List[ActionModel],
+    ) -> t.List[ActionModel]:
+        """Apply the client side filters to the listed actions."""
+        if query.list_all:
+            return items
+
+        if len(query.actions) > 0:
+            required = [action.slug for action in query.actions]
             items = [item for item in items if item.name in required]
 
-        if len(tags) > 0:
-            required_tags = [tag.app if isinstance(tag, Tag) else tag for tag in tags]
+        if len(query.tags) > 0:
+            required_tags = [
+                tag.app if isinstance(tag, Tag) else tag for tag in query.tags
+            ]
             only_important_tag = required_tags == ["important"]
             should_not_filter_using_tags = len(items) < 15 and only_important_tag
             if not should_not_filter_using_tags:
@@ -1216,11 +1305,8 @@ class Actions(Collection[ActionModel]):
                 if len(filtered_items) > 0 or not only_important_tag:
                     items = filtered_items
 
-        if len(local_apps) > 0 or len(local_actions) > 0:
-            local_items = self.client.local.get_action_schemas(
-                apps=local_apps, actions=local_actions, tags=tags
-            )
-            items = [self.model(**item) for item in local_items] + items
+        if len(query.local_apps) > 0 or len(query.local_actions) > 0:
+            items = self._get_local_items(query=query) + items
         return items
 
     def execute(
@@ -1247,13 +1333,139 @@ class Actions(Collection[ActionModel]):
         if action.is_local:
             return self.client.local.execute_action(action=action, request_data=params)
 
-        actions = self.get(actions=[action])
-        if len(actions) == 0:
+        action_model = self.get_schema(action=action)
+        with dump_json(
+            self._build_execute_request(
+                action=action,
+                action_model=action_model,
+                params=params,
+                entity_id=entity_id,
+                connected_account=connected_account,
+                session_id=session_id,
+                text=text,
+                auth=auth,
+            )
+        ) as body:
+            response = self.client.long_timeout_http.post(
+                url=str(self.endpoint / action.slug / "execute"),
+                data=body,
+                headers={"Content-Type": "application/json"},
+            )
+        # Parse the raw body, `Response.json` decodes it to text first which
+        # keeps another copy of file contents returned by the action in memory
+        return fastjson.loads(self._raise_if_required(response).content)
+
+    def get_schema(self, action: Action) -> ActionModel:
+        """
+        Get the schema for an action, using the process-wide schema cache.
+
+        A stale entry is revalidated using the ETag the server returned for
+        it, so an unchanged schema is not downloaded again.
+
+        :param action: Action to get the schema for.
+        :return: Action schema.
+        """
+        entry = action_schema_cache.get(
+            scope=client_scope(self.client), slug=action.slug
+        )
+        if entry is not None and entry.fresh:
+            return entry.model
+
+        response = self.client.http.get(
+            url=str(self.endpoint / action.slug),
+            headers=self._revalidation_headers(entry=entry),
+        )
+        return self._cache_schema(action=action, response=response)
+
+    @staticmethod
+    def _revalidation_headers(entry: t.Optional[CacheEntry]) -> t.Dict[str, str]:
+        if entry is None or entry.etag is None:
+            return {}
+        return {"If-None-Match": entry.etag}
+
+    def _cache_schema(
+        self,
+        action: Action,
+        response: t.Union[requests.Response, AsyncResponse],
+    ) -> ActionModel:
+        """Store the schema from a single action response in the cache."""
+        if response.status_code == 304:
+            entry = action_schema_cache.revalidated(
+                scope=client_scope(self.client),
+                slug=action.slug,
+            )
+            if entry is not None:
+                return entry.model
+
+        if response.status_code == 404:
             raise ComposioClientError(f"Action {action} not found")
 
-        (action_model,) = actions
-        action_req_schema = action_model.parameters.properties
-        modified_params: t.Dict[str, t.Union[str, t.Dict[str, str]]] = {}
+        data = self._raise_if_required(response).json()
+        if isinstance(data, list):
+            if len(data) == 0:
+                raise ComposioClientError(f"Action {action} not found")
+            data, *_ = data
+
+        return action_schema_cache.set(
+            scope=client_scope(self.client),
+            slug=action.slug,
+            model=self.model(**data),
+            etag=response.headers.get("ETag"),
+        ).model
+
+    def _build_execute_request(
+        self,
+        action: Action,
+        action_model: ActionModel,
+        params: t.Dict,
+        entity_id: str = "default",
+        connected_account: t.Optional[str] = None,
+        session_id: t.Optional[str] = None,
+        text: t.Optional[str] = None,
+        auth: t.Optional[CustomAuthObject] = None,
+    ) -> t.Dict:
+        """Build the request body for executing a remote action."""
+        modified_params = self._process_file_params(
+            action_req_schema=action_model.parameters.properties,
+            params=params,
+        )
+        if action.no_auth:
+            return {
+                "appName": action.app,
+                "input": modified_params,
+                "text": text,
+                "sessionInfo": {
+                    "sessionId": session_id,
+                },
+            }
+
+        if connected_account is None and auth is None:
+            raise ComposioClientError(
+                "`connected_account` cannot be `None` when executing "
+                "an app which requires authentication"
+            )
+
+        return {
+            "connectedAccountId": connected_account,
+            "entityId": entity_id,
+            "appName": action.app,
+            "input": modified_params,
+            "text": text,
+            "authConfig": self._serialize_auth(auth=auth),
+        }
+
+    @staticmethod
+    def _process_file_params(
+        action_req_schema: t.Dict[str, t.Any],
+        params: t.Dict,
+    ) -> t.Dict[str, t.Union[str, FileContent, t.Dict[str, t.Any]]]:
+        """
+        Replace file paths with file contents for file parameters.
+
+        The contents are read when the request body is written, see
+        `composio.utils.files.dump_json`.
+        """
+        modified_params: t.Dict[str, t.Union[str, FileContent, t.Dict[str, t.Any]]] = {}
         for param, value in params.items():
             request_param_schema = action_req_schema.get(param)
             if request_param_schema is None:
@@ -1265,63 +1477,19 @@ class Actions(Collection[ActionModel]):
             file_uploadable = _check_file_uploadable(request_param_schema)
 
             if file_readable and isinstance(value, str) and os.path.isfile(value):
-                with open(value, "rb") as file:
-                    file_content = file.read()
-                    try:
-                        modified_params[param] = file_content.decode("utf-8")
-                    except UnicodeDecodeError:
-                        # If decoding fails, treat as binary and encode in base64
-                        modified_params[param] = base64.b64encode(file_content).decode(
-                            "utf-8"
-                        )
+                # Sent as text if the file is valid UTF-8, base64 otherwise
+                modified_params[param] = FileContent(path=value)
             elif file_uploadable and isinstance(value, str):
                 if not os.path.isfile(value):
                     raise ValueError(f"Attachment File with path `{value}` not found.")
 
-                with open(value, "rb") as file:
-                    file_content = file.read()
-
                 modified_params[param] = {
                     "name": os.path.basename(value),
-                    "content": base64.b64encode(file_content).decode("utf-8"),
+                    "content": FileContent(path=value, binary=True),
                 }
             else:
                 modified_params[param] = value
-
-        if action.no_auth:
-            return self._raise_if_required(
-                self.client.long_timeout_http.post(
-                    url=str(self.endpoint / action.slug / "execute"),
-                    json={
-                        "appName": action.app,
-                        "input": modified_params,
-                        "text": text,
-                        "sessionInfo": {
-                            "sessionId": session_id,
-                        },
-                    },
-                )
-            ).json()
-
-        if connected_account is None and auth is None:
-            raise ComposioClientError(
-                "`connected_account` cannot be `None` when executing "
-                "an app which requires authentication"
-            )
-
-        return self._raise_if_required(
-            self.client.long_timeout_http.post(
-                url=str(self.endpoint / action.slug / "execute"),
-                json={
-                    "connectedAccountId": connected_account,
-                    "entityId": entity_id,
-                    "appName": action.app,
-                    "input": modified_params,
-                    "text": text,
-                    "authConfig": self._serialize_auth(auth=auth),
-                },
-            )
-        ).json()
+        return modified_params
 
     def request(
         self,
@@ -2,11 +2,16 @@ import typing as t
 import warnings
 
 from composio.client.enums.base import ActionData, replacement_action_name
-from composio.client.enums.enum import Enum, EnumGenerator
+from composio.client.enums.enum import Enum, EnumGenerator, map_concurrently
 from composio.exceptions import ComposioSDKError
 
 
+if t.TYPE_CHECKING:
+    from composio.client import Composio
+
+
 _ACTION_CACHE: t.Dict[str, "Action"] = {}
+_NO_AUTH_CACHE: t.Dict[str, bool] = {}
 
 
 class Action(Enum[ActionData], metaclass=EnumGenerator):
@@ -33,6 +38,9 @@ class Action(Enum[ActionData], metaclass=EnumGenerator):
         from composio.tools.base.abs import (  # pylint: disable=import-outside-toplevel
             action_registry,
         )
+        from composio.tools.local import (  # pylint: disable=import-outside-toplevel
+            get_manifest,
+        )
 
         for gid, actions in action_registry.items():
             if self.slug in actions:
@@ -44,17 +52,81 @@ class Action(Enum[ActionData], metaclass=EnumGenerator):
                     no_auth=action.no_auth,
                     is_local=gid in ("runtime", "local"),
                     is_runtime=gid == "runtime",
-                    path=self.storage_path,
                 )
                 return self._data
 
+        manifest = get_manifest()
+        tool = manifest["actions"].get(self.slug)
+        if tool is not None:
+            entry = manifest["tools"][tool]["actions"][self.slug]
+            self._data = ActionData(
+                name=entry["name"],
+                app=manifest["tools"][tool]["name"],
+                tags=entry["tags"],
+                no_auth=entry["no_auth"],
+                is_local=True,
+                is_runtime=False,
+            )
+            return self._data
+
         return None
 
     def fetch_and_cache(self) -> t.Optional[ActionData]:
+        return self.fetch_many([self.slug]).get(self.slug)
+
+    @classmethod
+    def fetch_many(cls, slugs: t.Sequence[str]) -> t.Dict[str, ActionData]:
+        """
+        Fetch the metadata for multiple actions from the API.
+
+        The actions are fetched concurrently, followed by the `no_auth` flag
+        of the apps they belong to. The flag is memoized, so every app is
+        requested at most once per process.
+        """
         from composio.client import Composio  # pylint: disable=import-outside-toplevel
 
         client = Composio.get_latest()
-        request = client.http.get(url=str(client.actions.endpoint / self.slug))
+        responses = map_concurrently(
+            lambda slug: cls._fetch_action(client=client, slug=slug),
+            slugs,
+        )
+        apps = list(
+            {
+                response["appName"]
+                for response in responses
+                if response is not None and response["appName"] not in _NO_AUTH_CACHE
+            }
+        )
+        for app, no_auth in zip(
+            apps,
+            map_concurrently(
+                lambda app: cls._fetch_no_auth(client=client, app=app),
+                apps,
+            ),
+        ):
+            _NO_AUTH_CACHE[app] = no_auth
+
+        return {
+            slug: ActionData(  # type: ignore
+                name=response["name"],
+                app=response["appName"],
+                tags=response["tags"],
+                no_auth=_NO_AUTH_CACHE[response["appName"]],
+                is_local=False,
+                is_runtime=False,
+                shell=False,
+                replaced_by=replacement_action_name(
+                    response["description"], response["appName"]
+                ),
+            )
+            for slug, response in zip(slugs, responses)
+            if response is not None
+        }
+
+    @staticmethod
+    def _fetch_action(client: "Composio", slug: str) -> t.Optional[t.Dict]:
+        """Fetch the raw action metadata, `None` if it's not a valid action."""
+        request = client.http.get(url=str(client.actions.endpoint / slug))
         response = request.json()
         if isinstance(response, list):
             response, *_ = response
@@ -62,7 +134,7 @@ class Action(Enum[ActionData], metaclass=EnumGenerator):
         if request.status_code == 404 or "Not Found" in response.get("message", ""):
             raise ComposioSDKError(
                 message=(
-                    f"No metadata found for enum `{self.slug}`, "
+                    f"No metadata found for enum `{slug}`, "
                     "You might be trying to use an app or action "
                     "that is deprecated."
                 )
@@ -71,25 +143,13 @@ class Action(Enum[ActionData], metaclass=EnumGenerator):
         # TOFIX: Return proper error code when of item is not found
         if "appName" not in response:
             return None
+        return response
 
-        replaced_by = replacement_action_name(
-            response["description"], response["appName"]
-        )
-        return ActionData(  # type: ignore
-            name=response["name"],
-            app=response["appName"],
-            tags=response["tags"],
-            no_auth=(
-                client.http.get(url=str(client.apps.endpoint / response["appName"]))
-                .json()
-                .get("no_auth", False)
-            ),
-            is_local=False,
-            is_runtime=False,
-            shell=False,
-            path=self.storage_path,
-            replaced_by=replaced_by,
-        )
+    @staticmethod
+    def _fetch_no_auth(client: "Composio", app: str) -> bool:
+        """Fetch whether the app can be used without authentication."""
+        response = client.http.get(url=str(client.apps.endpoint / app)).json()
+        return response.get("no_auth", False)
 
     @property
     def name(self) -> str:
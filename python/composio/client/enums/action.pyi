@@ -2,10 +2,13 @@ import typing as t
 import warnings
 
 from composio.client.enums.base import ActionData, replacement_action_name
-from composio.client.enums.enum import Enum, EnumGenerator
+from composio.client.enums.enum import Enum, EnumGenerator, map_concurrently
 from composio.exceptions import ComposioSDKError
 
+if t.TYPE_CHECKING:
+    from composio.client import Composio
 _ACTION_CACHE: t.Dict[str, "Action"] = {}
+_NO_AUTH_CACHE: t.Dict[str, bool] = {}
 
 class Action(Enum[ActionData], metaclass=EnumGenerator):
     cache_folder = "actions"
@@ -15,6 +18,12 @@ class Action(Enum[ActionData], metaclass=EnumGenerator):
     def load(self) -> ActionData: ...
     def load_from_runtime(self) -> t.Optional[ActionData]: ...
     def fetch_and_cache(self) -> t.Optional[ActionData]: ...
+    @classmethod
+    def fetch_many(cls, slugs: t.Sequence[str]) -> t.Dict[str, ActionData]: ...
+    @staticmethod
+    def _fetch_action(client: "Composio", slug: str) -> t.Optional[t.Dict]: ...
+    @staticmethod
+    def _fetch_no_auth(client: "Composio", app: str) -> bool: ...
     @property
     def name(self) -> str: ...
     @property
@@ -15,25 +15,27 @@ class App(Enum[AppData], metaclass=EnumGenerator):
     storage = AppData
 
     def load_from_runtime(self) -> t.Optional[AppData]:
-        # re-load local tools, and check if it's a runtime app
+        # check if it's a runtime app, or a local app from the manifest
         from composio.tools.base.abs import (  # pylint: disable=import-outside-toplevel
             tool_registry,
         )
         from composio.tools.local import (  # pylint: disable=import-outside-toplevel
-            load_local_tools,
+            get_manifest,
         )
 
-        load_local_tools()
-
         for gid, tools in tool_registry.items():
             if self.slug in tools:
                 self._data = AppData(
                     name=tools[self.slug].name,
                     is_local=gid in ("runtime", "local"),
-                    path=self.storage_path,
                 )
                 return self._data
 
+        tool = get_manifest()["tools"].get(self.slug)
+        if tool is not None:
+            self._data = AppData(name=tool["name"], is_local=True)
+            return self._data
+
         return None
 
     def fetch_and_cache(self) -> t.Optional[AppData]:
@@ -47,7 +49,6 @@ class App(Enum[AppData], metaclass=EnumGenerator):
 
         return AppData(
             name=response["name"],
-            path=self.storage_path,
             is_local=False,
         )
 
@@ -67,9 +68,6 @@ class App(Enum[AppData], metaclass=EnumGenerator):
         :return: Iterator object which yields `Action`
         """
         tags = tags or []
-        for action in Action.all():
-            if not action.slug.startswith(f"{self.slug}_"):
-                continue
-
+        for action in Action.all(prefix=f"{self.slug}_"):
             if len(tags) == 0 or any(tag in action.tags for tag in tags):
                 yield action
@@ -9,11 +9,15 @@ from composio.constants import LOCAL_CACHE_DIRECTORY
 from composio.exceptions import ComposioSDKError
 from composio.storage.base import LocalStorage
 
+from .index import NameIndex
+
 
 _runtime_actions: t.Dict[str, "ActionData"] = {}
 
 EntityType = t.TypeVar("EntityType", bound=LocalStorage)
 
+# Legacy one-file-per-enum cache folders, enums are kept in the enum store now
+# and these are only read to migrate existing caches.
 TAGS_CACHE = LOCAL_CACHE_DIRECTORY / "tags"
 APPS_CACHE = LOCAL_CACHE_DIRECTORY / "apps"
 ACTIONS_CACHE = LOCAL_CACHE_DIRECTORY / "actions"
@@ -23,9 +27,17 @@ TRIGGERS_CACHE = LOCAL_CACHE_DIRECTORY / "triggers"
 class EnumStringNotFound(ComposioSDKError):
     """Raise when user provides invalid enum string."""
 
-    def __init__(self, value: str, enum: str, possible_values: t.List[str]) -> None:
+    def __init__(
+        self,
+        value: str,
+        enum: str,
+        possible_values: t.Union[t.List[str], NameIndex],
+    ) -> None:
         error_message = f"Invalid value `{value}` for enum class `{enum}`"
-        matches = difflib.get_close_matches(value, possible_values, n=1)
+        if isinstance(possible_values, NameIndex):
+            matches = possible_values.suggest(value, n=1)
+        else:
+            matches = difflib.get_close_matches(value, possible_values, n=1)
         if matches:
             (match,) = matches
             error_message += f". Did you mean {match!r}?"
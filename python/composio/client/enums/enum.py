@@ -1,23 +1,50 @@
 import os
+import threading
 import typing as t
-from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 
 import typing_extensions as te
 
-from composio.constants import LOCAL_CACHE_DIRECTORY
 from composio.exceptions import ComposioSDKError
 from composio.storage.base import LocalStorage
 
-from .base import ActionData, EnumStringNotFound, SentinalObject
+from .base import EnumStringNotFound, SentinalObject
+from .index import NameIndex
+from .store import Record, get_enum_store
 
 
 DataT = t.TypeVar("DataT", bound=LocalStorage)
+ItemT = t.TypeVar("ItemT")
+ResultT = t.TypeVar("ResultT")
 
 
 NO_REMOTE_ENUM_FETCHING = (
     os.environ.get("COMPOSIO_NO_REMOTE_ENUM_FETCHING", "false") != "false"
 )
 
+MAX_CONCURRENT_FETCHES = 8
+"""
+Maximum number of concurrent requests made to fetch missing enum metadata.
+"""
+
+_name_indexes: t.Dict[str, t.Tuple[t.Tuple[int, int], NameIndex]] = {}
+_name_indexes_lock = threading.Lock()
+
+
+def map_concurrently(
+    func: t.Callable[[ItemT], ResultT],
+    items: t.Sequence[ItemT],
+) -> t.List[ResultT]:
+    """Call `func` on the items using a thread pool, results keep the order."""
+    if len(items) < 2:
+        return [func(item) for item in items]
+
+    with ThreadPoolExecutor(
+        max_workers=min(MAX_CONCURRENT_FETCHES, len(items)),
+        thread_name_prefix="composio-enums",
+    ) as executor:
+        return list(executor.map(func, items))
+
 
 class Enum(t.Generic[DataT]):
     cache_folder: str
@@ -90,72 +117,130 @@ class Enum(t.Generic[DataT]):
         return False
 
     @classmethod
-    def iter(cls) -> t.Iterator[str]:
-        """Yield the enum names as strings."""
-        # TODO: fetch trigger names from dedicated endpoint in the future
-        path = LOCAL_CACHE_DIRECTORY / cls.cache_folder
+    def _ensure_cache(cls) -> bool:
+        """Make sure the local cache is populated, `False` if it's empty."""
+        store = get_enum_store()
+        if store.count(cls.cache_folder) > 0:
+            return True
+
         # If we try to fetch Actions.iter() with local caching disabled
         # for example, we'd get here.
-        if not path.exists():
-            # pylint: disable=import-outside-toplevel
-            from composio.client import Composio
+        # pylint: disable=import-outside-toplevel
+        from composio.client import Composio
+
+        # pylint: disable=import-outside-toplevel
+        from composio.client.utils import check_cache_refresh
+
+        check_cache_refresh(Composio.get_latest(), background=False)
+        return store.count(cls.cache_folder) > 0
+
+    @classmethod
+    def iter(cls, prefix: str = "") -> t.Iterator[str]:
+        """
+        Yield the enum names as strings.
 
-            # pylint: disable=import-outside-toplevel
-            from composio.client.utils import check_cache_refresh
+        :param prefix: Only yield the names starting with this prefix
+        """
+        # TODO: fetch trigger names from dedicated endpoint in the future
+        if not cls._ensure_cache():
+            return
 
-            check_cache_refresh(Composio.get_latest())
-            if not path.exists():
-                return
+        yield from get_enum_store().slugs(cls.cache_folder, prefix=prefix)
 
-        yield from os.listdir(path)
+    @classmethod
+    def index(cls) -> NameIndex:
+        """
+        Get the index of the enum names.
+
+        The index is built once and rebuilt only when the local cache changes,
+        it's used for membership checks and "did you mean" suggestions.
+        """
+        version = get_enum_store().version()
+        with _name_indexes_lock:
+            cached = _name_indexes.get(cls.cache_folder)
+            if cached is not None and cached[0] == version:
+                return cached[1]
+
+            index = NameIndex(cls.iter())
+            _name_indexes[cls.cache_folder] = (version, index)
+            return index
 
     @classmethod
-    def all(cls) -> t.Iterator[te.Self]:
-        """Iterate over available object."""
-        for app_name in cls.iter():
-            yield cls(app_name)
+    def all(cls, prefix: str = "") -> t.Iterator[te.Self]:
+        """
+        Iterate over available object.
 
-    @property
-    def storage_path(self) -> Path:
-        return LOCAL_CACHE_DIRECTORY / self.cache_folder / self.slug
+        The records are read in bulk, so the yielded objects are loaded
+        already.
 
-    def load(self) -> DataT:
-        if self._data is not None:
-            return self._data
+        :param prefix: Only yield the objects with names starting with this prefix
+        """
+        if not cls._ensure_cache():
+            return
 
-        if self.storage_path.exists():
-            data = self.storage.load(self.storage_path)
-            # HACK: if 'replaced_by' field is not present, delete this cached file
-            # as it is outdated.
-            if isinstance(data, ActionData):
-                if hasattr(data, "replaced_by"):
-                    self._data = data  # type: ignore
-                    return self._data  # type: ignore
+        for slug, record in get_enum_store().records(cls.cache_folder, prefix=prefix):
+            enum = cls(slug)
+            if enum._data is None:
+                enum._data = cls.storage(**record)
+            yield enum
 
-                self.storage_path.unlink()
+    @classmethod
+    def to_record(cls, data: DataT) -> Record:
+        """Convert enum data to a record for the enum store."""
+        return data.model_dump(exclude={"path"})
 
-            self._data = data
-            return self._data
+    @classmethod
+    def load_many(
+        cls,
+        values: t.Iterable[t.Union[str, te.Self]],
+    ) -> t.List[te.Self]:
+        """
+        Load the data for multiple enums at once.
+
+        Records are read from the local store in a single query and the ones
+        missing locally are fetched concurrently and stored in a single write.
+
+        :param values: Enum objects or names
+        :return: List of loaded enum objects
+        """
+        enums = [cls(value) for value in values]
+        pending = {enum.slug: enum for enum in enums if enum._data is None}
+        if not pending:
+            return enums
+
+        store = get_enum_store()
+        for slug, record in store.get_many(cls.cache_folder, pending).items():
+            pending.pop(slug)._data = cls.storage(**record)
 
         # Try to fetch from runtime
-        runtime_data = self.load_from_runtime()
-        if runtime_data is not None:
-            self._data = runtime_data
-            return self._data
+        for slug, enum in list(pending.items()):
+            runtime_data = enum.load_from_runtime()
+            if runtime_data is not None:
+                enum._data = runtime_data
+                pending.pop(slug)
 
         # Try to fetch from API, and cache it locally
-        if not NO_REMOTE_ENUM_FETCHING:
-            remote_data = self.fetch_and_cache()
-            if remote_data is not None:
-                remote_data.store()
-                self._data = remote_data
-                return self._data
-
-        raise EnumStringNotFound(
-            value=self.slug,
-            enum=self.__class__.__name__,
-            possible_values=list(self.iter()),
-        )
+        if pending and not NO_REMOTE_ENUM_FETCHING:
+            fetched = cls.fetch_many(list(pending))
+            store.put_many(
+                cls.cache_folder,
+                records=[(slug, cls.to_record(data)) for slug, data in fetched.items()],
+            )
+            for slug, data in fetched.items():
+                pending.pop(slug)._data = data
+
+        if pending:
+            raise EnumStringNotFound(
+                value=next(iter(pending)),
+                enum=cls.__name__,
+                possible_values=cls.index(),
+            )
+        return enums
+
+    def load(self) -> DataT:
+        if self._data is None:
+            self.load_many([self])
+        return t.cast(DataT, self._data)
 
     def load_from_runtime(self) -> t.Optional[DataT]:
         raise NotImplementedError
@@ -163,6 +248,18 @@ class Enum(t.Generic[DataT]):
     def fetch_and_cache(self) -> t.Optional[DataT]:
         raise NotImplementedError
 
+    @classmethod
+    def fetch_many(cls, slugs: t.Sequence[str]) -> t.Dict[str, DataT]:
+        """
+        Fetch the metadata for multiple enums from the API.
+
+        :param slugs: Enum slugs
+        :return: Mapping of slugs to data, slugs which were not found are
+            left out
+        """
+        results = map_concurrently(lambda slug: cls(slug).fetch_and_cache(), slugs)
+        return {slug: data for slug, data in zip(slugs, results) if data is not None}
+
 
 class EnumGenerator(type):
     def __getattr__(cls, name: str):
@@ -0,0 +1,82 @@
+"""
+In-memory index of enum names.
+
+Membership checks are served from a set and "did you mean" suggestions from
+a trigram index, so a typo doesn't cost a scan over every cached name.
+"""
+
+import difflib
+import threading
+import typing as t
+from collections import Counter
+
+
+MAX_CANDIDATES = 32
+"""
+Number of names sharing the most trigrams with a value which are ranked
+with `difflib` when building suggestions.
+"""
+
+
+def _trigrams(value: str) -> t.Set[str]:
+    """Get the trigrams of a value, padded so short values have some."""
+    padded = f"  {value} "
+    return {"".join(chars) for chars in zip(padded, padded[1:], padded[2:])}
+
+
+class NameIndex:
+    """Index of enum names."""
+
+    def __init__(self, names: t.Iterable[str]) -> None:
+        """
+        Initialize name index.
+
+        :param names: Enum names
+        """
+        self.names = list(dict.fromkeys(names))
+        self._lookup = frozenset(self.names)
+        self._postings: t.Optional[t.Dict[str, t.List[int]]] = None
+        self._lock = threading.Lock()
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._lookup
+
+    def __iter__(self) -> t.Iterator[str]:
+        return iter(self.names)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    @property
+    def postings(self) -> t.Dict[str, t.List[int]]:
+        """Positions of the names containing each trigram, built on first use."""
+        with self._lock:
+            if self._postings is None:
+                postings: t.Dict[str, t.List[int]] = {}
+                for position, name in enumerate(self.names):
+                    for trigram in _trigrams(name):
+                        postings.setdefault(trigram, []).append(position)
+                self._postings = postings
+            return self._postings
+
+    def suggest(self, value: str, n: int = 1, cutoff: float = 0.6) -> t.List[str]:
+        """
+        Get the names closest to the given value.
+
+        Names sharing the most trigrams with the value are ranked the same
+        way `difflib.get_close_matches` ranks them.
+
+        :param value: Value to find suggestions for
+        :param n: Maximum number of suggestions
+        :param cutoff: Minimum similarity score, between 0 and 1
+        :return: Suggestions, best match first
+        """
+        postings = self.postings
+        shared: t.Counter[int] = Counter()
+        for trigram in _trigrams(value):
+            shared.update(postings.get(trigram, ()))
+
+        candidates = [
+            self.names[position] for position, _ in shared.most_common(MAX_CANDIDATES)
+        ]
+        return difflib.get_close_matches(value, candidates, n=n, cutoff=cutoff)
@@ -0,0 +1,427 @@
+"""
+Indexed local store for enum metadata.
+
+All of the enum records live in a single SQLite database, keyed by the enum
+kind (`actions`, `apps`, `tags` or `triggers`) and slug. This replaces the
+old layout of one JSON file per enum, which is migrated automatically the
+first time the store is opened.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import typing as t
+import weakref
+from pathlib import Path
+
+from composio.constants import LOCAL_CACHE_DIRECTORY
+from composio.utils import fastjson, logging
+
+
+ENUM_STORE_PATH = LOCAL_CACHE_DIRECTORY / "enums.db"
+"""
+Path to the enum store database.
+"""
+
+SCHEMA_VERSION = 1
+"""
+Version of the database schema, stored as the `user_version` pragma.
+"""
+
+KINDS = ("actions", "apps", "tags", "triggers")
+"""
+Enum kinds kept in the store, named after the legacy cache folders.
+"""
+
+Record = t.Dict[str, t.Any]
+
+_MIGRATED_KEY = "migrated_from_directories"
+
+_MAX_VARIABLES = 900
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS enums (
+    kind TEXT NOT NULL,
+    slug TEXT NOT NULL,
+    data TEXT NOT NULL,
+    PRIMARY KEY (kind, slug)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+
+def meta_key(kind: str, name: str) -> str:
+    """Key for metadata stored along with the records of a kind."""
+    return f"sync:{kind}:{name}"
+
+
+def _dumps(record: Record) -> str:
+    """Encode a record, keys are sorted so equal records encode the same."""
+    return json.dumps(record, sort_keys=True)
+
+
+def _prefix_end(prefix: str) -> str:
+    """Smallest string greater than every string starting with `prefix`."""
+    return prefix[:-1] + chr(ord(prefix[-1]) + 1)
+
+
+def _reset_after_fork(store: "EnumStore") -> None:
+    """Make forked children drop the state of the store, see `_after_fork`."""
+    if not hasattr(os, "register_at_fork"):  # Windows, which can't fork
+        return
+
+    ref = weakref.ref(store)
+
+    def _after_fork() -> None:
+        store = ref()
+        if store is not None:
+            store._after_fork()  # pylint: disable=protected-access
+
+    os.register_at_fork(after_in_child=_after_fork)
+
+
+class EnumStore(logging.WithLogger):
+    """
+    SQLite backed store for enum records.
+
+    The connection is opened lazily and shared between threads, access is
+    serialised with a lock. SQLite connections must not be used across a
+    `fork()`, so a forked child drops the inherited connection and opens its
+    own. SQLite's file locking keeps concurrent processes consistent, the
+    default rollback journal is used since WAL mode does not work on network
+    filesystems.
+    """
+
+    def __init__(self, path: Path, legacy_directory: t.Optional[Path] = None) -> None:
+        """
+        Initialize enum store.
+
+        :param path: Path to the database file
+        :param legacy_directory: Directory with the per-enum cache folders to
+            migrate records from
+        """
+        logging.WithLogger.__init__(self)
+        self.path = path
+        self.legacy_directory = legacy_directory
+        self._lock = threading.RLock()
+        self._connection: t.Optional[sqlite3.Connection] = None
+        self._writes = 0
+        _reset_after_fork(self)
+
+    def _after_fork(self) -> None:
+        """
+        Drop the state inherited from the parent process.
+
+        The inherited connection is abandoned rather than closed, closing it
+        could release the parent's SQLite locks. The lock is replaced since
+        another thread of the parent may have been holding it.
+        """
+        self._lock = threading.RLock()
+        self._connection = None
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        """Database connection, the schema is created and migrated on first use."""
+        with self._lock:
+            if self._connection is None:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                connection = sqlite3.connect(
+                    self.path,
+                    timeout=30.0,
+                    check_same_thread=False,
+                )
+                with connection:
+                    connection.executescript(_SCHEMA)
+                    connection.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+                self._connection = connection
+                self._migrate()
+            return self._connection
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+            self._connection = None
+
+    def _query(self, sql: str, *params: t.Any) -> t.List[t.Tuple]:
+        with self._lock:
+            return self.connection.execute(sql, params).fetchall()
+
+    def version(self) -> t.Tuple[int, int]:
+        """
+        Get a value which changes whenever the stored data changes.
+
+        Writes made through this store and commits made by other processes,
+        as reported by SQLite's `data_version` pragma, are both accounted for.
+        """
+        with self._lock:
+            ((data_version,),) = self.connection.execute(
+                "PRAGMA data_version"
+            ).fetchall()
+            return self._writes, data_version
+
+    def get(self, kind: str, slug: str) -> t.Optional[Record]:
+        """
+        Get an enum record.
+
+        :param kind: Enum kind
+        :param slug: Enum slug
+        :return: Record, `None` if it's not in the store
+        """
+        rows = self._query(
+            "SELECT data FROM enums WHERE kind = ? AND slug = ?",
+            kind,
+            slug,
+        )
+        if not rows:
+            return None
+        return fastjson.loads(rows[0][0])
+
+    def get_many(self, kind: str, slugs: t.Iterable[str]) -> t.Dict[str, Record]:
+        """
+        Get enum records in bulk.
+
+        :param kind: Enum kind
+        :param slugs: Enum slugs
+        :return: Mapping of slugs to records, missing slugs are left out
+        """
+        slugs = list(dict.fromkeys(slugs))
+        records = {}
+        # Stay below SQLite's default limit on the number of bound variables
+        for start in range(0, len(slugs), _MAX_VARIABLES):
+            stop = start + _MAX_VARIABLES
+            chunk = slugs[start:stop]
+            rows = self._query(
+                "SELECT slug, data FROM enums WHERE kind = ? "
+                f"AND slug IN ({', '.join('?' * len(chunk))})",
+                kind,
+                *chunk,
+            )
+            records.update((slug, fastjson.loads(data)) for slug, data in rows)
+        return records
+
+    def _select(
+        self,
+        columns: str,
+        kind: str,
+        prefix: str,
+        limit: t.Optional[int] = None,
+    ) -> t.List[t.Tuple]:
+        sql = f"SELECT {columns} FROM enums WHERE kind = ?"
+        params: t.List[t.Any] = [kind]
+        if prefix:
+            sql += " AND slug >= ? AND slug < ?"
+            params += [prefix, _prefix_end(prefix)]
+        sql += " ORDER BY slug"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        return self._query(sql, *params)
+
+    def slugs(self, kind: str, prefix: str = "") -> t.List[str]:
+        """
+        Get the sorted slugs of the stored enums.
+
+        :param kind: Enum kind
+        :param prefix: Only include slugs starting with this prefix
+        """
+        return [slug for (slug,) in self._select("slug", kind=kind, prefix=prefix)]
+
+    def records(
+        self,
+        kind: str,
+        prefix: str = "",
+        limit: t.Optional[int] = None,
+    ) -> t.List[t.Tuple[str, Record]]:
+        """
+        Get the stored records, sorted by slug.
+
+        :param kind: Enum kind
+        :param prefix: Only include slugs starting with this prefix
+        :param limit: Maximum number of records to return
+        """
+        rows = self._select("slug, data", kind=kind, prefix=prefix, limit=limit)
+        return [(slug, fastjson.loads(data)) for slug, data in rows]
+
+    def count(self, kind: str) -> int:
+        """Get the number of stored records of the given kind."""
+        ((count,),) = self._query("SELECT COUNT(*) FROM enums WHERE kind = ?", kind)
+        return count
+
+    def put(self, kind: str, slug: str, record: Record) -> None:
+        """Store an enum record, replacing any existing one."""
+        self.put_many(kind=kind, records=[(slug, record)])
+
+    def put_many(
+        self,
+        kind: str,
+        records: t.Iterable[t.Tuple[str, Record]],
+        replace: bool = False,
+    ) -> None:
+        """
+        Store enum records in a single transaction.
+
+        :param kind: Enum kind
+        :param records: Pairs of slug and record
+        :param replace: Remove all of the existing records of this kind first
+        """
+        rows = [(kind, slug, _dumps(record)) for slug, record in records]
+        with self._lock, self.connection as connection:
+            self._writes += 1
+            if replace:
+                connection.execute("DELETE FROM enums WHERE kind = ?", (kind,))
+            connection.executemany(
+                "INSERT OR REPLACE INTO enums (kind, slug, data) VALUES (?, ?, ?)",
+                rows,
+            )
+
+    def sync(
+        self,
+        kind: str,
+        records: t.Dict[str, Record],
+        meta: t.Optional[t.Dict[str, str]] = None,
+    ) -> t.Tuple[int, int]:
+        """
+        Make the stored records of a kind match the given ones.
+
+        Only new and changed records are written and records which are not
+        given anymore are removed. The changes and the metadata are written in
+        a single transaction, so readers never see a partial update.
+
+        :param kind: Enum kind
+        :param records: Complete mapping of slugs to records
+        :param meta: Metadata to store along with the records
+        :return: Number of written and removed records
+        """
+        encoded = {slug: _dumps(record) for slug, record in records.items()}
+        with self._lock, self.connection as connection:
+            self._writes += 1
+            existing = dict(
+                connection.execute(
+                    "SELECT slug, data FROM enums WHERE kind = ?", (kind,)
+                ).fetchall()
+            )
+            changed = [
+                (kind, slug, data)
+                for slug, data in encoded.items()
+                if existing.get(slug) != data
+            ]
+            removed = [(kind, slug) for slug in existing if slug not in encoded]
+            connection.executemany(
+                "INSERT OR REPLACE INTO enums (kind, slug, data) VALUES (?, ?, ?)",
+                changed,
+            )
+            connection.executemany(
+                "DELETE FROM enums WHERE kind = ? AND slug = ?",
+                removed,
+            )
+            connection.executemany(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+                list((meta or {}).items()),
+            )
+        return len(changed), len(removed)
+
+    def get_meta(self, key: str) -> t.Optional[str]:
+        """Get a metadata value, `None` if it's not set."""
+        rows = self._query("SELECT value FROM meta WHERE key = ?", key)
+        return rows[0][0] if rows else None
+
+    def set_meta(self, key: str, value: t.Optional[str]) -> None:
+        """Set a metadata value, `None` removes it."""
+        with self._lock, self.connection as connection:
+            self._writes += 1
+            if value is None:
+                connection.execute("DELETE FROM meta WHERE key = ?", (key,))
+            else:
+                connection.execute(
+                    "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+                    (key, value),
+                )
+
+    def delete(self, kind: str, slug: str) -> None:
+        """Remove an enum record."""
+        with self._lock, self.connection as connection:
+            self._writes += 1
+            connection.execute(
+                "DELETE FROM enums WHERE kind = ? AND slug = ?",
+                (kind, slug),
+            )
+
+    def clear(self, kind: t.Optional[str] = None) -> None:
+        """
+        Remove all of the records, or only the ones of the given kind.
+
+        The metadata stored along with the records is removed too.
+        """
+        with self._lock, self.connection as connection:
+            self._writes += 1
+            if kind is None:
+                connection.execute("DELETE FROM enums")
+                connection.execute(
+                    "DELETE FROM meta WHERE key LIKE ?", (meta_key("%", "%"),)
+                )
+            else:
+                connection.execute("DELETE FROM enums WHERE kind = ?", (kind,))
+                connection.execute(
+                    "DELETE FROM meta WHERE key LIKE ?", (meta_key(kind, "%"),)
+                )
+
+    def _migrate(self) -> None:
+        """Import the records from the legacy one-file-per-enum cache folders."""
+        if self.legacy_directory is None:
+            return
+
+        connection = t.cast(sqlite3.Connection, self._connection)
+        migrated = connection.execute(
+            "SELECT value FROM meta WHERE key = ?", (_MIGRATED_KEY,)
+        ).fetchall()
+        if migrated:
+            return
+
+        for kind in KINDS:
+            folder = self.legacy_directory / kind
+            if not folder.is_dir():
+                continue
+
+            records = []
+            for file in folder.iterdir():
+                try:
+                    record = fastjson.loads(file.read_bytes())
+                except (OSError, ValueError):
+                    continue
+                record.pop("path", None)
+                records.append((file.name, record))
+
+            self.logger.debug("Migrating %d %s to %s", len(records), kind, self.path)
+            with connection:
+                connection.executemany(
+                    "INSERT OR IGNORE INTO enums (kind, slug, data) VALUES (?, ?, ?)",
+                    [(kind, slug, _dumps(record)) for slug, record in records],
+                )
+
+        with connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+                (_MIGRATED_KEY, "1"),
+            )
+
+
+_store: t.Optional[EnumStore] = None
+_store_lock = threading.Lock()
+
+
+def get_enum_store() -> EnumStore:
+    """Get the enum store for the local cache directory."""
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = EnumStore(
+                path=ENUM_STORE_PATH,
+                legacy_directory=LOCAL_CACHE_DIRECTORY,
+            )
+        return _store
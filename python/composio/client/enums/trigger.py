@@ -23,7 +23,6 @@ class Trigger(Enum[TriggerData], metaclass=EnumGenerator):
                 self._data = TriggerData(
                     name=triggers[self.slug].name,
                     app=triggers[self.slug].tool,
-                    path=self.storage_path,
                 )
                 return self._data
 
@@ -46,7 +45,6 @@ class Trigger(Enum[TriggerData], metaclass=EnumGenerator):
         return TriggerData(  # type: ignore
             name=response["enum"],
             app=response["appName"],
-            path=self.storage_path,
         )
 
     @property
@@ -2,22 +2,265 @@
 Http client implementation for Composio SDK
 """
 
+import asyncio
+import dataclasses
+import email.utils
+import json
+import os
+import random
+import time
 import typing as t
+from dataclasses import dataclass
 
+import requests
 from requests import ReadTimeout
 from requests import Session as SyncSession
+from requests.adapters import DEFAULT_POOLBLOCK, DEFAULT_POOLSIZE, HTTPAdapter
 
 from composio.__version__ import __version__
-from composio.utils import logging
+from composio.client.metrics import (
+    RequestHook,
+    RequestInfo,
+    get_endpoint_name,
+    run_hooks,
+)
+from composio.utils import fastjson, logging
 from composio.utils.shared import generate_request_id
 
 
+if t.TYPE_CHECKING:
+    import aiohttp
+
+
 DEFAULT_RUNTIME = "composio"
 SOURCE_HEADER = "python_sdk"
 DEFAULT_REQUEST_TIMEOUT = 60.0
+DEFAULT_ASYNC_POOL_MAXSIZE = 100
+DEFAULT_KEEPALIVE_TIMEOUT = 30.0
+MAX_RETRIES = 3
+
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+RETRY_STATUS_CODES = frozenset({429, 502, 503, 504})
+
+
+@dataclass
+class RetryPolicy:
+    """
+    Retry policy for the Composio HTTP clients.
+
+    Failed requests are retried with exponential backoff and full jitter, the
+    `Retry-After` header is honoured when the server sends one. Timeouts,
+    connection errors and 5xx responses are only retried for idempotent
+    methods, since the server might have processed the request already. A
+    429 response means the request was rejected, so it is retried for every
+    method.
+
+    Subclass and override `is_retryable` or `get_backoff` to customise it.
+    """
+
+    max_retries: int = MAX_RETRIES
+    "Maximum number of retries for a single call."
+
+    backoff_factor: float = 0.5
+    "Base delay in seconds, doubled on every retry."
+
+    max_backoff: float = 30.0
+    "Upper bound for a single delay in seconds."
+
+    budget: float = 60.0
+    "Total number of seconds a single call may spend waiting between retries."
+
+    jitter: bool = True
+    "Randomise delays to avoid clients retrying in lockstep."
+
+    retry_methods: t.FrozenSet[str] = IDEMPOTENT_METHODS
+    "HTTP methods which are safe to retry after a timeout or server error."
+
+    retry_status_codes: t.FrozenSet[int] = RETRY_STATUS_CODES
+    "Response status codes to retry on."
+
+    def is_retryable(
+        self,
+        method: str,
+        response: t.Optional[t.Any] = None,
+        error: t.Optional[BaseException] = None,
+    ) -> bool:
+        """Check whether a request with the given outcome can be retried."""
+        if response is not None:
+            if response.status_code not in self.retry_status_codes:
+                return False
+            if response.status_code == 429:
+                return True
+        return method.upper() in self.retry_methods
+
+    def get_backoff(self, attempt: int, response: t.Optional[t.Any] = None) -> float:
+        """Get the number of seconds to wait before the given retry attempt."""
+        retry_after = _parse_retry_after(response=response)
+        if retry_after is not None:
+            return retry_after
+
+        backoff = min(self.max_backoff, self.backoff_factor * (2**attempt))
+        if self.jitter:
+            return random.uniform(0, backoff)
+        return backoff
+
+    def next_delay(
+        self,
+        method: str,
+        attempt: int,
+        slept: float,
+        response: t.Optional[t.Any] = None,
+        error: t.Optional[BaseException] = None,
+    ) -> t.Optional[float]:
+        """
+        Get the delay before retrying, or `None` if the call should not be retried.
+
+        :param method: HTTP method of the request
+        :param attempt: Number of retries performed so far
+        :param slept: Number of seconds already spent waiting in this call
+        :param response: Response received, if any
+        :param error: Error raised while performing the request, if any
+        """
+        if attempt >= self.max_retries:
+            return None
+
+        if not self.is_retryable(method=method, response=response, error=error):
+            return None
+
+        delay = self.get_backoff(attempt=attempt, response=response)
+        if slept + delay > self.budget:
+            return None
+        return delay
+
+
+def _parse_retry_after(response: t.Optional[t.Any]) -> t.Optional[float]:
+    """Parse `Retry-After` header, which is either seconds or an HTTP date."""
+    if response is None:
+        return None
+
+    value = response.headers.get("Retry-After")
+    if value is None:
+        return None
+
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
 
+    try:
+        date = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, date.timestamp() - time.time())
 
-class HttpClient(SyncSession, logging.WithLogger):
+
+def _rewind(data: t.Any) -> None:
+    """Rewind file-like request bodies, so they can be sent again on retries."""
+    if hasattr(data, "seek"):
+        data.seek(0)
+
+
+def _get_body_size(kwargs: t.Dict[str, t.Any]) -> int:
+    """Get the size of the request body in bytes, `0` if it's not known."""
+    data = kwargs.get("data")
+    if isinstance(data, (bytes, bytearray)):
+        return len(data)
+    if isinstance(data, str):
+        return len(data.encode("utf-8"))
+    if hasattr(data, "fileno"):
+        return os.fstat(data.fileno()).st_size
+    if hasattr(data, "getbuffer"):
+        return data.getbuffer().nbytes
+    if kwargs.get("json") is not None:
+        return len(json.dumps(kwargs["json"]).encode("utf-8"))
+    return 0
+
+
+def _default_headers(api_key: str, runtime: t.Optional[str] = None) -> t.Dict:
+    """Headers sent along with every request."""
+    return {
+        "x-api-key": api_key,
+        "x-source": SOURCE_HEADER,
+        "x-runtime": runtime or DEFAULT_RUNTIME,
+        "x-composio-version": __version__,
+    }
+
+
+class _RequestHooksMixin(logging.WithLogger):
+    """Request hook dispatching shared by the sync and async clients."""
+
+    base_url: str
+    request_hooks: t.List[RequestHook]
+
+    def _get_request_info(
+        self,
+        method: str,
+        url: str,
+        kwargs: t.Dict[str, t.Any],
+    ) -> t.Optional[RequestInfo]:
+        """Describe the request for the hooks, `None` if there are no hooks."""
+        if not self.request_hooks:
+            return None
+        return RequestInfo(
+            method=method,
+            url=f"{self.base_url}{url}",
+            endpoint=get_endpoint_name(url=url),
+            request_id="",
+            bytes_out=_get_body_size(kwargs=kwargs),
+        )
+
+    def _before_request(
+        self,
+        info: t.Optional[RequestInfo],
+        request_id: str,
+        attempt: int,
+    ) -> t.Optional[RequestInfo]:
+        if info is None:
+            return None
+        info = dataclasses.replace(info, request_id=request_id, attempt=attempt)
+        run_hooks(self.request_hooks, "before_request", self._logger, request=info)
+        return info
+
+    def _after_response(
+        self,
+        info: t.Optional[RequestInfo],
+        start: float,
+        response: t.Optional[t.Any] = None,
+        error: t.Optional[BaseException] = None,
+    ) -> None:
+        if info is None:
+            return
+        run_hooks(
+            self.request_hooks,
+            "after_response",
+            self._logger,
+            request=info,
+            elapsed=time.perf_counter() - start,
+            response=response,
+            error=error,
+        )
+
+    def _on_retry(
+        self,
+        info: t.Optional[RequestInfo],
+        delay: float,
+        response: t.Optional[t.Any] = None,
+        error: t.Optional[BaseException] = None,
+    ) -> None:
+        if info is None:
+            return
+        run_hooks(
+            self.request_hooks,
+            "on_retry",
+            self._logger,
+            request=info,
+            delay=delay,
+            response=response,
+            error=error,
+        )
+
+
+class HttpClient(SyncSession, _RequestHooksMixin):
     """HTTP client for Composio"""
 
     def __init__(
@@ -26,6 +269,11 @@ class HttpClient(SyncSession, logging.WithLogger):
         api_key: str,
         runtime: t.Optional[str] = None,
         timeout: t.Optional[float] = None,
+        retry_policy: t.Optional[RetryPolicy] = None,
+        pool_connections: int = DEFAULT_POOLSIZE,
+        pool_maxsize: int = DEFAULT_POOLSIZE,
+        pool_block: bool = DEFAULT_POOLBLOCK,
+        request_hooks: t.Optional[t.Sequence[RequestHook]] = None,
     ) -> None:
         """
         Initialize client channel for Composio API
@@ -34,43 +282,100 @@ class HttpClient(SyncSession, logging.WithLogger):
         :param api_key: API key for Composio API
         :param runtime: Runtime specifier
         :param timeout: Request timeout
+        :param retry_policy: Policy for retrying failed requests
+        :param pool_connections: Number of connection pools to cache
+        :param pool_maxsize: Maximum number of connections to keep in a pool
+        :param pool_block: Block when the pool has no free connections
+            instead of opening connections that will not be reused
+        :param request_hooks: Hooks called around every request attempt
         """
         SyncSession.__init__(self)
         logging.WithLogger.__init__(self)
         self.base_url = base_url
-        self.headers.update(
-            {
-                "x-api-key": api_key,
-                "x-source": SOURCE_HEADER,
-                "x-runtime": runtime or DEFAULT_RUNTIME,
-                "x-composio-version": __version__,
-            }
-        )
+        self.headers.update(_default_headers(api_key=api_key, runtime=runtime))
         self.timeout = timeout or DEFAULT_REQUEST_TIMEOUT
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.request_hooks = list(request_hooks or [])
+
+        adapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+        )
+        self.mount("http://", adapter)
+        self.mount("https://", adapter)
 
     def _wrap(self, method: t.Callable) -> t.Callable:
         """Wrap http request."""
 
         def request(url: str, **kwargs: t.Any) -> t.Any:
             """Perform HTTP request."""
-            self._logger.debug(
-                f"{method.__name__.upper()} {self.base_url}{url} - {kwargs}"
-            )
-            retries = 0
-            while retries < 3:
+            name = method.__name__.upper()
+            self._logger.debug("%s %s%s - %s", name, self.base_url, url, kwargs)
+            headers = kwargs.pop("headers", None) or {}
+            info = self._get_request_info(method=name, url=url, kwargs=kwargs)
+            attempt = 0
+            slept = 0.0
+            while True:
+                _rewind(kwargs.get("data"))
+                request_id = generate_request_id()
+                info = self._before_request(
+                    info=info,
+                    request_id=request_id,
+                    attempt=attempt,
+                )
+                start = time.perf_counter()
+                response, error = None, None
                 try:
-                    return method(
+                    response = method(
                         url=f"{self.base_url}{url}",
                         timeout=self.timeout,
                         headers={
-                            **kwargs.pop("headers", {}),
-                            "x-request-id": generate_request_id(),
+                            **headers,
+                            "x-request-id": request_id,
                         },
                         **kwargs,
                     )
-                except ReadTimeout:
-                    retries += 1
-            raise TimeoutError("Timed out while waiting for request to complete")
+                except (ReadTimeout, requests.ConnectionError) as e:
+                    error = e
+                except Exception as e:
+                    self._after_response(info=info, start=start, error=e)
+                    raise
+
+                self._after_response(
+                    info=info,
+                    start=start,
+                    response=response,
+                    error=error,
+                )
+                delay = self.retry_policy.next_delay(
+                    method=name,
+                    attempt=attempt,
+                    slept=slept,
+                    response=response,
+                    error=error,
+                )
+                if delay is None:
+                    if error is None:
+                        return response
+                    if isinstance(error, ReadTimeout):
+                        raise TimeoutError(
+                            "Timed out while waiting for request to complete"
+                        ) from error
+                    raise error
+
+                self._on_retry(info=info, delay=delay, response=response, error=error)
+                self._logger.debug(
+                    "Retrying %s %s%s in %.2fs (attempt %d)",
+                    name,
+                    self.base_url,
+                    url,
+                    delay,
+                    attempt + 1,
+                )
+                time.sleep(delay)
+                slept += delay
+                attempt += 1
 
         return request
 
@@ -78,3 +383,196 @@ class HttpClient(SyncSession, logging.WithLogger):
         if name in ("get", "post", "put", "delete", "patch"):
             return self._wrap(super().__getattribute__(name))
         return super().__getattribute__(name)
+
+
+class AsyncResponse:
+    """Buffered HTTP response returned by `AsyncHttpClient`."""
+
+    def __init__(
+        self,
+        status_code: int,
+        content: bytes,
+        headers: t.Mapping[str, str],
+    ) -> None:
+        """
+        Initialize response object.
+
+        :param status_code: HTTP response status code
+        :param content: Response body
+        :param headers: Response headers
+        """
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers
+
+    @property
+    def text(self) -> str:
+        """Response body as string."""
+        return self.content.decode(encoding="utf-8")
+
+    def json(self) -> t.Any:
+        """Decode the response body as JSON."""
+        return fastjson.loads(self.content)
+
+
+class AsyncHttpClient(_RequestHooksMixin):
+    """Async HTTP client for Composio, backed by a pooled `aiohttp` session."""
+
+    _session: t.Optional["aiohttp.ClientSession"] = None
+
+    def __init__(
+        self,
+        base_url: str,
+        api_key: str,
+        runtime: t.Optional[str] = None,
+        timeout: t.Optional[float] = None,
+        retry_policy: t.Optional[RetryPolicy] = None,
+        pool_maxsize: int = DEFAULT_ASYNC_POOL_MAXSIZE,
+        keepalive_timeout: float = DEFAULT_KEEPALIVE_TIMEOUT,
+        request_hooks: t.Optional[t.Sequence[RequestHook]] = None,
+    ) -> None:
+        """
+        Initialize async client channel for Composio API
+
+        :param base_url: Base URL for Composio API
+        :param api_key: API key for Composio API
+        :param runtime: Runtime specifier
+        :param timeout: Request timeout
+        :param retry_policy: Policy for retrying failed requests
+        :param pool_maxsize: Maximum number of connections kept in the pool
+        :param keepalive_timeout: Seconds an idle connection is kept alive for
+        :param request_hooks: Hooks called around every request attempt
+        """
+        logging.WithLogger.__init__(self)
+        self.base_url = base_url
+        self.headers = _default_headers(api_key=api_key, runtime=runtime)
+        self.timeout = timeout or DEFAULT_REQUEST_TIMEOUT
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.pool_maxsize = pool_maxsize
+        self.keepalive_timeout = keepalive_timeout
+        self.request_hooks = list(request_hooks or [])
+
+    @property
+    def session(self) -> "aiohttp.ClientSession":
+        """
+        Pooled client session.
+
+        The session is bound to the event loop it was created in, so it is
+        created lazily and re-created if the loop it belongs to is gone.
+        `aiohttp` is only imported here, it's slow to import and not needed
+        by sync clients.
+        """
+        import aiohttp  # pylint: disable=import-outside-toplevel
+
+        loop = asyncio.get_running_loop()
+        if (
+            self._session is None
+            or self._session.closed
+            or self._session._loop is not loop  # pylint: disable=protected-access
+        ):
+            self._session = aiohttp.ClientSession(
+                headers=self.headers,
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                connector=aiohttp.TCPConnector(
+                    limit=self.pool_maxsize,
+                    keepalive_timeout=self.keepalive_timeout,
+                ),
+            )
+        return self._session
+
+    async def request(self, method: str, url: str, **kwargs: t.Any) -> AsyncResponse:
+        """Perform HTTP request."""
+        import aiohttp  # pylint: disable=import-outside-toplevel
+
+        name = method.upper()
+        self._logger.debug("%s %s%s - %s", name, self.base_url, url, kwargs)
+        headers = kwargs.pop("headers", None) or {}
+        info = self._get_request_info(method=name, url=url, kwargs=kwargs)
+        attempt = 0
+        slept = 0.0
+        while True:
+            _rewind(kwargs.get("data"))
+            request_id = generate_request_id()
+            info = self._before_request(
+                info=info,
+                request_id=request_id,
+                attempt=attempt,
+            )
+            start = time.perf_counter()
+            response, error = None, None
+            try:
+                async with self.session.request(
+                    method=name,
+                    url=f"{self.base_url}{url}",
+                    headers={
+                        **headers,
+                        "x-request-id": request_id,
+                    },
+                    **kwargs,
+                ) as _response:
+                    response = AsyncResponse(
+                        status_code=_response.status,
+                        content=await _response.read(),
+                        headers=_response.headers,
+                    )
+            except (asyncio.TimeoutError, aiohttp.ClientConnectionError) as e:
+                error = e
+            except Exception as e:
+                self._after_response(info=info, start=start, error=e)
+                raise
+
+            self._after_response(
+                info=info,
+                start=start,
+                response=response,
+                error=error,
+            )
+            delay = self.retry_policy.next_delay(
+                method=name,
+                attempt=attempt,
+                slept=slept,
+                response=response,
+                error=error,
+            )
+            if delay is None:
+                if error is None:
+                    return t.cast(AsyncResponse, response)
+                if isinstance(error, asyncio.TimeoutError):
+                    raise TimeoutError(
+                        "Timed out while waiting for request to complete"
+                    ) from error
+                raise error
+
+            self._on_retry(info=info, delay=delay, response=response, error=error)
+            self._logger.debug(
+                "Retrying %s %s%s in %.2fs (attempt %d)",
+                name,
+                self.base_url,
+                url,
+                delay,
+                attempt + 1,
+            )
+            await asyncio.sleep(delay)
+            slept += delay
+            attempt += 1
+
+    async def get(self, url: str, **kwargs: t.Any) -> AsyncResponse:
+        return await self.request("get", url=url, **kwargs)
+
+    async def post(self, url: str, **kwargs: t.Any) -> AsyncResponse:
+        return await self.request("post", url=url, **kwargs)
+
+    async def put(self, url: str, **kwargs: t.Any) -> AsyncResponse:
+        return await self.request("put", url=url, **kwargs)
+
+    async def delete(self, url: str, **kwargs: t.Any) -> AsyncResponse:
+        return await self.request("delete", url=url, **kwargs)
+
+    async def patch(self, url: str, **kwargs: t.Any) -> AsyncResponse:
+        return await self.request("patch", url=url, **kwargs)
+
+    async def close(self) -> None:
+        """Close the underlying session and release pooled connections."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
@@ -0,0 +1,435 @@
+"""
+Request instrumentation for the Composio HTTP clients.
+"""
+
+import bisect
+import logging
+import threading
+import typing as t
+import urllib.parse
+from dataclasses import dataclass, field
+
+
+DEFAULT_BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+    180.0,
+)
+"""
+Upper bounds in seconds of the latency histogram buckets.
+"""
+
+STATIC_SEGMENTS = frozenset(
+    {
+        "v1",
+        "v2",
+        "v3",
+        "actions",
+        "active_triggers",
+        "advanced",
+        "api",
+        "apps",
+        "auth",
+        "callback_url",
+        "cli",
+        "client",
+        "client_info",
+        "connectedAccounts",
+        "disable",
+        "enable",
+        "execute",
+        "generate-cli-session",
+        "info",
+        "instance",
+        "integrations",
+        "logs",
+        "proxy",
+        "search",
+        "setCallbackURL",
+        "status",
+        "triggers",
+        "users",
+        "verify-cli-code",
+    }
+)
+"""
+Path segments of the Composio API routes, every other segment is an object
+ID or slug.
+"""
+
+
+def get_endpoint_name(url: str) -> str:
+    """
+    Get the endpoint name for a request URL, used to group requests.
+
+    The query string is dropped and path segments which are not part of the
+    API routes (object IDs, action and app slugs...) are replaced with `{id}`,
+    so the number of endpoints stays bounded.
+    """
+    segments = urllib.parse.urlsplit(url).path.split("/")
+    return "/".join(
+        segment if segment in STATIC_SEGMENTS or not segment else "{id}"
+        for segment in segments
+    )
+
+
+@dataclass
+class RequestInfo:
+    """Request attempt passed to the request hooks."""
+
+    method: str
+    "HTTP method, in upper case."
+
+    url: str
+    "Full request URL."
+
+    endpoint: str
+    "Endpoint name, see `get_endpoint_name`."
+
+    request_id: str
+    "Value of the `x-request-id` header sent with this attempt."
+
+    attempt: int = 0
+    "Number of retries performed before this attempt."
+
+    bytes_out: int = 0
+    "Size of the request body in bytes, `0` if it's not known."
+
+
+class RequestHook:
+    """
+    Hook called by the HTTP clients around every request attempt.
+
+    Override the methods you need, the default implementations do nothing.
+    Hooks run on the request path, so they should return quickly. Errors
+    raised by hooks are logged and don't affect the request.
+    """
+
+    def before_request(self, request: RequestInfo) -> None:
+        """Called before a request attempt is sent."""
+
+    def after_response(
+        self,
+        request: RequestInfo,
+        elapsed: float,
+        response: t.Optional[t.Any] = None,
+        error: t.Optional[BaseException] = None,
+    ) -> None:
+        """
+        Called once a request attempt completes.
+
+        :param request: Request attempt
+        :param elapsed: Seconds spent on the attempt
+        :param response: Response received, `None` if the attempt failed
+        :param error: Error raised by the attempt, if any
+        """
+
+    def on_retry(
+        self,
+        request: RequestInfo,
+        delay: float,
+        response: t.Optional[t.Any] = None,
+        error: t.Optional[BaseException] = None,
+    ) -> None:
+        """
+        Called when a failed request attempt is going to be retried.
+
+        :param request: Failed request attempt
+        :param delay: Seconds to wait before the next attempt
+        :param response: Response received, `None` if the attempt failed
+        :param error: Error raised by the attempt, if any
+        """
+
+
+def run_hooks(
+    hooks: t.Sequence[RequestHook],
+    event: str,
+    logger: logging.Logger,
+    **kwargs: t.Any,
+) -> None:
+    """Call `event` on all of the hooks, logging any errors."""
+    for hook in hooks:
+        try:
+            getattr(hook, event)(**kwargs)
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            logger.warning("Error running `%s` on %r: %s", event, hook, e)
+
+
+@dataclass
+class EndpointMetrics:
+    """Metrics recorded for a single endpoint."""
+
+    buckets: t.Tuple[float, ...] = DEFAULT_BUCKETS
+    "Upper bounds of the latency histogram buckets."
+
+    bucket_counts: t.List[int] = field(default_factory=list)
+    "Number of attempts per bucket, the last one counts attempts above all bounds."
+
+    count: int = 0
+    "Number of request attempts."
+
+    latency: float = 0.0
+    "Total seconds spent on request attempts."
+
+    status_codes: t.Dict[str, int] = field(default_factory=dict)
+    "Number of attempts per response status code, `error` for failed attempts."
+
+    bytes_in: int = 0
+    "Total size of the response bodies in bytes."
+
+    bytes_out: int = 0
+    "Total size of the request bodies in bytes."
+
+    retries: int = 0
+    "Number of retried attempts."
+
+    def __post_init__(self) -> None:
+        if not self.bucket_counts:
+            self.bucket_counts = [0] * (len(self.buckets) + 1)
+
+    def observe(
+        self,
+        elapsed: float,
+        status: str,
+        bytes_in: int,
+        bytes_out: int,
+    ) -> None:
+        """Record a request attempt."""
+        self.bucket_counts[bisect.bisect_left(self.buckets, elapsed)] += 1
+        self.count += 1
+        self.latency += elapsed
+        self.status_codes[status] = self.status_codes.get(status, 0) + 1
+        self.bytes_in += bytes_in
+        self.bytes_out += bytes_out
+
+    def quantile(self, q: float) -> t.Optional[float]:
+        """
+        Estimate a latency quantile from the histogram.
+
+        The value is interpolated linearly within the bucket it falls in, the
+        largest bound is returned for quantiles above it.
+
+        :param q: Quantile, between 0 and 1
+        :return: Latency in seconds, `None` if nothing was recorded
+        """
+        if self.count == 0:
+            return None
+
+        rank = q * self.count
+        seen = 0
+        for i, count in enumerate(self.bucket_counts):
+            if count == 0 or seen + count < rank:
+                seen += count
+                continue
+            if i == len(self.buckets):
+                return self.buckets[-1]
+            lower = self.buckets[i - 1] if i > 0 else 0.0
+            return lower + (self.buckets[i] - lower) * (rank - seen) / count
+        return self.buckets[-1]
+
+    def to_dict(self) -> t.Dict[str, t.Any]:
+        """Convert to a JSON serializable dictionary."""
+        return {
+            "count": self.count,
+            "latency": {
+                "sum": self.latency,
+                "p50": self.quantile(0.5),
+                "p90": self.quantile(0.9),
+                "p99": self.quantile(0.99),
+                "buckets": dict(
+                    zip(
+                        [str(bound) for bound in self.buckets] + ["+Inf"],
+                        self.bucket_counts,
+                    )
+                ),
+            },
+            "status_codes": dict(self.status_codes),
+            "bytes_in": self.bytes_in,
+            "bytes_out": self.bytes_out,
+            "retries": self.retries,
+        }
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class MetricsCollector(RequestHook):
+    """
+    In-process metrics for the requests made by the HTTP clients.
+
+    Records per-endpoint latency histograms, status codes, payload sizes and
+    retry counts. Every attempt is recorded separately, so retried requests
+    show up once per attempt. Hits and misses of the SDK's caches, like the
+    toolset's result cache, can be recorded as well.
+    """
+
+    def __init__(self, buckets: t.Sequence[float] = DEFAULT_BUCKETS) -> None:
+        """
+        Initialize metrics collector.
+
+        :param buckets: Upper bounds in seconds of the latency histogram buckets
+        """
+        self.buckets = tuple(sorted(buckets))
+        self._lock = threading.Lock()
+        self._endpoints: t.Dict[t.Tuple[str, str], EndpointMetrics] = {}
+        self._cache_lookups: t.Dict[t.Tuple[str, str], int] = {}
+
+    def _get(self, request: RequestInfo) -> EndpointMetrics:
+        key = (request.method, request.endpoint)
+        if key not in self._endpoints:
+            self._endpoints[key] = EndpointMetrics(buckets=self.buckets)
+        return self._endpoints[key]
+
+    def after_response(
+        self,
+        request: RequestInfo,
+        elapsed: float,
+        response: t.Optional[t.Any] = None,
+        error: t.Optional[BaseException] = None,
+    ) -> None:
+        if response is None:
+            status, bytes_in = "error", 0
+        else:
+            status, bytes_in = str(response.status_code), len(response.content)
+
+        with self._lock:
+            self._get(request).observe(
+                elapsed=elapsed,
+                status=status,
+                bytes_in=bytes_in,
+                bytes_out=request.bytes_out,
+            )
+
+    def on_retry(
+        self,
+        request: RequestInfo,
+        delay: float,
+        response: t.Optional[t.Any] = None,
+        error: t.Optional[BaseException] = None,
+    ) -> None:
+        with self._lock:
+            self._get(request).retries += 1
+
+    def observe_cache(self, cache: str, hit: bool) -> None:
+        """
+        Record a cache lookup.
+
+        :param cache: Name of the cache
+        :param hit: Whether the lookup found a usable entry
+        """
+        key = (cache, "hit" if hit else "miss")
+        with self._lock:
+            self._cache_lookups[key] = self._cache_lookups.get(key, 0) + 1
+
+    def cache_snapshot(self) -> t.Dict[str, t.Dict[str, int]]:
+        """
+        Get the recorded cache lookups.
+
+        :return: Dictionary mapping cache names to their number of `hits` and
+            `misses`
+        """
+        with self._lock:
+            lookups = dict(self._cache_lookups)
+        return {
+            cache: {
+                "hits": lookups.get((cache, "hit"), 0),
+                "misses": lookups.get((cache, "miss"), 0),
+            }
+            for cache in sorted({cache for cache, _ in lookups})
+        }
+
+    def reset(self) -> None:
+        """Drop all of the recorded metrics."""
+        with self._lock:
+            self._endpoints.clear()
+            self._cache_lookups.clear()
+
+    def snapshot(self) -> t.Dict[str, t.Dict[str, t.Any]]:
+        """
+        Get the recorded metrics.
+
+        :return: Dictionary mapping `<METHOD> <endpoint>` to the metrics
+            recorded for it
+        """
+        with self._lock:
+            return {
+                f"{method} {endpoint}": metrics.to_dict()
+                for (method, endpoint), metrics in sorted(self._endpoints.items())
+            }
+
+    def to_prometheus(self, prefix: str = "composio_http") -> str:
+        """
+        Export the recorded metrics in the Prometheus text format.
+
+        :param prefix: Prefix for the metric names
+        :return: Metrics in the Prometheus text exposition format
+        """
+        with self._lock:
+            endpoints = [
+                (method, endpoint, metrics.to_dict())
+                for (method, endpoint), metrics in sorted(self._endpoints.items())
+            ]
+            cache_lookups = sorted(self._cache_lookups.items())
+
+        lines = []
+
+        def _header(name: str, kind: str, description: str) -> str:
+            lines.append(f"# HELP {prefix}_{name} {description}")
+            lines.append(f"# TYPE {prefix}_{name} {kind}")
+            return f"{prefix}_{name}"
+
+        def _labels(method: str, endpoint: str, **extra: str) -> str:
+            labels = {"method": method, "endpoint": endpoint, **extra}
+            return ",".join(
+                f'{key}="{_escape_label(value)}"' for key, value in labels.items()
+            )
+
+        name = _header(
+            "request_duration_seconds",
+            "histogram",
+            "Latency of request attempts.",
+        )
+        for method, endpoint, data in endpoints:
+            cumulative = 0
+            for bound, count in data["latency"]["buckets"].items():
+                cumulative += count
+                labels = _labels(method, endpoint, le=bound)
+                lines.append(f"{name}_bucket{{{labels}}} {cumulative}")
+            labels = _labels(method, endpoint)
+            lines.append(f"{name}_sum{{{labels}}} {data['latency']['sum']}")
+            lines.append(f"{name}_count{{{labels}}} {data['count']}")
+
+        name = _header("requests_total", "counter", "Request attempts by status.")
+        for method, endpoint, data in endpoints:
+            for status, count in sorted(data["status_codes"].items()):
+                labels = _labels(method, endpoint, status=status)
+                lines.append(f"{name}{{{labels}}} {count}")
+
+        for key, description in (
+            ("bytes_out", "Size of the request bodies in bytes."),
+            ("bytes_in", "Size of the response bodies in bytes."),
+            ("retries", "Retried request attempts."),
+        ):
+            name = _header(f"{key}_total", "counter", description)
+            for method, endpoint, data in endpoints:
+                lines.append(f"{name}{{{_labels(method, endpoint)}}} {data[key]}")
+
+        if cache_lookups:
+            name = _header("cache_lookups_total", "counter", "Cache lookups by result.")
+            for (cache, result), count in cache_lookups:
+                labels = f'cache="{_escape_label(cache)}",result="{result}"'
+                lines.append(f"{name}{{{labels}}} {count}")
+
+        return "\n".join(lines) + "\n"
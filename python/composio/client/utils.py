@@ -1,15 +1,22 @@
-import json
+import hashlib
 import os
+import threading
 import typing as t
 
 from composio.client import Composio, enums
 from composio.client.collections import ActionModel, AppModel, TriggerModel
 from composio.client.enums.base import replacement_action_name
-from composio.tools.local import load_local_tools
-from composio.utils import get_enum_key
+from composio.client.enums.store import get_enum_store, meta_key
+from composio.client.exceptions import HTTPError
+from composio.utils import fastjson, get_enum_key
+from composio.utils.atomic import FileLock
 from composio.utils.logging import get_logger
 
 
+if t.TYPE_CHECKING:
+    from composio.tools.local.manifest import Manifest
+
+
 EnumModels = t.Union[AppModel, ActionModel, TriggerModel]
 
 
@@ -17,6 +24,29 @@ logger = get_logger(__name__)
 
 NO_CACHE_REFRESH = os.getenv("COMPOSIO_NO_CACHE_REFRESH", "false") == "true"
 
+BACKGROUND_CACHE_REFRESH = (
+    os.getenv("COMPOSIO_BACKGROUND_CACHE_REFRESH", "false") == "true"
+)
+
+REFRESH_LOCK_TIMEOUT = 300.0
+"""
+Seconds to wait for another process refreshing the cache before refreshing
+it regardless.
+"""
+
+_refresh_lock = threading.Lock()
+_refresh_thread_lock = threading.Lock()
+_refresh_thread: t.Optional[threading.Thread] = None
+
+
+def get_manifest() -> "Manifest":
+    """Get the local tools manifest."""
+    # `composio.tools` imports this module, so it can't be imported up front
+    # pylint: disable=import-outside-toplevel
+    from composio.tools.local import get_manifest as _get_manifest
+
+    return _get_manifest()
+
 
 def filter_non_beta_items(items: t.Sequence[EnumModels]) -> t.List:
     filtered_items: t.List[EnumModels] = []
@@ -47,19 +77,73 @@ def update_apps(client: Composio, beta: bool = False) -> t.List[AppModel]:
     return apps
 
 
+def _fetch_listing(
+    client: Composio,
+    url: str,
+    kind: str,
+    beta: bool = False,
+) -> t.Tuple[t.Optional[bytes], t.Dict[str, str]]:
+    """
+    Fetch a catalogue listing, if it changed since the last sync.
+
+    The listing is requested conditionally with the stored `ETag`, and its
+    digest is compared with the one of the last synced listing. Both are only
+    used if the last sync used the same `beta` flag, since it changes which
+    records are stored.
+
+    :return: Listing content, `None` if it did not change, and the metadata
+        to store along with the synced records
+    """
+    store = get_enum_store()
+    flag = "true" if beta else "false"
+    synced = store.count(kind) > 0 and store.get_meta(meta_key(kind, "beta")) == flag
+    etag = store.get_meta(meta_key(kind, "etag")) if synced else None
+    response = client.http.get(
+        url=url,
+        headers={"If-None-Match": etag} if etag is not None else {},
+    )
+    if response.status_code == 304:
+        return None, {}
+
+    if response.status_code != 200:
+        raise HTTPError(
+            message=response.content.decode(encoding="utf-8"),
+            status_code=response.status_code,
+        )
+
+    digest = hashlib.sha256(response.content).hexdigest()
+    meta = {meta_key(kind, "digest"): digest, meta_key(kind, "beta"): flag}
+    if response.headers.get("ETag") is not None:
+        meta[meta_key(kind, "etag")] = response.headers["ETag"]
+
+    if synced and store.get_meta(meta_key(kind, "digest")) == digest:
+        return None, meta
+    return response.content, meta
+
+
 def update_actions(
     client: Composio, apps: t.List[AppModel], beta: bool = False
 ) -> None:
     """Update actions and tags."""
+    content, meta = _fetch_listing(
+        client=client,
+        url=str(client.actions.endpoint),
+        kind=enums.Action.cache_folder,
+        beta=beta,
+    )
+    if content is None:
+        _update_actions_no_auth(apps=apps, meta=meta)
+        return
+
     actions = sorted(
-        client.actions.get(allow_all=True),
+        fastjson.validate_list(data=content, model=ActionModel, key="items") or [],
         key=lambda x: f"{x.appName}_{x.name}",
     )
     if not beta:
         actions = filter_non_beta_items(actions)
 
     _update_tags(apps=apps, actions=actions)
-    _update_actions(apps=apps, actions=actions)
+    _update_actions(apps=apps, actions=actions, meta=meta)
 
 
 def update_triggers(
@@ -78,114 +162,99 @@ def update_triggers(
 
 def _update_apps(apps: t.List[AppModel]) -> None:
     """Create App enum class."""
-    app_names = []
-    enums.base.APPS_CACHE.mkdir(
-        parents=True,
-        exist_ok=True,
-    )
+    records: t.Dict[str, t.Dict] = {}
     for app in apps:
-        app_names.append(
+        records[
             get_enum_key(
                 name=app.key.lower().replace(" ", "_").replace("-", "_"),
             )
-        )
-        enums.base.AppData(
-            name=app.name,
-            path=enums.base.APPS_CACHE / app_names[-1],
-            is_local=False,
-        ).store()
-
-    for tool in load_local_tools()["local"].values():
-        if tool.enum in app_names:
+        ] = enums.App.to_record(enums.base.AppData(name=app.name, is_local=False))
+
+    for enum, tool in get_manifest()["tools"].items():
+        if enum in records:
             continue
 
-        app_names.append(tool.enum)
-        enums.base.AppData(
-            name=tool.name,
-            path=enums.base.APPS_CACHE / app_names[-1],
-            is_local=True,
-        ).store()
+        records[enum] = enums.App.to_record(
+            enums.base.AppData(name=tool["name"], is_local=True)
+        )
+
+    _sync(enums.App.cache_folder, records=records)
 
 
-def _update_actions(apps: t.List[AppModel], actions: t.List[ActionModel]) -> None:
+def _update_actions(
+    apps: t.List[AppModel],
+    actions: t.List[ActionModel],
+    meta: t.Optional[t.Dict[str, str]] = None,
+) -> None:
     """Get Action enum."""
-    enums.base.ACTIONS_CACHE.mkdir(parents=True, exist_ok=True)
-    deprecated = {}
-    action_names = []
-    for app in sorted(apps, key=lambda x: x.key):
-        for action in actions:
-            if action.appName != app.key:
-                continue
-
-            new_action_name = replacement_action_name(
-                action.description or "", action.appName
-            )
-            if new_action_name is not None:
-                replaced_by = deprecated[get_enum_key(name=action.name)] = (
-                    new_action_name
-                )
-            else:
-                action_names.append(get_enum_key(name=action.name))
-                replaced_by = None
+    apps_by_key = {app.key: app for app in apps}
+    records: t.Dict[str, t.Dict] = {}
+    for action in actions:
+        app = apps_by_key.get(action.appName)
+        if app is None:
+            continue
 
-            # TODO: there is duplicate ActionData creation code in
-            # `load_from_runtime` and `fetch_and_cache` in client/enums/action.py
+        # TODO: there is duplicate ActionData creation code in
+        # `load_from_runtime` and `fetch_and_cache` in client/enums/action.py
+        records[get_enum_key(name=action.name)] = enums.Action.to_record(
             enums.base.ActionData(
                 name=action.name,
                 app=app.key,
                 tags=action.tags,
                 no_auth=app.no_auth,
                 is_local=False,
-                path=enums.base.ACTIONS_CACHE / get_enum_key(name=action.name),
-                replaced_by=replaced_by,
-            ).store()
+                replaced_by=replacement_action_name(
+                    action.description or "", action.appName
+                ),
+            )
+        )
 
-    processed = []
-    for tool in load_local_tools()["local"].values():
-        if tool.name in processed:
-            continue
+    for tool in get_manifest()["tools"].values():
+        for enum, entry in tool["actions"].items():
+            records[enum] = enums.Action.to_record(
+                enums.base.ActionData(
+                    name=enum,
+                    app=tool["name"],
+                    tags=entry["tags"],
+                    no_auth=True,
+                    is_local=True,
+                    shell=False,
+                )
+            )
 
-        processed.append(tool.name)
-        for actcls in tool.actions():
-            action_names.append(actcls.enum)
-            enums.base.ActionData(
-                name=actcls.enum,
-                app=tool.name,
-                tags=actcls.tags(),
-                no_auth=True,
-                is_local=True,
-                path=enums.base.ACTIONS_CACHE / action_names[-1],
-                shell=False,
-            ).store()
+    _sync(enums.Action.cache_folder, records=records, meta=meta)
+
+
+def _update_actions_no_auth(
+    apps: t.List[AppModel],
+    meta: t.Optional[t.Dict[str, str]] = None,
+) -> None:
+    """Update the app `no_auth` flag copied into the stored actions."""
+    no_auth = {app.key: app.no_auth for app in apps}
+    records = {}
+    for slug, record in get_enum_store().records(enums.Action.cache_folder):
+        if not record.get("is_local") and record.get("app") in no_auth:
+            record["no_auth"] = no_auth[record["app"]]
+        records[slug] = record
+    _sync(enums.Action.cache_folder, records=records, meta=meta)
 
 
 def _update_tags(apps: t.List[AppModel], actions: t.List[ActionModel]) -> None:
     """Create Tag enum class."""
-    enums.base.TAGS_CACHE.mkdir(parents=True, exist_ok=True)
+    app_keys = {app.key for app in apps}
     tag_map: t.Dict[str, t.Set[str]] = {}
-    for app in apps:
-        app_name = app.key
-        for action in [action for action in actions if action.appName == app_name]:
-            if app_name not in tag_map:
-                tag_map[app_name] = set()
-            tag_map[app_name].update(action.tags or [])
+    for action in actions:
+        if action.appName in app_keys:
+            tag_map.setdefault(action.appName, set()).update(action.tags or [])
 
-    tag_names = ["DEFAULT"]
+    records: t.Dict[str, t.Dict] = {}
     for app_name in sorted(tag_map):
         for tag in sorted(tag_map[app_name]):
-            tag_name = get_enum_key(name=f"{app_name}_{tag}")
-            tag_names.append(tag_name)
-            enums.base.TagData(
-                app=app_name,
-                value=tag,
-                path=enums.base.TAGS_CACHE / tag_names[-1],
-            ).store()
-
-    enums.base.TagData(
-        app="default",
-        value="important",
-        path=enums.base.TAGS_CACHE / "DEFAULT",
-    )
+            records[get_enum_key(name=f"{app_name}_{tag}")] = enums.Tag.to_record(
+                enums.base.TagData(app=app_name, value=tag)
+            )
+
+    _sync(enums.Tag.cache_folder, records=records)
 
 
 def _update_triggers(
@@ -193,22 +262,81 @@ def _update_triggers(
     triggers: t.List[TriggerModel],
 ) -> None:
     """Get Trigger enum."""
-    trigger_names = []
-    enums.base.TRIGGERS_CACHE.mkdir(exist_ok=True)
-    for app in apps:
-        for trigger in triggers:
-            if trigger.appKey != app.key:
-                continue
+    app_keys = {app.key for app in apps}
+    records: t.Dict[str, t.Dict] = {}
+    for trigger in triggers:
+        if trigger.appKey not in app_keys:
+            continue
 
-            trigger_names.append(get_enum_key(name=trigger.name).upper())
-            enums.base.TriggerData(
-                name=trigger.name,
-                app=app.key,
-                path=enums.base.TRIGGERS_CACHE / trigger_names[-1],
-            ).store()
+        records[get_enum_key(name=trigger.name).upper()] = enums.Trigger.to_record(
+            enums.base.TriggerData(name=trigger.name, app=trigger.appKey)
+        )
+
+    _sync(enums.Trigger.cache_folder, records=records)
 
 
-def check_cache_refresh(client: Composio) -> None:
+def _sync(
+    kind: str,
+    records: t.Dict[str, t.Dict],
+    meta: t.Optional[t.Dict[str, str]] = None,
+) -> None:
+    written, removed = get_enum_store().sync(kind, records=records, meta=meta)
+    logger.debug("Synced %s: %d written, %d removed", kind, written, removed)
+
+
+def _is_cache_up_to_date() -> bool:
+    first_actions = get_enum_store().records(enums.Action.cache_folder, limit=1)
+    if not first_actions:
+        return False
+
+    ((_, first_action),) = first_actions
+    return "replaced_by" in first_action
+
+
+def refresh_cache(client: Composio, beta: bool = False) -> None:
+    """
+    Sync the local enum cache with the catalogue on the server.
+
+    Listings which did not change since the last sync are skipped and only the
+    changed records are written.
+    """
+    apps = update_apps(client, beta=beta)
+    update_actions(client, apps, beta=beta)
+    update_triggers(client, apps, beta=beta)
+
+
+def _refresh_exclusively(client: Composio) -> None:
+    """
+    Refresh the cache unless it was refreshed while waiting for the lock.
+
+    Processes sharing the cache directory take an advisory lock next to the
+    enum store, so only one of them downloads the catalogue while the others
+    wait for it and then find the cache up-to-date.
+    """
+    with _refresh_lock:
+        lock = FileLock(
+            get_enum_store().path.with_suffix(".lock"),
+            timeout=REFRESH_LOCK_TIMEOUT,
+        )
+        if not lock.acquire():
+            logger.warning("Timed out waiting for the cache refresh lock")
+        try:
+            if _is_cache_up_to_date():
+                return
+            logger.info("Actions cache is outdated, refreshing cache...")
+            refresh_cache(client)
+        finally:
+            lock.release()
+
+
+def _refresh_in_background(client: Composio) -> None:
+    try:
+        _refresh_exclusively(client)
+    except Exception as e:  # pylint: disable=broad-exception-caught
+        logger.warning("Error refreshing the actions cache in background: %s", e)
+
+
+def check_cache_refresh(client: Composio, background: t.Optional[bool] = None) -> None:
     """
     Check if the actions have a 'replaced_by' field and refresh the cache if not.
     This is a workaround to invalidate local caches from older Composio versionos
@@ -217,19 +345,50 @@ def check_cache_refresh(client: Composio) -> None:
     Before this version, checking if an action is deprecated or not depended on the
     SDK version, and didn't come from the API. We need to start storing the data
     from the API and invalidate the cache if the data is not already stored.
+
+    :param client: Composio client to fetch the catalogue with
+    :param background: Refresh the cache in a background thread instead of
+        blocking, enums missing from the cache are fetched individually in the
+        meantime. Defaults to the `COMPOSIO_BACKGROUND_CACHE_REFRESH`
+        environment variable.
     """
+    global _refresh_thread
+
     if NO_CACHE_REFRESH:
         return
 
-    if enums.base.ACTIONS_CACHE.exists():
-        first_file = next(enums.base.ACTIONS_CACHE.iterdir(), None)
-        if first_file is not None:
-            first_action = json.loads(first_file.read_text())
-            if "replaced_by" in first_action:
-                logger.debug("Actions cache is up-to-date")
+    if _is_cache_up_to_date():
+        logger.debug("Actions cache is up-to-date")
+        return
+
+    if background is None:
+        background = BACKGROUND_CACHE_REFRESH
+
+    if background:
+        with _refresh_thread_lock:
+            if _refresh_thread is not None and _refresh_thread.is_alive():
                 return
+            logger.info("Actions cache is outdated, refreshing cache in background...")
+            _refresh_thread = threading.Thread(
+                target=_refresh_in_background,
+                args=(client,),
+                daemon=True,
+            )
+            _refresh_thread.start()
+        return
 
-    logger.info("Actions cache is outdated, refreshing cache...")
-    apps = update_apps(client)
-    update_actions(client, apps)
-    update_triggers(client, apps)
+    _refresh_exclusively(client)
+
+
+def wait_for_cache_refresh(timeout: t.Optional[float] = None) -> bool:
+    """
+    Wait for a background cache refresh to finish.
+
+    :param timeout: Maximum number of seconds to wait for
+    :return: `True` if no refresh is running anymore
+    """
+    thread = _refresh_thread
+    if thread is None:
+        return True
+    thread.join(timeout=timeout)
+    return not thread.is_alive()
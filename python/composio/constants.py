@@ -2,6 +2,7 @@
 Global constants for Composio SDK
 """
 
+import os
 from pathlib import Path
 
 
@@ -15,12 +16,26 @@ ENV_COMPOSIO_LOGGING_LEVEL = "COMPOSIO_LOGGING_LEVEL"
 Environment variable for specifying logging level
 """
 
+ENV_COMPOSIO_MAX_INLINE_FILE_SIZE = "COMPOSIO_MAX_INLINE_FILE_SIZE"
+"""
+Environment variable for the maximum size in bytes of a file sent inline
+with an action request, no limit is applied if not set.
+"""
+
 LOCAL_CACHE_DIRECTORY_NAME = ".composio"
 """
 Local cache directory name for composio CLI
 """
 
-LOCAL_CACHE_DIRECTORY = Path.home() / LOCAL_CACHE_DIRECTORY_NAME
+ENV_COMPOSIO_CACHE_DIR = "COMPOSIO_CACHE_DIR"
+"""
+Environment variable for overriding the local cache directory, eg. to share
+a single cache between the workers of a server.
+"""
+
+LOCAL_CACHE_DIRECTORY = Path(
+    os.environ.get(ENV_COMPOSIO_CACHE_DIR) or Path.home() / LOCAL_CACHE_DIRECTORY_NAME
+).expanduser()
 """
 Path to local caching directory.
 """
@@ -39,3 +39,14 @@ class ApiKeyNotProvidedError(ComposioSDKError):
                 "or run `composio login`"
             ),
         )
+
+
+class RateLimitTimeoutError(ComposioSDKError):
+    """Raise when waiting for a client-side rate limit would exceed its timeout."""
+
+    def __init__(self, limit: str, timeout: t.Optional[float]) -> None:
+        super().__init__(
+            message=(
+                f"Timed out after {timeout}s waiting for the rate limit of `{limit}`"
+            ),
+        )
@@ -10,6 +10,9 @@ from pathlib import Path
 import typing_extensions as tx
 from pydantic import BaseModel
 
+from composio.utils import fastjson
+from composio.utils.atomic import atomic_write
+
 
 logger = logging.getLogger(__name__)
 
@@ -52,31 +55,32 @@ class LocalStorage(BaseModel):
         return cls(**obj, path=path)
 
     def store(self) -> None:
-        """Store object as a JSON file."""
+        """Store object as a JSON file, replacing it atomically."""
         if self.path is None:
             raise ValueError(
                 f"Value of `path` is not set for `{self.__class__.__name__}`"
             )
 
-        self.path.parent.mkdir(parents=True, exist_ok=True)
         data = self.to_json()
         if "path" in data:
             del data["path"]
 
         logger.debug("Storing %s to %s", self.__class__.__name__, self.path)
-        self.path.write_text(
+        # Written atomically so processes sharing the file never read it
+        # partially written
+        atomic_write(
+            self.path,
             json.dumps(
                 data,
                 indent=2,
             ),
-            encoding="utf-8",
         )
 
     @classmethod
     def load(cls, path: Path) -> tx.Self:
         """Load user account from cache."""
         return cls.from_json(
-            obj=json.loads(
+            obj=fastjson.loads(
                 path.read_text(
                     encoding="utf-8",
                 )
@@ -1,4 +1,6 @@
+from .cache import CachePolicy
+from .limiter import RateLimit
 from .toolset import RETRY, ComposioToolSet
 
 
-__all__ = ["ComposioToolSet", "RETRY"]
+__all__ = ["CachePolicy", "ComposioToolSet", "RateLimit", "RETRY"]
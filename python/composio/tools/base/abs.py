@@ -7,6 +7,7 @@ import textwrap
 import typing as t
 from abc import abstractmethod
 from pathlib import Path
+from urllib.parse import unquote
 
 import inflection
 import jsonref
@@ -35,7 +36,71 @@ action_registry: ActionsRegistry = {"runtime": {}, "local": {}, "api": {}}
 trigger_registry: TriggersRegistry = {"runtime": {}, "local": {}, "api": {}}
 
 
+class _UnsupportedRef(Exception):
+    """Raise when a schema can't be inlined without `jsonref`."""
+
+
+def _resolve_pointer(root: t.Any, pointer: str) -> t.Any:
+    """Resolve a JSON pointer fragment, eg. `#/$defs/Model`, within `root`."""
+    document = root
+    fragment = pointer[1:]
+    for part in fragment.lstrip("/").split("/") if fragment else []:
+        part = unquote(part).replace("~1", "/").replace("~0", "~")
+        if isinstance(document, dict) and isinstance(document.get("$ref"), str):
+            raise _UnsupportedRef(pointer)
+        try:
+            document = document[int(part) if isinstance(document, list) else part]
+        except (LookupError, ValueError) as e:
+            raise _UnsupportedRef(pointer) from e
+    return document
+
+
+def _inline_refs(obj: t.Any, root: t.Dict, resolving: t.Tuple[str, ...]) -> t.Any:
+    """Build a copy of `obj` with the local references replaced."""
+    if isinstance(obj, dict):
+        ref = obj.get("$ref")
+        if not isinstance(ref, str):
+            return {
+                key: _inline_refs(value, root, resolving) for key, value in obj.items()
+            }
+        if not ref.startswith("#") or ref in resolving:
+            raise _UnsupportedRef(ref)
+
+        result = _inline_refs(
+            _resolve_pointer(root, ref),
+            root,
+            (*resolving, ref),
+        )
+        if isinstance(result, dict) and len(obj) > 1:
+            result.update(
+                (key, _inline_refs(value, root, resolving))
+                for key, value in obj.items()
+                if key != "$ref"
+            )
+        return result
+
+    if isinstance(obj, (list, tuple)):
+        return [_inline_refs(value, root, resolving) for value in obj]
+
+    if obj is None or isinstance(obj, (str, int, float)):
+        return obj
+
+    raise _UnsupportedRef(repr(obj))
+
+
 def remove_json_ref(data: t.Dict) -> t.Dict:
+    """
+    Replace the `$ref` pointers in a JSON schema with the referenced definitions.
+
+    Pydantic only emits references local to the schema, which are inlined
+    directly; anything else (remote or recursive references, values which
+    aren't JSON serialisable) is handed over to `jsonref`.
+    """
+    try:
+        return _inline_refs(data, data, ())
+    except _UnsupportedRef:
+        pass
+
     return json.loads(
         jsonref.dumps(
             jsonref.replace_refs(
@@ -71,6 +136,30 @@ class ExecuteResponse(BaseModel):
     """Execute action response."""
 
 
+class FileModel(BaseModel):
+    name: str = Field(
+        ...,
+        description="File name, contains extension to indetify the file type",
+    )
+    content: bytes = Field(
+        ...,
+        description="File content in base64",
+    )
+
+
+class ParameterPlan(t.NamedTuple):
+    """Pre-processing plan for the parameters of a request model."""
+
+    fields: t.FrozenSet[str]
+    """Names of all the request fields."""
+
+    file_readable: t.FrozenSet[str]
+    """Fields which accept a file path and are sent the file content."""
+
+    file_uploadable: t.FrozenSet[str]
+    """Fields which accept a file path and are sent as a `FileModel`."""
+
+
 class _Attributes:
     name: str
     """Name representation."""
@@ -94,6 +183,16 @@ class _Request(t.Generic[ModelType]):
     def __init__(self, model: t.Type[ModelType]) -> None:
         """Initialize request model."""
         self.model = model
+        self._plan: t.Optional[ParameterPlan] = None
+
+    @property
+    def plan(self) -> ParameterPlan:
+        """Parameter pre-processing plan, built once on first use."""
+        if self._plan is None:
+            self._plan = ActionBuilder.get_parameter_plan(
+                model=t.cast(t.Type[BaseModel], self.model)
+            )
+        return self._plan
 
     def schema(self) -> t.Dict:
         """Build request schema."""
@@ -228,6 +327,30 @@ class ActionBuilder:
         setattr(obj, "request", _Request(request))
         setattr(obj, "response", _Response(response))
 
+    @staticmethod
+    def get_parameter_plan(model: t.Type[BaseModel]) -> ParameterPlan:
+        """Find the request fields which need to be pre-processed."""
+        properties = model.model_json_schema().get("properties", {})
+        file_properties = FileModel.model_json_schema().get("properties")
+        file_readable, file_uploadable = set(), set()
+        for name, field in model.model_fields.items():
+            extra = field.json_schema_extra
+            if isinstance(extra, dict) and extra.get("file_readable", False):
+                file_readable.add(name)
+
+            prop = properties.get(name, {})
+            if (
+                prop.get("allOf", [{}])[0].get("properties", {})
+                or prop.get("properties", {})
+            ) == file_properties:
+                file_uploadable.add(name)
+
+        return ParameterPlan(
+            fields=frozenset(model.model_fields),
+            file_readable=frozenset(file_readable),
+            file_uploadable=frozenset(file_uploadable),
+        )
+
     @staticmethod
     def validate(name: str, obj: t.Type["Action"]) -> None:
         if getattr(getattr(obj, "execute"), "__isabstractmethod__", False):
@@ -335,9 +458,9 @@ class Action(
         return cls._tags or []
 
     @classmethod
-    def _generate_schema(cls) -> None:
-        """Generate action schema."""
-        cls._schema = {
+    def compile_schema(cls) -> t.Dict:
+        """Build the action schema from the request and response models."""
+        return {
             "name": cls.name,
             "enum": cls.enum,
             "appName": cls.tool,
@@ -349,6 +472,11 @@ class Action(
             "description": cls.description,
         }
 
+    @classmethod
+    def _generate_schema(cls) -> None:
+        """Generate action schema."""
+        cls._schema = cls.compile_schema()
+
     @classmethod
     def schema(cls) -> t.Dict:
         """Action schema."""
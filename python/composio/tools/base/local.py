@@ -1,35 +1,24 @@
 """Tool abstractions."""
 
-import base64
+import copy
 import os
 import traceback
 import typing as t
 from abc import abstractmethod
-from pathlib import Path
-
-from pydantic import BaseModel, Field
 
 from composio.tools.base.abs import (
     Action,
     ActionRequest,
     ActionResponse,
     InvalidClassDefinition,
+    ParameterPlan,
     Tool,
     ToolBuilder,
 )
 from composio.tools.base.exceptions import ExecutionFailed
 from composio.tools.env.host.workspace import Browsers, FileManagers, Shells
-
-
-class FileModel(BaseModel):
-    name: str = Field(
-        ...,
-        description="File name, contains extension to indetify the file type",
-    )
-    content: bytes = Field(
-        ...,
-        description="File content in base64",
-    )
+from composio.tools.local.manifest import get_manifest
+from composio.utils.files import FileContent
 
 
 class LocalAction(  # pylint: disable=abstract-method
@@ -54,6 +43,18 @@ class LocalAction(  # pylint: disable=abstract-method
     def filemanagers(self) -> FileManagers:
         return self._filemanagers()
 
+    @classmethod
+    def _generate_schema(cls) -> None:
+        """Use the schema compiled into the manifest for the built-in actions."""
+        if cls.__module__.startswith("composio.tools.local."):
+            manifest = get_manifest()
+            tool = manifest["actions"].get(cls.enum)
+            if tool is not None:
+                schema = manifest["tools"][tool]["actions"][cls.enum]["schema"]
+                cls._schema = copy.deepcopy(schema)
+                return
+        super()._generate_schema()
+
 
 class LocalToolMeta(type):
     """Tool metaclass."""
@@ -99,44 +100,30 @@ class LocalToolMixin(Tool):
         """Get collection of actions for the tool."""
 
     @classmethod
-    def _check_file_uploadable(cls, param: str, model: BaseModel) -> bool:
-        return (
-            model.model_json_schema()
-            .get("properties", {})
-            .get(param, {})
-            .get("allOf", [{}])[0]
-            .get("properties", {})
-            or model.model_json_schema()
-            .get("properties", {})
-            .get(param, {})
-            .get("properties", {})
-        ) == FileModel.model_json_schema().get("properties")
-
-    @classmethod
-    def _process_request(cls, request: t.Dict, model: BaseModel) -> t.Dict:
+    def _process_request(cls, request: t.Dict, plan: ParameterPlan) -> t.Dict:
         """Pre-process request for execution."""
         modified_request_data: t.Dict[str, t.Union[str, t.Dict[str, str]]] = {}
         for param, value in request.items():
-            annotations = t.cast(t.Dict, model.model_fields[param].json_schema_extra)
-            file_readable = (annotations or {}).get("file_readable", False)
-            if file_readable and isinstance(value, str) and os.path.isfile(value):
-                _content = Path(value).read_bytes()
-                try:
-                    _decoded = _content.decode("utf-8")
-                except UnicodeDecodeError:
-                    _decoded = base64.b64encode(_content).decode("utf-8")
-                modified_request_data[param] = _decoded
+            if param not in plan.fields:
+                raise KeyError(param)
+
+            if (
+                param in plan.file_readable
+                and isinstance(value, str)
+                and os.path.isfile(value)
+            ):
+                # Read as text if the file is valid UTF-8, base64 otherwise
+                modified_request_data[param] = FileContent(path=value).read()
                 continue
 
             if (
-                cls._check_file_uploadable(param=param, model=model)
+                param in plan.file_uploadable
                 and isinstance(value, str)
                 and os.path.isfile(value)
             ):
-                _content = Path(value).read_bytes()
                 modified_request_data[param] = {
                     "name": os.path.basename(value),
-                    "content": base64.b64encode(_content).decode("utf-8"),
+                    "content": FileContent(path=value, binary=True).read(),
                 }
                 continue
             modified_request_data[param] = value
@@ -171,7 +158,7 @@ class LocalToolMixin(Tool):
                 request=actcls.request.parse(  # type: ignore
                     request=self._process_request(
                         request=params,
-                        model=actcls.request.model,  # type: ignore
+                        plan=actcls.request.plan,  # type: ignore
                     )
                 ),
                 metadata=metadata,
@@ -1,17 +1,24 @@
 """Tool abstractions."""
 
+import enum
+import hashlib
 import inspect
+import json
 import typing as t
 from abc import abstractmethod
+from pathlib import Path
 
 import inflection
+import pydantic
 import typing_extensions as te
 from pydantic import BaseModel, Field
 
 from composio import Composio
+from composio.__version__ import __version__
 from composio.client.collections import ConnectedAccountModel, CustomAuthParameter
 from composio.client.enums.base import ActionData, SentinalObject, add_runtime_action
 from composio.client.exceptions import ComposioClientError
+from composio.constants import LOCAL_CACHE_DIRECTORY
 from composio.exceptions import ComposioSDKError
 from composio.tools.base.abs import (
     Action,
@@ -23,12 +30,25 @@ from composio.tools.base.abs import (
 from composio.tools.base.local import LocalToolMixin
 from composio.tools.env.host.shell import Shell
 from composio.tools.env.host.workspace import Browsers, FileManagers, Shells
+from composio.utils import fastjson
+from composio.utils.atomic import atomic_write
 
 
 if t.TYPE_CHECKING:
     from composio.tools.toolset import ComposioToolSet
 
 
+SCHEMA_CACHE_DIRECTORY = LOCAL_CACHE_DIRECTORY / "schemas"
+"""
+Directory for caching the compiled schemas of the runtime actions.
+"""
+
+SCHEMA_CACHE_FORMAT = 1
+"""
+Version of the cached schema layout, part of the cache key.
+"""
+
+
 class InvalidRuntimeAction(ComposioSDKError):
     """Raise when invalid action definition is found"""
 
@@ -77,6 +97,92 @@ class RuntimeAction(  # pylint: disable=abstract-method
     def filemanagers(self) -> FileManagers:
         return self._filemanagers()
 
+    @classmethod
+    def _generate_schema(cls) -> None:
+        """Load the schema from the disk cache, compile and cache it on a miss."""
+        key = _schema_cache_key(action=cls)
+        if key is None:
+            super()._generate_schema()
+            return
+
+        path = SCHEMA_CACHE_DIRECTORY / f"{key}.json"
+        try:
+            cls._schema = fastjson.loads(path.read_bytes())
+            return
+        except (OSError, ValueError):
+            pass
+
+        super()._generate_schema()
+        _write_cached_schema(path=path, schema=t.cast(t.Dict, cls._schema))
+
+
+def _source_files(*models: t.Type) -> t.Set[str]:
+    """Collect the files defining the given models and the types they use."""
+    files: t.Set[str] = set()
+    seen: t.Set[int] = set()
+    pending = list(models)
+    while pending:
+        obj = pending.pop()
+        if id(obj) in seen:
+            continue
+        seen.add(id(obj))
+        pending.extend(t.get_args(obj))
+        if not inspect.isclass(obj):
+            continue
+
+        if issubclass(obj, BaseModel):
+            for base in obj.__mro__:
+                if base is BaseModel:
+                    break
+                files.add(inspect.getfile(base))
+            pending.extend(field.annotation for field in obj.model_fields.values())
+        elif issubclass(obj, enum.Enum):
+            files.add(inspect.getfile(obj))
+    return files
+
+
+def _schema_cache_key(action: t.Type[RuntimeAction]) -> t.Optional[str]:
+    """
+    Build the disk cache key for a runtime action schema.
+
+    The key digests the sources of the files defining the action and the
+    models it uses, along with the action metadata, so the cache entry is
+    invalidated by any change to them. Actions defined outside of a source
+    file (eg. in a REPL) are not cached.
+    """
+    digest = hashlib.sha256()
+    digest.update(
+        json.dumps(
+            [
+                SCHEMA_CACHE_FORMAT,
+                __version__,
+                pydantic.VERSION,
+                action.tool,
+                action.name,
+                action.enum,
+                action.display_name,
+                action.description,
+                action.tags(),
+            ]
+        ).encode()
+    )
+    try:
+        files = _source_files(action.request.model, action.response.model)
+        for file in sorted({str(action.file), *files}):
+            digest.update(file.encode())
+            digest.update(Path(file).read_bytes())
+    except (OSError, TypeError):
+        return None
+    return digest.hexdigest()
+
+
+def _write_cached_schema(path: Path, schema: t.Dict) -> None:
+    """Write a schema to the disk cache, failures only cost a cache miss."""
+    try:
+        atomic_write(path, json.dumps(schema))
+    except (OSError, TypeError, ValueError):
+        pass
+
 
 class RuntimeToolMeta(type):
     """Tool metaclass."""
@@ -257,31 +363,21 @@ def _get_connected_account(
     app: str, entity_id: str
 ) -> t.Optional[ConnectedAccountModel]:
     try:
-        client = Composio.get_latest()
-        connected_account = client.connected_accounts.get(
-            connection_id=client.get_entity(entity_id).get_connection(app=app).id
+        entity = Composio.get_latest().get_entity(entity_id)
+        # Both lookups are served from the connected account cache when warm
+        return entity.get_connection(
+            connected_account_id=entity.get_connection(app=app).id
         )
-        return connected_account
     except ComposioClientError:
         return None
 
 
 def _get_auth_params(app: str, metadata: t.Dict) -> t.Dict:
-    try:
-        client = Composio.get_latest()
-        connected_account = client.connected_accounts.get(
-            connection_id=client.get_entity(metadata["entity_id"])
-            .get_connection(app=app)
-            .id
-        )
-        connection_params = connected_account.connectionParams
-        return {
-            "entity_id": metadata["entity_id"],
-            "headers": connection_params.headers,
-            "base_url": connection_params.base_url,
-            "query_params": connection_params.queryParams,
-        }
-    except ComposioClientError:
+    connected_account = _get_connected_account(
+        app=app,
+        entity_id=metadata["entity_id"],
+    )
+    if connected_account is None:
         return {
             "entity_id": metadata["entity_id"],
             "subdomain": metadata.pop("subdomain", {}),
@@ -293,6 +389,14 @@ def _get_auth_params(app: str, metadata: t.Dict) -> t.Dict:
             **metadata,
         }
 
+    connection_params = connected_account.connectionParams
+    return {
+        "entity_id": metadata["entity_id"],
+        "headers": connection_params.headers,
+        "base_url": connection_params.base_url,
+        "query_params": connection_params.queryParams,
+    }
+
 
 def _build_executable_from_args(  # pylint: disable=too-many-statements
     f: t.Callable,
@@ -0,0 +1,413 @@
+"""
+Opt-in cache for the results of read-only actions.
+
+Caching is configured per action, tag or app with a `CachePolicy`. Actions
+which resolve to a policy are treated as read-only and their successful
+results are reused until they expire, executing any other action of the same
+app drops the cached results of that app, since it may have changed what the
+read-only actions return. Apps without cached results are skipped, so actions
+which are not cached only pay for a lookup.
+"""
+
+import copy
+import hashlib
+import json
+import shutil
+import threading
+import time
+import typing as t
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import typing_extensions as te
+
+from composio.client.enums import Action, ActionType, AppType
+from composio.client.metrics import MetricsCollector
+from composio.constants import LOCAL_CACHE_DIRECTORY
+from composio.utils import fastjson
+from composio.utils.atomic import atomic_write
+from composio.utils.logging import get as get_logger
+
+
+RESULT_CACHE_DIRECTORY = LOCAL_CACHE_DIRECTORY / "results"
+"""
+Directory for the results cached by policies using the `disk` backend.
+"""
+
+DEFAULT_RESULT_CACHE_TTL = 300.0
+
+
+@dataclass(frozen=True)
+class CachePolicy:
+    """Caching policy for the results of read-only actions."""
+
+    ttl: float = DEFAULT_RESULT_CACHE_TTL
+    "Number of seconds a result is reused for."
+
+    maxsize: int = 256
+    "Maximum number of results, the least recently used ones are dropped first."
+
+    backend: te.Literal["memory", "disk"] = "memory"
+    """
+    Where results are stored, `disk` results are shared with other processes
+    using the same cache directory.
+    """
+
+
+class ResultCachePolicies(te.TypedDict):
+    """Result caching policies, looked up by action, then tag, then app."""
+
+    actions: te.NotRequired[t.Dict[ActionType, CachePolicy]]
+    "Policies for single actions."
+
+    tags: te.NotRequired[t.Dict[str, CachePolicy]]
+    "Policies for the actions having a tag."
+
+    apps: te.NotRequired[t.Dict[AppType, CachePolicy]]
+    "Policies for all of the actions of an app."
+
+
+def _slug(key: t.Any) -> str:
+    if hasattr(key, "sentinel"):  # Runtime action class
+        return str(key.enum).upper()
+    return str(key).upper()
+
+
+def _is_successful(response: t.Any) -> bool:
+    return (
+        isinstance(response, dict)
+        and not response.get("error")
+        and bool(response.get("successful", response.get("successfull")))
+    )
+
+
+@dataclass
+class _MemoryStore:
+    maxsize: int
+    entries: "OrderedDict[str, t.Tuple[str, float, t.Dict]]" = field(
+        default_factory=OrderedDict
+    )
+    apps: t.Dict[str, int] = field(default_factory=dict)
+    "Number of entries per app, to skip invalidating apps without entries."
+
+    def _drop(self, key: str) -> None:
+        app = self.entries.pop(key)[0]
+        self.apps[app] -= 1
+        if self.apps[app] == 0:
+            del self.apps[app]
+
+    def get(
+        self,
+        key: str,
+        app: str,  # pylint: disable=unused-argument
+    ) -> t.Optional[t.Dict]:
+        entry = self.entries.get(key)
+        if entry is None:
+            return None
+        if time.monotonic() >= entry[1]:
+            self._drop(key)
+            return None
+        self.entries.move_to_end(key)
+        return copy.deepcopy(entry[2])
+
+    def set(self, key: str, app: str, ttl: float, response: t.Dict) -> None:
+        if key not in self.entries:
+            self.apps[app] = self.apps.get(app, 0) + 1
+        self.entries[key] = (app, time.monotonic() + ttl, copy.deepcopy(response))
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.maxsize:
+            self._drop(next(iter(self.entries)))
+
+    def invalidate(self, app: str) -> bool:
+        if app not in self.apps:
+            return False
+        for key in [key for key, entry in self.entries.items() if entry[0] == app]:
+            self._drop(key)
+        return True
+
+
+@dataclass
+class _DiskStore:
+    """
+    Results stored as `<path>/<app>/<key>.json` files, the modification time
+    of a file is the last time it was used.
+
+    The number of files is tracked to avoid listing the directory on every
+    write, once it's over `maxsize` the least recently used files are removed
+    until 90% of `maxsize` is left. Other processes write to the same
+    directory, so the count is an estimate which is corrected by evictions.
+    """
+
+    path: Path
+    maxsize: int
+    count: t.Optional[int] = None
+
+    def _files(self) -> t.List[t.Tuple[float, Path]]:
+        files = []
+        for file in self.path.glob("*/*.json"):
+            try:
+                files.append((file.stat().st_mtime, file))
+            except OSError:
+                continue
+        return files
+
+    def get(self, key: str, app: str) -> t.Optional[t.Dict]:
+        file = self.path / app / f"{key}.json"
+        try:
+            entry = fastjson.loads(file.read_bytes())
+            if time.time() >= entry["expires_at"]:
+                file.unlink(missing_ok=True)
+                return None
+            file.touch()
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+        return entry["response"]
+
+    def set(self, key: str, app: str, ttl: float, response: t.Dict) -> None:
+        try:
+            data = json.dumps({"expires_at": time.time() + ttl, "response": response})
+        except (TypeError, ValueError):
+            get_logger().debug(f"Not caching result of {key}, it's not serializable")
+            return
+
+        file = self.path / app / f"{key}.json"
+        if self.count is None:
+            self.count = len(self._files())
+        if not file.exists():
+            self.count += 1
+        atomic_write(file, data)
+        if self.count <= self.maxsize:
+            return
+
+        files = sorted(self._files())
+        keep = self.maxsize - self.maxsize // 10
+        for _, stale in files[: max(len(files) - keep, 0)]:
+            stale.unlink(missing_ok=True)
+        self.count = min(len(files), keep)
+
+    def invalidate(self, app: str) -> bool:
+        path = self.path / app
+        if not path.exists():
+            return False
+        shutil.rmtree(path, ignore_errors=True)
+        self.count = None
+        return True
+
+
+class ResultCache:
+    """
+    Cache for the results of read-only actions.
+
+    Results are keyed by the action, the request parameters, the entity and
+    the connected account used for the execution. They are stored as the
+    action returned them, before any response processors run. Hits, misses and
+    invalidations are logged at the debug level and counted, use `snapshot()`
+    to read the counts. Hits and misses are also recorded by the `metrics`
+    collector as lookups of the `results` cache.
+    """
+
+    def __init__(
+        self,
+        policies: ResultCachePolicies,
+        directory: Path = RESULT_CACHE_DIRECTORY,
+        metrics: t.Optional[MetricsCollector] = None,
+    ) -> None:
+        """
+        Initialize result cache.
+
+        :param policies: Caching policies for actions, tags and apps
+        :param directory: Directory for the results of `disk` policies
+        :param metrics: Collector to record the hits and misses with
+        """
+        self.directory = directory
+        self.metrics = metrics
+        self._policies = {
+            kind: {_slug(key): policy for key, policy in scoped.items()}
+            for kind, scoped in (
+                ("action", policies.get("actions", {})),
+                ("app", policies.get("apps", {})),
+            )
+        }
+        self._tag_policies = dict(policies.get("tags", {}))
+        # Other processes may cache results for any of these scopes
+        self._disk_scopes = {
+            f"{kind}-{key}": policy
+            for kind, scoped in (
+                ("action", self._policies["action"]),
+                ("tag", self._tag_policies),
+                ("app", self._policies["app"]),
+            )
+            for key, policy in scoped.items()
+            if policy.backend == "disk" and policy.ttl > 0
+        }
+        self._resolved: t.Dict[str, t.Optional[t.Tuple[str, CachePolicy]]] = {}
+        self._stores: t.Dict[str, t.Union[_MemoryStore, _DiskStore]] = {}
+        self._counts: t.Dict[str, t.Dict[str, int]] = {}
+        self._lock = threading.Lock()
+        self.logger = get_logger()
+
+    def _resolve(self, action: Action) -> t.Optional[t.Tuple[str, CachePolicy]]:
+        """Get the scope and policy of an action, `None` if it's not cached."""
+        if action.slug in self._resolved:
+            return self._resolved[action.slug]
+
+        resolved = None
+        if action.slug in self._policies["action"]:
+            resolved = f"action-{action.slug}", self._policies["action"][action.slug]
+        if resolved is None and self._tag_policies:
+            for tag in action.tags:
+                if tag in self._tag_policies:
+                    resolved = f"tag-{tag}", self._tag_policies[tag]
+                    break
+        if resolved is None and action.app.upper() in self._policies["app"]:
+            app = action.app.upper()
+            resolved = f"app-{app}", self._policies["app"][app]
+        if resolved is not None and resolved[1].ttl <= 0:
+            resolved = None
+
+        self._resolved[action.slug] = resolved
+        return resolved
+
+    def _store(
+        self,
+        scope: str,
+        policy: CachePolicy,
+    ) -> t.Union[_MemoryStore, _DiskStore]:
+        if scope not in self._stores:
+            self._stores[scope] = (
+                _DiskStore(path=self.directory / scope, maxsize=policy.maxsize)
+                if policy.backend == "disk"
+                else _MemoryStore(maxsize=policy.maxsize)
+            )
+        return self._stores[scope]
+
+    def _count(self, action: Action, event: str) -> None:
+        counts = self._counts.setdefault(
+            action.slug, {"hits": 0, "misses": 0, "invalidations": 0}
+        )
+        counts[event] += 1
+
+    @staticmethod
+    def key(
+        action: Action,
+        params: t.Dict,
+        entity_id: str,
+        connected_account_id: t.Optional[str],
+    ) -> str:
+        """Get the cache key for an execution."""
+        normalised = json.dumps(
+            [action.slug, params, entity_id, connected_account_id],
+            sort_keys=True,
+            separators=(",", ":"),
+            default=str,
+        )
+        return hashlib.sha256(normalised.encode("utf-8")).hexdigest()
+
+    def get(
+        self,
+        action: Action,
+        params: t.Dict,
+        entity_id: str,
+        connected_account_id: t.Optional[str] = None,
+    ) -> t.Optional[t.Dict]:
+        """
+        Get the cached result of an execution.
+
+        Executing an action without a policy drops the cached results of its
+        app, so this is expected to be called before every execution.
+
+        :return: Copy of the cached result, `None` on a miss or if the action
+            is not cached
+        """
+        resolved = self._resolve(action)
+        app = action.app.upper()
+        if resolved is None:
+            self.invalidate(app=app, action=action)
+            return None
+
+        scope, policy = resolved
+        key = self.key(action, params, entity_id, connected_account_id)
+        with self._lock:
+            response = self._store(scope, policy).get(key, app)
+            self._count(action, "misses" if response is None else "hits")
+
+        if self.metrics is not None:
+            self.metrics.observe_cache("results", hit=response is not None)
+        self.logger.debug(
+            "Result cache %s for `%s` (%s)",
+            "miss" if response is None else "hit",
+            action.slug,
+            scope,
+        )
+        return response
+
+    def set(
+        self,
+        action: Action,
+        params: t.Dict,
+        entity_id: str,
+        response: t.Dict,
+        connected_account_id: t.Optional[str] = None,
+    ) -> None:
+        """
+        Store the result of an execution if the action is cached and it
+        succeeded.
+
+        Executing an action without a policy drops the cached results of its
+        app again, since results of the app may have been cached while it
+        was running, so this is expected to be called after every execution.
+        """
+        resolved = self._resolve(action)
+        if resolved is None:
+            self.invalidate(app=action.app)
+            return
+        if not _is_successful(response):
+            return
+
+        scope, policy = resolved
+        key = self.key(action, params, entity_id, connected_account_id)
+        with self._lock:
+            self._store(scope, policy).set(
+                key=key,
+                app=action.app.upper(),
+                ttl=policy.ttl,
+                response=response,
+            )
+
+    def invalidate(self, app: str, action: t.Optional[Action] = None) -> None:
+        """
+        Drop the cached results of an app, nothing is done if the app has no
+        cached results.
+
+        :param app: App name
+        :param action: Action which caused the invalidation, for the counts
+        """
+        app = app.upper()
+        with self._lock:
+            stores = [
+                store
+                for store in self._stores.values()
+                if isinstance(store, _MemoryStore)
+            ]
+            stores += [
+                self._store(scope, policy)
+                for scope, policy in self._disk_scopes.items()
+            ]
+            if not any([store.invalidate(app) for store in stores]):
+                return
+            if action is not None:
+                self._count(action, "invalidations")
+        self.logger.debug("Result cache invalidated for `%s`", app)
+
+    def snapshot(self) -> t.Dict[str, t.Dict[str, int]]:
+        """
+        Get the cache counts.
+
+        :return: Dictionary mapping action names to their number of `hits`,
+            `misses` and `invalidations`
+        """
+        with self._lock:
+            return {
+                action: dict(counts) for action, counts in sorted(self._counts.items())
+            }
@@ -1,30 +1,73 @@
 import atexit
+import importlib
+import sys
 import threading
 import typing as t
 
 from composio.exceptions import ComposioSDKError
 from composio.tools.env.base import Workspace, WorkspaceConfigType
-from composio.tools.env.docker.workspace import Config as DockerWorkspaceConfig
-from composio.tools.env.docker.workspace import DockerWorkspace
-from composio.tools.env.e2b.workspace import Config as E2BWorkspaceConfig
-from composio.tools.env.e2b.workspace import E2BWorkspace
-from composio.tools.env.flyio.workspace import Config as FlyIOWorkspaceConfig
-from composio.tools.env.flyio.workspace import FlyIOWorkspace
 from composio.tools.env.host.workspace import Config as HostWorkspaceConfig
 from composio.tools.env.host.workspace import HostWorkspace
 from composio.utils.logging import get as get_logger
 
 
+if t.TYPE_CHECKING:
+    from composio.tools.env.docker.workspace import Config as DockerWorkspaceConfig
+    from composio.tools.env.e2b.workspace import Config as E2BWorkspaceConfig
+    from composio.tools.env.flyio.workspace import Config as FlyIOWorkspaceConfig
+
+
 WorkspaceTypeVar = t.TypeVar("WorkspaceTypeVar")
 
+_REMOTE_BACKENDS = {
+    "Docker": ("composio.tools.env.docker.workspace", "DockerWorkspace"),
+    "E2B": ("composio.tools.env.e2b.workspace", "E2BWorkspace"),
+    "FlyIO": ("composio.tools.env.flyio.workspace", "FlyIOWorkspace"),
+}
+"""
+Remote workspace backends, imported on first use since their SDKs are slow
+to import.
+"""
+
+_LAZY_ATTRIBUTES = {
+    name: (module, attribute)
+    for backend, (module, workspace) in _REMOTE_BACKENDS.items()
+    for name, attribute in (
+        (workspace, workspace),
+        (f"{backend}WorkspaceConfig", "Config"),
+    )
+}
+
+
+def __getattr__(name: str) -> t.Any:
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module, attribute = _LAZY_ATTRIBUTES[name]
+    return getattr(importlib.import_module(module), attribute)
+
+
+class _BackendConfig:
+    """Workspace config class attribute which imports the backend on access."""
+
+    def __init__(self, backend: str) -> None:
+        self.module, _ = _REMOTE_BACKENDS[backend]
+
+    def __get__(self, obj: t.Any, owner: t.Any) -> t.Any:
+        return importlib.import_module(self.module).Config
+
 
 class WorkspaceType:
     """Workspace execution environment."""
 
     Host = HostWorkspaceConfig
-    Docker = DockerWorkspaceConfig
-    FlyIO = FlyIOWorkspaceConfig
-    E2B = E2BWorkspaceConfig
+    if t.TYPE_CHECKING:
+        Docker = DockerWorkspaceConfig
+        FlyIO = FlyIOWorkspaceConfig
+        E2B = E2BWorkspaceConfig
+    else:
+        Docker = _BackendConfig("Docker")
+        FlyIO = _BackendConfig("FlyIO")
+        E2B = _BackendConfig("E2B")
 
 
 class WorkspaceTemplate:
@@ -37,7 +80,7 @@ class WorkspaceTemplate:
         environment: t.Optional[t.Dict[str, str]] = None,
         persistent: bool = False,
         ports: t.Optional[t.Dict[int, t.Any]] = None,
-    ) -> DockerWorkspaceConfig:
+    ) -> "DockerWorkspaceConfig":
         # Configure ports
         ports = ports or {}
         ports.update({5900: 5900, 8501: 8501, 6080: 6080})
@@ -46,7 +89,7 @@ class WorkspaceTemplate:
         environment = environment or {}
         environment["DISPLAY"] = ":1"
 
-        return DockerWorkspaceConfig(
+        return WorkspaceType.Docker(
             composio_api_key=composio_api_key,
             composio_base_url=composio_base_url,
             github_access_token=github_access_token,
@@ -88,14 +131,12 @@ class WorkspaceFactory:
         if isinstance(config, HostWorkspaceConfig):
             return HostWorkspace(config=config)
 
-        if isinstance(config, DockerWorkspaceConfig):
-            return DockerWorkspace(config=config)
-
-        if isinstance(config, E2BWorkspaceConfig):
-            return E2BWorkspace(config=config)
-
-        if isinstance(config, FlyIOWorkspaceConfig):
-            return FlyIOWorkspace(config=config)
+        # A config for a remote backend can only exist once its module has
+        # been imported, so there's no need to import the others
+        for module_name, workspace in _REMOTE_BACKENDS.values():
+            module = sys.modules.get(module_name)
+            if module is not None and isinstance(config, module.Config):
+                return getattr(module, workspace)(config=config)
 
         raise ValueError(f"Invalid workspace config: {config}")
 
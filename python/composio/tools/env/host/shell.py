@@ -9,13 +9,15 @@ import typing as t
 from abc import abstractmethod
 from pathlib import Path
 
-import paramiko
-
 from composio.tools.env.base import Sessionable
 from composio.tools.env.constants import ECHO_EXIT_CODE, EXIT_CODE, STDERR, STDOUT
 from composio.tools.env.id import generate_id
 
 
+if t.TYPE_CHECKING:
+    import paramiko
+
+
 _ANSI_ESCAPE = re.compile(
     rb"""
     \x1B
@@ -180,7 +182,7 @@ class SSHShell(Shell):
     """Interactive shell over SSH session."""
 
     def __init__(
-        self, client: paramiko.SSHClient, environment: t.Optional[t.Dict] = None
+        self, client: "paramiko.SSHClient", environment: t.Optional[t.Dict] = None
     ) -> None:
         """Initialize interactive shell."""
         super().__init__()
@@ -8,9 +8,7 @@ import sys
 import typing as t
 from dataclasses import dataclass
 
-import paramiko
 import typing_extensions as te
-from paramiko.ssh_exception import NoValidConnectionsError, SSHException
 
 from composio.client.enums import Action, ActionType, App, AppType, TagType
 from composio.exceptions import ComposioSDKError
@@ -20,6 +18,10 @@ from composio.tools.env.filemanager.manager import FileManager
 from composio.tools.env.host.shell import HostShell, SSHShell, Shell
 
 
+if t.TYPE_CHECKING:
+    import paramiko
+
+
 LOOPBACK_ADDRESS = "127.0.0.1"
 ENV_SSH_USERNAME = "_SSH_USERNAME"
 ENV_SSH_PASSWORD = "_SSH_PASSWORD"
@@ -66,7 +68,7 @@ class Config(WorkspaceConfigType):
 class HostWorkspace(Workspace):
     """Host workspace implementation."""
 
-    _ssh: t.Optional[paramiko.SSHClient] = None
+    _ssh: t.Optional["paramiko.SSHClient"] = None
 
     _shells: t.Optional[Shells] = None
     _browsers: t.Optional[Browsers] = None
@@ -89,6 +91,10 @@ class HostWorkspace(Workspace):
         self._is_ssh_client_set_up = False
 
     def _setup_ssh_client(self) -> None:
+        # pylint: disable=import-outside-toplevel
+        import paramiko
+        from paramiko.ssh_exception import NoValidConnectionsError, SSHException
+
         try:
             self.logger.debug(f"Setting up SSH client for workspace {self.id}")
             self._ssh = paramiko.SSHClient()
@@ -157,22 +163,27 @@ class HostWorkspace(Workspace):
         actions: t.Optional[t.Sequence[ActionType]] = None,
         tags: t.Optional[t.Sequence[TagType]] = None,
     ) -> None:
-        from composio.tools.base.abs import (  # pylint: disable=import-outside-toplevel
-            action_registry,
-            tool_registry,
+        # pylint: disable=import-outside-toplevel
+        from composio.tools.base.abs import action_registry
+        from composio.tools.local import (
+            get_manifest,
+            load_local_action,
+            load_local_tool,
         )
-        from composio.utils.pypi import (  # pylint: disable=import-outside-toplevel
+        from composio.utils.pypi import (
             add_package_to_installed_list,
             check_if_package_is_intalled,
         )
 
+        # pylint: enable=import-outside-toplevel
+
         missing: t.Dict[str, t.Set[str]] = {}
         apps = apps or []
         for app in map(App, apps):
             if not app.is_local:
                 continue
 
-            for dependency in tool_registry["local"][app.slug].requires or []:
+            for dependency in load_local_tool(app.slug).requires or []:
                 if check_if_package_is_intalled(dependency):
                     continue
                 if app.slug not in missing:
@@ -194,7 +205,7 @@ class HostWorkspace(Workspace):
             if not action.is_local or action.is_runtime:
                 continue
 
-            for dependency in action_registry["local"][action.slug].requires or []:
+            for dependency in load_local_action(action.slug).requires or []:
                 if check_if_package_is_intalled(dependency):
                     continue
                 if action.slug not in missing:
@@ -203,10 +214,11 @@ class HostWorkspace(Workspace):
 
         # TODO: Create CRUD object
         tags = tags or []
-        for action in map(Action, action_registry["local"]):
+        local_actions = {**get_manifest()["actions"], **action_registry["local"]}
+        for action in map(Action, local_actions):
             if not any(tag in action.tags for tag in tags):
                 continue
-            for dependency in action_registry["local"][action.slug].requires or []:
+            for dependency in load_local_action(action.slug).requires or []:
                 if check_if_package_is_intalled(dependency):
                     continue
                 if action.slug not in missing:
@@ -255,15 +267,15 @@ class HostWorkspace(Workspace):
         metadata: dict,
     ) -> t.Dict:
         """Execute action in host workspace."""
-        from composio.tools.local import (  # pylint: disable=import-outside-toplevel
-            load_local_tools,
-        )
+        # pylint: disable=import-outside-toplevel
+        from composio.tools.base.abs import tool_registry
+        from composio.tools.local import load_local_tool
 
-        registry = load_local_tools()
+        # pylint: enable=import-outside-toplevel
         tool = (
-            registry["runtime"][action.app]
+            tool_registry["runtime"][action.app]
             if action.is_runtime
-            else registry["local"][action.app]
+            else load_local_tool(action.app)
         )
         return tool.execute(
             action=action.slug,
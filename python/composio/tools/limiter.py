@@ -0,0 +1,278 @@
+"""
+Client-side rate and concurrency limits for action executions.
+
+Limits are configured per app with a `RateLimit`, optionally applied to every
+connected account of the app separately. Executions over the limits are
+queued locally instead of being sent and rejected with a 429 by the app.
+"""
+
+import asyncio
+import contextlib
+import threading
+import time
+import typing as t
+from dataclasses import dataclass, field
+
+from composio.client.enums import Action, AppType
+from composio.exceptions import RateLimitTimeoutError
+from composio.utils.logging import get as get_logger
+
+
+LIMIT_POLL_INTERVAL = 0.05
+"""
+Seconds to wait for between attempts to acquire a concurrency slot from an
+async execution.
+"""
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    """Rate and concurrency limit for the executions of an app."""
+
+    rate: t.Optional[float] = None
+    "Number of executions started per second, not limited if `None`."
+
+    burst: t.Optional[int] = None
+    "Number of executions which can start at once, defaults to `max(1, rate)`."
+
+    max_concurrency: t.Optional[int] = None
+    "Number of executions running at once, not limited if `None`."
+
+    per_connected_account: bool = False
+    "Apply the limit to every connected account of the app separately."
+
+    timeout: t.Optional[float] = None
+    """
+    Maximum number of seconds to wait for the limit, `RateLimitTimeoutError`
+    is raised if the wait would be longer. Wait indefinitely if `None`.
+    """
+
+
+@dataclass
+class LimitStats:
+    """Waits recorded for a limit."""
+
+    executions: int = 0
+    "Number of executions started."
+
+    waits: int = 0
+    "Number of executions which had to wait."
+
+    wait_time: float = 0.0
+    "Total seconds spent waiting."
+
+
+class _TokenBucket:
+    """
+    Token bucket handing out start times.
+
+    Tokens are reserved up front, so callers queue in order and can sleep for
+    the returned delay without holding a lock.
+    """
+
+    def __init__(self, rate: float, burst: int) -> None:
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self, timeout: t.Optional[float]) -> t.Optional[float]:
+        """Reserve a token, get the delay before using it or `None` on timeout."""
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(
+                self.burst, self.tokens + (now - self.updated) * self.rate
+            )
+            self.updated = now
+            delay = max(0.0, (1 - self.tokens) / self.rate)
+            if timeout is not None and delay > timeout:
+                return None
+            self.tokens -= 1
+            return delay
+
+
+@dataclass
+class _Limit:
+    name: str
+    config: RateLimit
+    bucket: t.Optional[_TokenBucket] = None
+    slots: t.Optional[threading.BoundedSemaphore] = None
+    stats: LimitStats = field(default_factory=LimitStats)
+
+    def __post_init__(self) -> None:
+        if self.config.rate is not None:
+            self.bucket = _TokenBucket(
+                rate=self.config.rate,
+                burst=self.config.burst or max(1, int(self.config.rate)),
+            )
+        if self.config.max_concurrency is not None:
+            self.slots = threading.BoundedSemaphore(max(self.config.max_concurrency, 1))
+
+
+class RateLimiter:
+    """
+    Rate and concurrency limiter for action executions.
+
+    Waits are logged, and counted along with the time spent waiting, use
+    `snapshot()` to read the counts.
+    """
+
+    def __init__(self, limits: t.Dict[AppType, RateLimit]) -> None:
+        """
+        Initialize rate limiter.
+
+        :param limits: Limits for the apps
+        """
+        self._config = {str(app).upper(): limit for app, limit in limits.items()}
+        self._limits: t.Dict[t.Tuple[str, t.Optional[str]], _Limit] = {}
+        self._lock = threading.Lock()
+        self.logger = get_logger()
+
+    def _get(
+        self,
+        action: Action,
+        connected_account_id: t.Optional[str],
+    ) -> t.Optional[_Limit]:
+        if not self._config:
+            return None
+
+        app = action.app.upper()
+        config = self._config.get(app)
+        if config is None:
+            return None
+
+        account = connected_account_id if config.per_connected_account else None
+        with self._lock:
+            limit = self._limits.get((app, account))
+            if limit is None:
+                limit = self._limits[(app, account)] = _Limit(
+                    name=app if account is None else f"{app}/{account}",
+                    config=config,
+                )
+            return limit
+
+    def _reserve(self, limit: _Limit, deadline: t.Optional[float]) -> float:
+        """Reserve a start time, get the number of seconds to wait for it."""
+        if limit.bucket is None:
+            return 0.0
+        delay = limit.bucket.reserve(
+            timeout=None if deadline is None else deadline - time.monotonic()
+        )
+        if delay is None:
+            raise RateLimitTimeoutError(limit=limit.name, timeout=limit.config.timeout)
+        return delay
+
+    def _record(self, limit: _Limit, waited: t.Optional[float]) -> None:
+        """Record an execution start, `waited` is `None` if it didn't wait."""
+        with self._lock:
+            limit.stats.executions += 1
+            if waited is not None:
+                limit.stats.waits += 1
+                limit.stats.wait_time += waited
+        if waited is not None:
+            self.logger.info(
+                "Waited %.2fs for the rate limit of `%s`", waited, limit.name
+            )
+
+    @staticmethod
+    def _deadline(limit: _Limit, started: float) -> t.Optional[float]:
+        if limit.config.timeout is None:
+            return None
+        return started + limit.config.timeout
+
+    @contextlib.contextmanager
+    def limit(
+        self,
+        action: Action,
+        connected_account_id: t.Optional[str] = None,
+    ) -> t.Iterator[None]:
+        """
+        Wait until the action can be executed and hold its concurrency slot.
+
+        :param action: Action being executed
+        :param connected_account_id: Connected account used for the execution
+        :raises RateLimitTimeoutError: If the wait would exceed the timeout
+        """
+        limit = self._get(action=action, connected_account_id=connected_account_id)
+        if limit is None:
+            yield
+            return
+
+        started = time.monotonic()
+        deadline = self._deadline(limit, started)
+        waited = False
+        if limit.slots is not None and not limit.slots.acquire(blocking=False):
+            waited = True
+            if not limit.slots.acquire(timeout=limit.config.timeout):
+                raise RateLimitTimeoutError(
+                    limit=limit.name, timeout=limit.config.timeout
+                )
+        try:
+            delay = self._reserve(limit, deadline)
+            if delay > 0:
+                waited = True
+                time.sleep(delay)
+            self._record(limit, time.monotonic() - started if waited else None)
+            yield
+        finally:
+            if limit.slots is not None:
+                limit.slots.release()
+
+    @contextlib.asynccontextmanager
+    async def alimit(
+        self,
+        action: Action,
+        connected_account_id: t.Optional[str] = None,
+    ) -> t.AsyncIterator[None]:
+        """
+        Same as `limit`, but waits without blocking the event loop.
+
+        :param action: Action being executed
+        :param connected_account_id: Connected account used for the execution
+        :raises RateLimitTimeoutError: If the wait would exceed the timeout
+        """
+        limit = self._get(action=action, connected_account_id=connected_account_id)
+        if limit is None:
+            yield
+            return
+
+        started = time.monotonic()
+        deadline = self._deadline(limit, started)
+        waited = False
+        if limit.slots is not None:
+            while not limit.slots.acquire(blocking=False):
+                waited = True
+                if deadline is not None and time.monotonic() >= deadline:
+                    raise RateLimitTimeoutError(
+                        limit=limit.name, timeout=limit.config.timeout
+                    )
+                await asyncio.sleep(LIMIT_POLL_INTERVAL)
+        try:
+            delay = self._reserve(limit, deadline)
+            if delay > 0:
+                waited = True
+                await asyncio.sleep(delay)
+            self._record(limit, time.monotonic() - started if waited else None)
+            yield
+        finally:
+            if limit.slots is not None:
+                limit.slots.release()
+
+    def snapshot(self) -> t.Dict[str, t.Dict[str, t.Any]]:
+        """
+        Get the recorded waits.
+
+        :return: Dictionary mapping the limits, named `<APP>` or
+            `<APP>/<connected account ID>`, to their `executions`, `waits`
+            and `wait_time`
+        """
+        with self._lock:
+            return {
+                limit.name: {
+                    "executions": limit.stats.executions,
+                    "waits": limit.stats.waits,
+                    "wait_time": limit.stats.wait_time,
+                }
+                for limit in sorted(self._limits.values(), key=lambda x: x.name)
+            }
@@ -1,20 +1,66 @@
 """Local tools."""
 
 import importlib
-from pathlib import Path
+import typing as t
 
-from composio.tools.base.abs import ToolRegistry, tool_registry
+from composio.tools.base.abs import (
+    Action,
+    Tool,
+    ToolRegistry,
+    action_registry,
+    tool_registry,
+)
+from composio.tools.local.manifest import TOOLS_PATH, get_manifest
 
 
-TOOLS_PATH = Path(__file__).parent
+__all__ = (
+    "TOOLS_PATH",
+    "get_manifest",
+    "load_local_action",
+    "load_local_tool",
+    "load_local_tools",
+)
 
+_all_loaded = False
+
+
+def load_local_tool(name: str) -> Tool:
+    """
+    Import the module defining a local tool and get the registered tool.
+
+    :param name: Tool enum, eg. `FILETOOL`
+    :return: Registered tool instance
+    """
+    name = name.upper()
+    if name not in tool_registry["local"]:
+        tool = get_manifest()["tools"].get(name)
+        if tool is None:
+            raise KeyError(f"No local tool found with name `{name}`")
+        importlib.import_module(tool["module"])
+    return tool_registry["local"][name]
 
-def load_local_tools() -> ToolRegistry:
-    for tooldef in TOOLS_PATH.glob("**/tool.py"):
-        importlib.import_module(
-            "composio.tools.local."
-            + ".".join(tooldef.relative_to(TOOLS_PATH).parent.parts)
-            + ".tool"
-        )
 
+def load_local_action(name: str) -> t.Type[Action]:
+    """
+    Import the module defining a local action and get the action class.
+
+    :param name: Action enum, eg. `FILETOOL_OPEN_FILE`
+    :return: Registered action class
+    """
+    name = name.upper()
+    if name not in action_registry["local"]:
+        tool = get_manifest()["actions"].get(name)
+        if tool is None:
+            raise KeyError(f"No local action found with name `{name}`")
+        load_local_tool(tool)
+    return action_registry["local"][name]
+
+
+def load_local_tools() -> ToolRegistry:
+    """Import all of the local tools listed in the manifest."""
+    global _all_loaded
+    if not _all_loaded:
+        for tool in get_manifest()["tools"].values():
+            importlib.import_module(tool["module"])
+        _all_loaded = True
     return tool_registry
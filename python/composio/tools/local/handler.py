@@ -1,9 +1,11 @@
+import copy
 import typing as t
 
 from composio.client.enums import Action, ActionType, App, AppType, Tag, TagType
 from composio.tools.base.abs import Action as LocalActionType
 from composio.tools.base.abs import Tool as LocalToolType
-from composio.tools.base.abs import action_registry
+from composio.tools.base.abs import action_registry, tool_registry
+from composio.tools.local.manifest import get_manifest
 from composio.utils.logging import WithLogger
 
 
@@ -34,16 +36,15 @@ class LocalClient(WithLogger):
         tags: t.Optional[t.Sequence[TagType]] = None,
     ) -> t.List[t.Dict]:
         """Get action schemas for given parameters."""
-        tools = cls.tools()
         apps = t.cast(t.List[App], [App(app) for app in apps or []])
         actions = t.cast(t.List[Action], [Action(action) for action in actions or []])
         action_schemas: t.List[t.Dict] = []
 
         for app in apps:
-            action_schemas += [action.schema() for action in tools[app.slug].actions()]
+            action_schemas += cls._get_tool_schemas(tool=app.slug)
 
         for action in actions:
-            action_schemas.append(action_registry["local"][action.slug].schema())
+            action_schemas.append(cls._get_action_schema(action=action.slug))
 
         if tags:
             tags = t.cast(t.List[str], [Tag(tag).value for tag in tags or []])
@@ -58,6 +59,34 @@ class LocalClient(WithLogger):
 
         return action_schemas
 
+    @staticmethod
+    def _get_tool_schemas(tool: str) -> t.List[t.Dict]:
+        """
+        Get the action schemas for a local tool.
+
+        Tools which are not imported yet are served from the precomputed
+        schemas in the manifest.
+        """
+        if tool in tool_registry["local"]:
+            schemas = [
+                action.schema() for action in tool_registry["local"][tool].actions()
+            ]
+        else:
+            manifest = get_manifest()["tools"][tool]
+            schemas = [action["schema"] for action in manifest["actions"].values()]
+        return copy.deepcopy(schemas)
+
+    @staticmethod
+    def _get_action_schema(action: str) -> t.Dict:
+        """Get the schema for a local action, see `_get_tool_schemas`."""
+        if action in action_registry["local"]:
+            schema = action_registry["local"][action].schema()
+        else:
+            manifest = get_manifest()
+            tool = manifest["tools"][manifest["actions"][action]]
+            schema = tool["actions"][action]["schema"]
+        return copy.deepcopy(schema)
+
 
 def add_runtime_action(name: str, cls: t.Type[LocalActionType]) -> None:
     """Add runtime action."""
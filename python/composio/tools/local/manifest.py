@@ -0,0 +1,151 @@
+"""
+Static manifest of the local tools.
+
+The manifest maps every local tool to the module defining it, along with the
+metadata and schemas of its actions. It is generated at build time, so tool
+lookups and schema listings don't need to import every tool module, and the
+action schemas are loaded as is instead of being built with pydantic.
+
+Regenerate it after changing a local tool with:
+
+    python scripts/local_tools_manifest.py
+"""
+
+import importlib
+import json
+import threading
+import typing as t
+from pathlib import Path
+
+import typing_extensions as te
+
+from composio.utils import fastjson
+from composio.utils.logging import get as get_logger
+
+
+TOOLS_PATH = Path(__file__).parent
+
+MANIFEST_PATH = TOOLS_PATH / "manifest.json"
+"""
+Path to the manifest shipped with the package.
+"""
+
+MANIFEST_FORMAT = 1
+"""
+Version of the manifest layout, manifests in other formats are ignored.
+"""
+
+
+class ActionManifest(te.TypedDict):
+    """Local action entry."""
+
+    name: str
+    tags: t.List[str]
+    no_auth: bool
+    requires: t.List[str]
+    schema: t.Dict[str, t.Any]
+
+
+class ToolManifest(te.TypedDict):
+    """Local tool entry."""
+
+    name: str
+    module: str
+    display_name: str
+    description: str
+    requires: t.List[str]
+    actions: t.Dict[str, ActionManifest]
+
+
+class Manifest(te.TypedDict):
+    """Local tools manifest."""
+
+    format: int
+    tools: t.Dict[str, ToolManifest]
+    actions: t.Dict[str, str]
+    """Maps action enums to the enum of the tool they belong to."""
+
+
+def discover_tool_modules() -> t.List[str]:
+    """Find the modules defining local tools by scanning the package."""
+    return sorted(
+        "composio.tools.local."
+        + ".".join(tooldef.relative_to(TOOLS_PATH).parent.parts)
+        + ".tool"
+        for tooldef in TOOLS_PATH.glob("**/tool.py")
+    )
+
+
+def generate_manifest() -> Manifest:
+    """Import every local tool module and build the manifest from the registry."""
+    # pylint: disable=import-outside-toplevel
+    from composio.tools.base.abs import tool_registry
+
+    for module in discover_tool_modules():
+        importlib.import_module(module)
+
+    manifest = Manifest(format=MANIFEST_FORMAT, tools={}, actions={})
+    for enum, tool in sorted(tool_registry["local"].items()):
+        actions = {}
+        for action in tool.actions():
+            actions[action.enum] = ActionManifest(
+                name=action.name,
+                tags=list(action.tags()),
+                no_auth=action.no_auth,
+                requires=sorted(action.requires or []),
+                schema=action.compile_schema(),
+            )
+            manifest["actions"][action.enum] = enum
+
+        manifest["tools"][enum] = ToolManifest(
+            name=tool.name,
+            module=type(tool).__module__,
+            display_name=tool.display_name,
+            description=tool.description,
+            requires=sorted(tool.requires or []),
+            actions=actions,
+        )
+    return manifest
+
+
+def write_manifest(path: Path = MANIFEST_PATH) -> Manifest:
+    """Generate the manifest and write it to `path`."""
+    manifest = generate_manifest()
+    path.write_text(
+        json.dumps(manifest, indent=2, sort_keys=True) + "\n",
+        encoding="utf-8",
+    )
+    return manifest
+
+
+def read_manifest(path: Path = MANIFEST_PATH) -> t.Optional[Manifest]:
+    """Read a manifest, `None` if it's missing or in another format."""
+    try:
+        manifest = fastjson.loads(path.read_bytes())
+    except (OSError, ValueError):
+        return None
+
+    if manifest.get("format") != MANIFEST_FORMAT:
+        return None
+    return t.cast(Manifest, manifest)
+
+
+_manifest: t.Optional[Manifest] = None
+_manifest_lock = threading.Lock()
+
+
+def get_manifest() -> Manifest:
+    """
+    Get the local tools manifest.
+
+    The shipped manifest is used when it's available, otherwise it is
+    generated once per process by importing the tools.
+    """
+    global _manifest
+    with _manifest_lock:
+        if _manifest is None:
+            _manifest = read_manifest()
+            if _manifest is None:
+                get_logger().debug("Local tools manifest is missing, generating it")
+                _manifest = generate_manifest()
+        return _manifest
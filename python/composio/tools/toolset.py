@@ -2,16 +2,18 @@
 Composio SDK tools.
 """
 
-import base64
+import asyncio
 import binascii
 import hashlib
 import itertools
 import json
 import os
+import threading
 import time
 import typing as t
 import uuid
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from functools import wraps
 from importlib.util import find_spec
@@ -21,7 +23,8 @@ import typing_extensions as te
 from pydantic import BaseModel
 
 from composio import Action, ActionType, App, AppType, TagType
-from composio.client import Composio, Entity
+from composio.client import AsyncComposio, Composio, Entity
+from composio.client.cache import ActionSchemasCache, action_schema_cache, client_scope
 from composio.client.collections import (
     AUTH_SCHEMES,
     ActionModel,
@@ -35,7 +38,6 @@ from composio.client.collections import (
     CustomAuthObject,
     CustomAuthParameter,
     ExpectedFieldInput,
-    FileType,
     IntegrationModel,
     SuccessExecuteActionResponseModel,
     TriggerModel,
@@ -43,7 +45,9 @@ from composio.client.collections import (
 )
 from composio.client.enums import TriggerType
 from composio.client.enums.base import EnumStringNotFound
+from composio.client.enums.store import get_enum_store
 from composio.client.exceptions import ComposioClientError, HTTPError, NoItemsFound
+from composio.client.metrics import MetricsCollector
 from composio.client.utils import check_cache_refresh
 from composio.constants import (
     DEFAULT_ENTITY_ID,
@@ -56,16 +60,19 @@ from composio.exceptions import ApiKeyNotProvidedError, ComposioSDKError
 from composio.storage.user import UserData
 from composio.tools.base.abs import tool_registry
 from composio.tools.base.local import LocalAction
+from composio.tools.cache import ResultCache, ResultCachePolicies
 from composio.tools.env.base import (
     ENV_GITHUB_ACCESS_TOKEN,
     Workspace,
     WorkspaceConfigType,
 )
 from composio.tools.env.factory import HostWorkspaceConfig, WorkspaceFactory
-from composio.tools.local import load_local_tools
+from composio.tools.limiter import RateLimit, RateLimiter
+from composio.tools.local import get_manifest
 from composio.tools.local.handler import LocalClient
 from composio.utils import help_msg
 from composio.utils.enums import get_enum_key
+from composio.utils.files import write_base64
 from composio.utils.logging import LogIngester, LogLevel, WithLogger
 from composio.utils.url import get_api_url_base
 
@@ -82,6 +89,9 @@ ProcessorType = te.Literal["pre", "post", "schema"]
 
 _IS_CI: t.Optional[bool] = None
 
+DEFAULT_MAX_CONCURRENCY = 10
+"""Default number of actions executed in parallel by `execute_actions`."""
+
 
 class IntegrationParams(te.TypedDict):
 
@@ -103,6 +113,28 @@ class ProcessorsType(te.TypedDict):
     """Schema processors"""
 
 
+class ActionCall(te.TypedDict):
+    """Action call for `ComposioToolSet.execute_actions`."""
+
+    action: ActionType
+    """Action to execute."""
+
+    params: t.Dict
+    """The parameters to pass to the action."""
+
+    metadata: te.NotRequired[t.Optional[t.Dict]]
+    """Metadata for executing local action."""
+
+    entity_id: te.NotRequired[t.Optional[str]]
+    """The ID of the entity to execute the action on."""
+
+    connected_account_id: te.NotRequired[t.Optional[str]]
+    """Connection ID for executing the remote action."""
+
+    text: te.NotRequired[t.Optional[str]]
+    """Extra text to use for generating function calling metadata."""
+
+
 def _check_agentops() -> bool:
     """Check if AgentOps is installed and initialized."""
     if find_spec("agentops") is None:
@@ -132,6 +164,13 @@ def _record_action_if_available(func: t.Callable[P, T]) -> t.Callable[P, T]:
     return wrapper  # type: ignore
 
 
+def _processor_key(key: _KeyType) -> str:
+    """Normalise an app or action used as a processor key to its slug."""
+    if hasattr(key, "sentinel"):  # Runtime action class
+        return str(key.enum).upper()  # type: ignore
+    return str(key).upper()
+
+
 class _Retry:
     """Sentinel value to indicate that the processor should retry the action"""
 
@@ -146,6 +185,7 @@ class ComposioToolSet(WithLogger):  # pylint: disable=too-many-public-methods
 
     _connected_accounts: t.Optional[t.List[ConnectedAccountModel]] = None
     _remote_client: t.Optional[Composio] = None
+    _async_remote_client: t.Optional[AsyncComposio] = None
     _workspace: t.Optional[Workspace] = None
 
     _runtime: str = "composio"
@@ -198,6 +238,10 @@ class ComposioToolSet(WithLogger):  # pylint: disable=too-many-public-methods
         connected_account_ids: t.Optional[t.Dict[AppType, str]] = None,
         *,
         max_retries: int = 3,
+        connected_account_validation: te.Literal["eager", "lazy"] = "eager",
+        result_cache: t.Optional[ResultCachePolicies] = None,
+        rate_limits: t.Optional[t.Dict[AppType, RateLimit]] = None,
+        metrics: t.Optional[MetricsCollector] = None,
         **kwargs: t.Any,
     ) -> None:
         """
@@ -271,6 +315,47 @@ class ComposioToolSet(WithLogger):  # pylint: disable=too-many-public-methods
             be printed on the console.
         :param connection_ids: Use this to define connection IDs to use when executing
             an action for a specific app.
+        :param connected_account_validation: When to validate `connected_account_ids`,
+            `eager` validates all of them concurrently when the toolset is created,
+            `lazy` validates the account for an app when it's first used and
+            doesn't set up the API client until then.
+        :param result_cache: Policies for caching the results of read-only
+            actions, caching is disabled by default. Actions which resolve to a
+            policy by action, tag or app are treated as read-only, executing
+            any other action of the same app drops the cached results of the app.
+
+            ```python
+            toolset = ComposioToolSet(
+                ...,
+                result_cache={
+                    "actions": {
+                        Action.GITHUB_GET_A_REPOSITORY: CachePolicy(ttl=600),
+                    },
+                    "apps": {
+                        App.HACKERNEWS: CachePolicy(ttl=60, backend="disk"),
+                    },
+                },
+            )
+            ```
+        :param rate_limits: Client-side rate and concurrency limits for the
+            executions of an app, executions over the limits wait locally
+            instead of being rejected by the app. Waits are logged and counted,
+            see `rate_limiter.snapshot()`.
+
+            ```python
+            toolset = ComposioToolSet(
+                ...,
+                rate_limits={
+                    App.SLACK: RateLimit(rate=1, burst=5),
+                    App.GITHUB: RateLimit(
+                        max_concurrency=4,
+                        per_connected_account=True,
+                    ),
+                },
+            )
+            ```
+        :param metrics: Collector for the metrics of the API requests made by
+            the toolset and the hits and misses of the result cache.
         """
         super().__init__(
             logging_level=logging_level,
@@ -306,24 +391,39 @@ class ComposioToolSet(WithLogger):  # pylint: disable=too-many-public-methods
             self._processors: ProcessorsType = processors
         else:
             self._processors = {"post": {}, "pre": {}, "schema": {}}
+        self._compile_processors()
 
         self._metadata = metadata or {}
         self._workspace_id = workspace_id
         self._workspace_config = workspace_config
         self._local_client = LocalClient()
         self._custom_auth = {}
+        self._action_schemas_cache = ActionSchemasCache(ttl=action_schema_cache.ttl)
+        self.metrics = metrics
+        self.result_cache = (
+            ResultCache(policies=result_cache, metrics=metrics)
+            if result_cache is not None
+            else None
+        )
+        self.rate_limiter = RateLimiter(limits=rate_limits or {})
 
         if len(kwargs) > 0:
             self.logger.warning(
                 f"Unused kwargs while initializing toolset: {kwargs}" + help_msg()
             )
 
-        self.logger.debug("Loading local tools")
-        load_local_tools()
-
-        self._connected_account_ids = self._validating_connection_ids(
-            connected_account_ids=connected_account_ids or {}
-        )
+        self._connected_account_ids = {
+            App(app): connected_account_id
+            for app, connected_account_id in (connected_account_ids or {}).items()
+        }
+        self._unvalidated_connected_account_ids: t.Set[App] = set()
+        self._validation_lock = threading.Lock()
+        if connected_account_validation == "lazy":
+            self._unvalidated_connected_account_ids.update(self._connected_account_ids)
+        else:
+            self._validating_connection_ids(
+                connected_account_ids=self._connected_account_ids
+            )
         self.max_retries = max_retries
 
         # To be populated by get_tools(), from within subclasses like
@@ -332,30 +432,65 @@ class ComposioToolSet(WithLogger):  # pylint: disable=too-many-public-methods
 
     def _validating_connection_ids(
         self,
-        connected_account_ids: t.Dict[AppType, str],
+        connected_account_ids: t.Dict[App, str],
     ) -> t.Dict[App, str]:
-        """Validate connection IDs."""
-        valid = {}
-        invalid = []
+        """Validate connection IDs concurrently."""
+        if len(connected_account_ids) == 0:
+            return {}
         entity = self.client.get_entity(id=self.entity_id)
-        for app, connected_account_id in connected_account_ids.items():
+
+        # Validate the API key once before fanning out
+        _ = self.client.api_key
+
+        def _validate(item: t.Tuple[App, str]) -> t.Optional[t.Tuple[str, str]]:
+            app, connected_account_id = item
             self.logger.debug(f"Validating {app} {connected_account_id=}")
             try:
+                # Populates the connected account cache for later lookups
                 entity.get_connection(
                     app=app,
                     connected_account_id=connected_account_id,
                 )
-                valid[App(app)] = connected_account_id
+                return None
             except HTTPError:
-                invalid.append((str(app), connected_account_id))
+                return str(app), connected_account_id
+
+        with ThreadPoolExecutor(
+            max_workers=min(DEFAULT_MAX_CONCURRENCY, len(connected_account_ids)),
+            thread_name_prefix="composio-validate",
+        ) as executor:
+            invalid = [
+                result
+                for result in executor.map(_validate, connected_account_ids.items())
+                if result is not None
+            ]
 
         if len(invalid) == 0:
-            return valid
+            return connected_account_ids
 
         raise ComposioSDKError(message=f"Invalid connected accounts found: {invalid}")
 
     def _get_connected_account(self, action: ActionType) -> t.Optional[str]:
-        return self._connected_account_ids.get(App(Action(action).app))
+        """
+        Get the connected account configured for the app of the action.
+
+        In lazy validation mode the account is validated on first use, this
+        makes blocking requests, async callers run it in a worker thread.
+        """
+        app = App(Action(action).app)
+        connected_account_id = self._connected_account_ids.get(app)
+        if (
+            connected_account_id is not None
+            and app in self._unvalidated_connected_account_ids
+        ):
+            # Concurrent executions validate the account only once
+            with self._validation_lock:
+                if app in self._unvalidated_connected_account_ids:
+                    self._validating_connection_ids(
+                        connected_account_ids={app: connected_account_id}
+                    )
+                    self._unvalidated_connected_account_ids.discard(app)
+        return connected_account_id
 
     def _try_get_github_access_token_for_current_entity(self) -> t.Optional[str]:
         """Try and get github access token for current entiry."""
@@ -366,14 +501,16 @@ class ComposioToolSet(WithLogger):  # pylint: disable=too-many-public-methods
 
         self.logger.debug(f"Trying to get github access token for {self.entity_id=}")
         try:
-            account = self.client.get_entity(id=self.entity_id).get_connection(
-                app=App.GITHUB
-            )
-            token = (
-                self.client.connected_accounts.get(connection_id=account.id)
-                .connectionParams.headers["Authorization"]  # type: ignore
-                .replace("Bearer ", "")
-            )
+            entity = self.client.get_entity(id=self.entity_id)
+            account = entity.get_connection(app=App.GITHUB)
+            if account is None:
+                return None
+            connection = entity.get_connection(connected_account_id=account.id)
+            if connection is None:
+                return None
+            token = connection.connectionParams.headers[  # type: ignore
+                "Authorization"
+            ].replace("Bearer ", "")
             self.logger.debug(
                 f"Using `{token}` with scopes: {account.connectionParams.scope}"
             )
@@ -400,12 +537,27 @@ class ComposioToolSet(WithLogger):  # pylint: disable=too-many-public-methods
                 api_key=self._api_key,
                 base_url=self._base_url,
                 runtime=self._runtime,
+                request_hooks=[self.metrics] if self.metrics is not None else None,
             )
             check_cache_refresh(self._remote_client)
 
         self._remote_client.local = self._local_client
         return self._remote_client
 
+    @property
+    def async_client(self) -> AsyncComposio:
+        """Client for executing remote actions from an event loop."""
+        if self._async_remote_client is None:
+            self._async_remote_client = AsyncComposio(
+                api_key=self._api_key,
+                base_url=self._base_url,
+                runtime=self._runtime,
+                request_hooks=[self.metrics] if self.metrics is not None else None,
+            )
+
+        self._async_remote_client.local = self._local_client
+        return self._async_remote_client
+
     @property
     def workspace(self) -> Workspace:
         """Workspace for this toolset instance."""
@@ -482,6 +634,22 @@ class ComposioToolSet(WithLogger):  # pylint: disable=too-many-public-methods
                 f"Run `composio add {action.app.lower()}` to fix this"
             )
 
+    async def _acheck_connected_account(self, action: ActionType) -> None:
+        """Async variant of `check_connected_account`."""
+        if self._connected_accounts is None:
+            action = Action(action)
+            if action.no_auth or action.is_runtime:
+                return
+
+            if App(action.app) in self._custom_auth:
+                return
+
+            self._connected_accounts = t.cast(
+                t.List[ConnectedAccountModel],
+                await self.async_client.connected_accounts.get(),
+            )
+        self.check_connected_account(action=action)
+
     def _get_custom_params_for_local_action(
         self,
         custom_auth: CustomAuthObject,
@@ -593,7 +761,48 @@ class ComposioToolSet(WithLogger):  # pylint: disable=too-many-public-methods
             text=text,
             auth=auth,
         )
+        return self._format_remote_output(
+            action=action,
+            output=output,
+            entity_id=entity_id,
+        )
+
+    async def _aexecute_remote(
+        self,
+        action: Action,
+        params: t.Dict,
+        entity_id: str = DEFAULT_ENTITY_ID,
+        connected_account_id: t.Optional[str] = None,
+        session_id: t.Optional[str] = None,
+        text: t.Optional[str] = None,
+    ) -> t.Dict:
+        """Execute a remote action using the async client."""
+        auth = self._custom_auth.get(App(action.app))
+        if auth is None:
+            await self._acheck_connected_account(action=action)
+
+        entity = self.async_client.get_entity(id=entity_id)
+        output = await entity._execute(  # pylint: disable=protected-access
+            action=action,
+            params=params,
+            connected_account_id=connected_account_id,
+            session_id=session_id,
+            text=text,
+            auth=auth,
+        )
+        return self._format_remote_output(
+            action=action,
+            output=output,
+            entity_id=entity_id,
+        )
 
+    def _format_remote_output(
+        self,
+        action: Action,
+        output: t.Dict,
+        entity_id: str = DEFAULT_ENTITY_ID,
+    ) -> t.Dict:
+        """Write the remote action output to file or save the returned files."""
         if self.output_in_file:
             return self._write_to_file(
                 action=action,
@@ -629,19 +838,16 @@ class ComposioToolSet(WithLogger):  # pylint: disable=too-many-public-methods
         resp_data = success_response_model.data
         is_invalid_file = False
         for key, val in resp_data.items():
+            if not _is_file_object(val):
+                continue
+
             try:
-                file_model = FileType.model_validate(val)
                 self._ensure_output_dir_exists()
-
                 local_filepath = (
                     self.output_dir
-                    / f"{file_name_prefix}_{file_model.name.replace('/', '_')}"
+                    / f"{file_name_prefix}_{val['name'].replace('/', '_')}"
                 )
-
-                _write_file(
-                    local_filepath, base64.urlsafe_b64decode(file_model.content)
-                )
-
+                write_base64(content=val["content"], path=local_filepath)
                 resp_data[key] = str(local_filepath)
             except binascii.Error:
                 is_invalid_file = True
@@ -714,34 +920,71 @@ class ComposioToolSet(WithLogger):  # pylint: disable=too-many-public-methods
         metadata.update(self._get_metadata(key=action))
         return metadata
 
-    def _get_processor(
+    def _compile_processors(self) -> None:
+        """
+        Build the processor dispatch table from the registered processors.
+
+        Processors are keyed by the normalised app or action slug, so running
+        them never has to construct an enum to resolve the key.
+        """
+        self._processor_table: t.Dict[str, t.Dict[str, _CallableType]] = {
+            type_: {
+                _processor_key(key): processor for key, processor in processors.items()
+            }
+            for type_, processors in self._processors.items()
+        }
+        self._processor_chains: t.Dict[
+            t.Tuple[str, str], t.Tuple[t.Tuple[str, _CallableType], ...]
+        ] = {}
+
+    def _get_processors(
         self,
-        key: _KeyType,
-        type_: te.Literal["post", "pre", "schema"],
-    ) -> t.Optional[_CallableType]:
-        """Get processor for given app or action"""
-        processor = self._processors.get(type_, {}).get(key)  # type: ignore
-        if processor is not None:
-            return processor
+        action: Action,
+        type_: ProcessorType,
+    ) -> t.Tuple[t.Tuple[str, _CallableType], ...]:
+        """
+        Get the processors to run for an action, in order.
 
-        try:
-            return self._processors.get(type_, {}).get(Action(t.cast(ActionType, key)))  # type: ignore
-        except EnumStringNotFound:
-            return self._processors.get(type_, {}).get(App(t.cast(AppType, key)))  # type: ignore
+        Request and schema processors run app first, response processors
+        run action first.
+
+        :param action: Action being processed
+        :param type_: Processor type
+        :return: Pairs of the processor level (`App` or `Action`) and the
+            processor
+        """
+        chain = self._processor_chains.get((type_, action.slug))
+        if chain is not None:
+            return chain
+
+        table = self._processor_table.get(type_, {})
+        levels = [("App", action.app.upper()), ("Action", action.slug)]
+        if type_ == "post":
+            levels.reverse()
+        chain = tuple((level, table[slug]) for level, slug in levels if slug in table)
+        self._processor_chains[(type_, action.slug)] = chain
+        return chain
 
     def _process(
         self,
-        key: _KeyType,
+        action: Action,
         data: t.Dict,
-        type_: te.Literal["pre", "post", "schema"],
+        type_: ProcessorType,
     ) -> t.Union[t.Dict, _Retry]:
-        processor = self._get_processor(key=key, type_=type_)
-        if processor is not None:
+        for level, processor in self._get_processors(action=action, type_=type_):
             self.logger.debug(
                 f"Running {'request' if type_ == 'pre' else 'response' if type_ == 'post' else 'schema'}"
                 f" through: {processor.__name__}"
             )
             data = processor(data)
+            if isinstance(data, _Retry):
+                if type_ == "post":
+                    return RETRY
+                kind = "preprocessor" if type_ == "pre" else "schema processor"
+                raise ComposioSDKError(
+                    f"Received RETRY from {level} {kind} function."
+                    f" {kind.capitalize()}s cannot be retried."
+                )
             # Users may not respect our type annotations and return something that isn't a dict.
             # If that happens we should show a friendly error message.
             if not isinstance(data, t.Dict):
@@ -752,74 +995,17 @@ class ComposioToolSet(WithLogger):  # pylint: disable=too-many-public-methods
         return data
 
     def _process_request(self, action: Action, request: t.Dict) -> t.Dict:
-        processed = self._process(
-            key=App(action.app),
-            data=request,
-            type_="pre",
-        )
-        if isinstance(processed, _Retry):
-            raise ComposioSDKError(
-                "Received RETRY from App preprocessor function."
-                " Preprocessors cannot be retried."
-            )
-
-        processed = self._process(
-            key=action,
-            data=processed,
-            type_="pre",
-        )
-        if isinstance(processed, _Retry):
-            raise ComposioSDKError(
-                "Received RETRY from Action preprocessor function."
-                " Preprocessors cannot be retried."
-            )
-
-        return processed
+        return t.cast(t.Dict, self._process(action=action, data=request, type_="pre"))
 
     def _process_respone(
         self, action: Action, response: t.Dict
     ) -> t.Union[t.Dict, _Retry]:
-        processed = self._process(
-            key=App(action.app),
-            data=response,
-            type_="post",
-        )
-        if isinstance(processed, _Retry):
-            return RETRY
-
-        processed = self._process(
-            key=action,
-            data=processed,
-            type_="post",
-        )
-        if isinstance(processed, _Retry):
-            return RETRY
-
-        return processed
+        return self._process(action=action, data=response, type_="post")
 
     def _process_schema_properties(self, action: Action, properties: t.Dict) -> t.Dict:
-        processed = self._process(
-            key=App(action.app),
-            data=properties,
-            type_="schema",
+        return t.cast(
+            t.Dict, self._process(action=action, data=properties, type_="schema")
         )
-        if isinstance(processed, _Retry):
-            raise ComposioSDKError(
-                "Received RETRY from App schema processor function."
-                " Schema pprocessors cannot be retried."
-            )
-
-        processed = self._process(
-            key=action,
-            data=processed,
-            type_="schema",
-        )
-        if isinstance(processed, _Retry):
-            raise ComposioSDKError(
-                "Received RETRY from Action preprocessor function."
-                " Schema processors cannot be retried."
-            )
-        return processed
 
     def _merge_processors(self, processors: ProcessorsType) -> None:
         for processor_type in self._processors.keys():
@@ -835,7 +1021,13 @@ class ComposioToolSet(WithLogger):  # pylint: disable=too-many-public-methods
                 existing_processors = {}
                 self._processors[processor_type] = existing_processors
 
+            if processor_type == "schema" and any(
+                existing_processors.get(key) is not processor
+                for key, processor in new_processors.items()
+            ):
+                self._action_schemas_cache.clear()
             existing_processors.update(new_processors)
+        self._compile_processors()
 
     @_record_action_if_available
     def execute_action(
@@ -861,6 +1053,243 @@ class ComposioToolSet(WithLogger):  # pylint: disable=too-many-public-methods
         :param connected_account_id: Connection ID for executing the remote action
         :return: Output object from the function call
         """
+        action, params, metadata, connected_account_id = self._prepare_execution(
+            action=action,
+            params=params,
+            metadata=metadata,
+            connected_account_id=connected_account_id,
+            processors=processors,
+            _check_requested_actions=_check_requested_actions,
+        )
+        execution = {
+            "action": action,
+            "params": params,
+            "entity_id": entity_id or self.entity_id,
+            "connected_account_id": connected_account_id,
+        }
+        cached = self._get_cached_response(execution=execution)
+        if cached is not None:
+            return cached
+
+        failed_responses = []
+        for _ in range(self.max_retries):
+            with self.rate_limiter.limit(
+                action=action,
+                connected_account_id=connected_account_id,
+            ):
+                response = (
+                    self._execute_local(
+                        action=action,
+                        params=params,
+                        metadata=metadata,
+                        entity_id=entity_id,
+                    )
+                    if action.is_local
+                    else self._execute_remote(
+                        action=action,
+                        params=params,
+                        entity_id=entity_id or self.entity_id,
+                        connected_account_id=connected_account_id,
+                        text=text,
+                        session_id=self.session_id,
+                    )
+                )
+            processed_response = self._complete_execution(
+                execution=execution,
+                response=response,
+                failed_responses=failed_responses,
+            )
+            if processed_response is not None:
+                return processed_response
+
+        return self._retries_exhausted(
+            execution=execution,
+            failed_responses=failed_responses,
+        )
+
+    async def aexecute_action(
+        self,
+        action: ActionType,
+        params: dict,
+        metadata: t.Optional[t.Dict] = None,
+        entity_id: t.Optional[str] = None,
+        connected_account_id: t.Optional[str] = None,
+        text: t.Optional[str] = None,
+        *,
+        processors: t.Optional[ProcessorsType] = None,
+        _check_requested_actions: bool = False,
+    ) -> t.Dict:
+        """
+        Execute an action on a given entity, without blocking the event loop.
+
+        Remote actions are executed using `AsyncComposio`, local and runtime
+        actions run in the default executor of the running loop. Preparing the
+        execution loads the action and runs the request processors, which may
+        block, so it runs in the default executor as well.
+
+        :param action: Action to execute
+        :param params: The parameters to pass to the action
+        :param entity_id: The ID of the entity to execute the action on. Defaults to "default"
+        :param text: Extra text to use for generating function calling metadata
+        :param metadata: Metadata for executing local action
+        :param connected_account_id: Connection ID for executing the remote action
+        :return: Output object from the function call
+        """
+        action, params, metadata, connected_account_id = await asyncio.to_thread(
+            self._prepare_execution,
+            action=action,
+            params=params,
+            metadata=metadata,
+            connected_account_id=connected_account_id,
+            processors=processors,
+            _check_requested_actions=_check_requested_actions,
+        )
+        execution = {
+            "action": action,
+            "params": params,
+            "entity_id": entity_id or self.entity_id,
+            "connected_account_id": connected_account_id,
+        }
+        cached = self._get_cached_response(execution=execution)
+        if cached is not None:
+            return cached
+
+        failed_responses = []
+        for _ in range(self.max_retries):
+            async with self.rate_limiter.alimit(
+                action=action,
+                connected_account_id=connected_account_id,
+            ):
+                response = (
+                    await asyncio.to_thread(
+                        self._execute_local,
+                        action=action,
+                        params=params,
+                        metadata=metadata,
+                        entity_id=entity_id,
+                    )
+                    if action.is_local
+                    else await self._aexecute_remote(
+                        action=action,
+                        params=params,
+                        entity_id=entity_id or self.entity_id,
+                        connected_account_id=connected_account_id,
+                        text=text,
+                        session_id=self.session_id,
+                    )
+                )
+            processed_response = self._complete_execution(
+                execution=execution,
+                response=response,
+                failed_responses=failed_responses,
+            )
+            if processed_response is not None:
+                return processed_response
+
+        return self._retries_exhausted(
+            execution=execution,
+            failed_responses=failed_responses,
+        )
+
+    def execute_actions(
+        self,
+        calls: t.Sequence[ActionCall],
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        *,
+        processors: t.Optional[ProcessorsType] = None,
+        _check_requested_actions: bool = False,
+    ) -> t.List[t.Dict]:
+        """
+        Execute multiple actions in parallel.
+
+        Every call goes through `execute_action`, so retries and processors
+        apply per call. If a call raises, the error is re-raised after the
+        calls before it have finished.
+
+        :param calls: Action calls to execute
+        :param max_concurrency: Maximum number of actions executed at once
+        :param processors: Request and response processors to use
+        :return: Output objects from the calls, in the order of `calls`
+        """
+        if processors is not None:
+            self._merge_processors(processors)
+
+        if len(calls) < 2 or max_concurrency < 2:
+            return [
+                self.execute_action(
+                    **call,
+                    _check_requested_actions=_check_requested_actions,
+                )
+                for call in calls
+            ]
+
+        self._initialize_for(calls=calls, remote=True)
+        with ThreadPoolExecutor(
+            max_workers=min(max_concurrency, len(calls)),
+            thread_name_prefix="composio-execute",
+        ) as executor:
+            return list(
+                executor.map(
+                    lambda call: self.execute_action(
+                        **call,
+                        _check_requested_actions=_check_requested_actions,
+                    ),
+                    calls,
+                )
+            )
+
+    def _initialize_for(self, calls: t.Sequence[ActionCall], remote: bool) -> None:
+        """
+        Initialise the lazily created workspace and remote client required by
+        the calls, so parallel executions don't race to create them.
+        """
+        actions = Action.load_many(call["action"] for call in calls)
+        if any(action.is_local for action in actions):
+            _ = self.workspace
+        if remote and any(not action.is_local for action in actions):
+            _ = self.client
+
+    async def aexecute_actions(
+        self,
+        calls: t.Sequence[ActionCall],
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        *,
+        processors: t.Optional[ProcessorsType] = None,
+        _check_requested_actions: bool = False,
+    ) -> t.List[t.Dict]:
+        """
+        Execute multiple actions concurrently, without blocking the event loop.
+
+        :param calls: Action calls to execute
+        :param max_concurrency: Maximum number of actions executed at once
+        :param processors: Request and response processors to use
+        :return: Output objects from the calls, in the order of `calls`
+        """
+        if processors is not None:
+            self._merge_processors(processors)
+
+        await asyncio.to_thread(self._initialize_for, calls=calls, remote=False)
+        semaphore = asyncio.Semaphore(max(max_concurrency, 1))
+
+        async def _execute(call: ActionCall) -> t.Dict:
+            async with semaphore:
+                return await self.aexecute_action(
+                    **call,
+                    _check_requested_actions=_check_requested_actions,
+                )
+
+        return list(await asyncio.gather(*(_execute(call) for call in calls)))
+
+    def _prepare_execution(
+        self,
+        action: ActionType,
+        params: t.Dict,
+        metadata: t.Optional[t.Dict] = None,
+        connected_account_id: t.Optional[str] = None,
+        processors: t.Optional[ProcessorsType] = None,
+        _check_requested_actions: bool = False,
+    ) -> t.Tuple[Action, t.Dict, t.Optional[t.Dict], t.Optional[str]]:
+        """Validate the action and run request pre-processing before execution."""
         action = Action(action)
         if _check_requested_actions and action.slug not in self._requested_actions:
             raise ComposioSDKError(
@@ -881,49 +1310,84 @@ class ComposioToolSet(WithLogger):  # pylint: disable=too-many-public-methods
             )
 
         self.logger.debug(
-            f"Executing `{action.slug}` with {params=} and {metadata=} {connected_account_id=}"
+            "Executing `%s` with params=%r and metadata=%r connected_account_id=%r",
+            action.slug,
+            params,
+            metadata,
+            connected_account_id,
         )
+        return action, params, metadata, connected_account_id
 
-        failed_responses = []
-        for _ in range(self.max_retries):
-            response = (
-                self._execute_local(
-                    action=action,
-                    params=params,
-                    metadata=metadata,
-                    entity_id=entity_id,
-                )
-                if action.is_local
-                else self._execute_remote(
-                    action=action,
-                    params=params,
-                    entity_id=entity_id or self.entity_id,
-                    connected_account_id=connected_account_id,
-                    text=text,
-                    session_id=self.session_id,
-                )
-            )
-            processed_response = (
-                response
-                if action.is_runtime
-                else self._process_respone(action=action, response=response)
-            )
-            if isinstance(processed_response, _Retry):
-                self.logger.debug(
-                    f"Got {processed_response=} from {action=} with {params=}, retrying..."
-                )
-                failed_responses.append(response)
-                continue
+    def _get_cached_response(self, execution: t.Dict) -> t.Optional[t.Dict]:
+        """Get the cached response of an execution, post-processed."""
+        if self.result_cache is None:
+            return None
 
-            response = processed_response
-            self.logger.debug(f"Got {response=} from {action=} with {params=}")
+        action = execution["action"]
+        response = self.result_cache.get(**execution)
+        if response is None or action.is_runtime:
             return response
 
-        return SuccessExecuteActionResponseModel(
+        processed = self._process_respone(action=action, response=response)
+        if isinstance(processed, _Retry):
+            return None
+        return processed
+
+    def _complete_execution(
+        self,
+        execution: t.Dict,
+        response: t.Dict,
+        failed_responses: t.List[t.Dict],
+    ) -> t.Optional[t.Dict]:
+        """
+        Post-process the response of an execution attempt and cache it.
+
+        :return: Processed response, `None` if the processors asked for a
+            retry, the response is added to `failed_responses` in that case
+        """
+        action, params = execution["action"], execution["params"]
+        processed = (
+            response
+            if action.is_runtime
+            else self._process_respone(action=action, response=response)
+        )
+        if isinstance(processed, _Retry):
+            self.logger.debug(
+                "Got processed_response=%r from action=%r with params=%r, "
+                "retrying...",
+                processed,
+                action,
+                params,
+            )
+            failed_responses.append(response)
+            return None
+
+        # The raw response is cached, hits are post-processed again
+        if self.result_cache is not None:
+            self.result_cache.set(response=response, **execution)
+        self.logger.debug(
+            "Got response=%r from action=%r with params=%r",
+            processed,
+            action,
+            params,
+        )
+        return processed
+
+    def _retries_exhausted(
+        self,
+        execution: t.Dict,
+        failed_responses: t.List[t.Dict],
+    ) -> t.Dict:
+        """Response returned when the processors keep asking for a retry."""
+        response = SuccessExecuteActionResponseModel(
             successfull=False,
             data={"failed_responses": failed_responses},
             error=f"Execution failed after {self.max_retries} retries.",
         ).model_dump()
+        # Drops the cached results of the app if the action is not cached
+        if self.result_cache is not None:
+            self.result_cache.set(response=response, **execution)
+        return response
 
     @t.overload
     def execute_request(
@@ -1019,20 +1483,89 @@ class ComposioToolSet(WithLogger):  # pylint: disable=too-many-public-methods
         *,
         check_connected_accounts: bool = True,
         _populate_requested: bool = False,
+    ) -> t.List[ActionModel]:
+        key = self._action_schemas_key(
+            apps=apps,
+            actions=actions,
+            tags=tags,
+            check_connected_accounts=check_connected_accounts,
+        )
+        items = None if key is None else self._action_schemas_cache.get(key)
+        if items is None:
+            items = self._get_action_schemas(
+                apps=apps,
+                actions=actions,
+                tags=tags,
+                check_connected_accounts=check_connected_accounts,
+            )
+            if key is not None:
+                self._action_schemas_cache.set(key, items)
+
+        if _populate_requested:
+            action_names = [item.name for item in items]
+            self._requested_actions += action_names
+
+        return items
+
+    def _action_schemas_key(
+        self,
+        apps: t.Optional[t.Sequence[AppType]],
+        actions: t.Optional[t.Sequence[ActionType]],
+        tags: t.Optional[t.Sequence[TagType]],
+        check_connected_accounts: bool,
+    ) -> t.Optional[t.Hashable]:
+        """
+        Key for memoizing `get_action_schemas`, `None` if it can't be memoized.
+
+        Schema processors are part of the key by identity, and the enum store
+        version makes the entries invalid once the enum cache is refreshed.
+        """
+        schema_processors = sorted(
+            (
+                (str(key), processor)
+                for key, processor in self._processors.get("schema", {}).items()
+            ),
+            key=lambda item: item[0],
+        )
+        key = (
+            tuple(str(app) for app in apps or []),
+            tuple(
+                action if hasattr(action, "run_on_shell") else str(action)
+                for action in actions or []
+            ),
+            tuple(str(tag) for tag in tags or []),
+            check_connected_accounts,
+            self.entity_id,
+            self._description_char_limit,
+            self._action_name_char_limit,
+            tuple(schema_processors),
+            get_enum_store().version(),
+        )
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
+    def _get_action_schemas(
+        self,
+        apps: t.Optional[t.Sequence[AppType]],
+        actions: t.Optional[t.Sequence[ActionType]],
+        tags: t.Optional[t.Sequence[TagType]],
+        check_connected_accounts: bool,
     ) -> t.List[ActionModel]:
         runtime_actions = t.cast(
             t.List[t.Type[LocalAction]],
             [action for action in actions or [] if hasattr(action, "run_on_shell")],
         )
-        actions = t.cast(
-            t.List[Action],
-            [
-                Action(action)
-                for action in actions or []
-                if action not in runtime_actions
-            ],
+        # Resolve the enum metadata in bulk, so the lookups below don't
+        # fetch the missing actions and apps one at a time
+        actions = Action.load_many(
+            t.cast(ActionType, action)
+            for action in actions or []
+            if action not in runtime_actions
         )
-        apps = t.cast(t.List[App], [App(app) for app in apps or []])
+        apps = App.load_many(apps or [])
         items: t.List[ActionModel] = []
 
         local_actions = [action for action in actions if action.is_local]
@@ -1055,6 +1588,12 @@ class ComposioToolSet(WithLogger):  # pylint: disable=too-many-public-methods
                 actions=remote_actions,
                 tags=tags,
             )
+            # Seed before `_process_schema` rewrites the schemas for the LLM,
+            # `execute` needs the schemas as the server returned them.
+            action_schema_cache.seed(
+                scope=client_scope(self.client),
+                models=remote_items,
+            )
             if check_connected_accounts:
                 for item in remote_items:
                     self.check_connected_account(action=item.name)
@@ -1084,10 +1623,6 @@ class ComposioToolSet(WithLogger):  # pylint: disable=too-many-public-methods
             if item.name == Action.ANTHROPIC_TEXT_EDITOR.slug:
                 item.name = "str_replace_editor"
 
-        if _populate_requested:
-            action_names = [item.name for item in items]
-            self._requested_actions += action_names
-
         return items
 
     def _process_schema(self, action_item: ActionModel) -> ActionModel:
@@ -1314,13 +1849,21 @@ class ComposioToolSet(WithLogger):  # pylint: disable=too-many-public-methods
             apps = [a for a in apps if a.no_auth is no_auth]
 
         if include_local:
-            for app in tool_registry["local"].values():
+            local_apps = {
+                enum: (tool["name"], tool["description"])
+                for enum, tool in get_manifest()["tools"].items()
+            }
+            local_apps.update(
+                (enum, (tool.name, tool.description))
+                for enum, tool in tool_registry["local"].items()
+            )
+            for name, description in local_apps.values():
                 apps.append(
                     AppModel(
-                        name=app.name,
-                        key=app.name,
-                        appId=app.name,
-                        description=app.description,
+                        name=name,
+                        key=name,
+                        appId=name,
+                        description=description,
                         categories=["local"],
                         meta={},
                         no_auth=True,
@@ -1661,6 +2204,15 @@ class ComposioToolSet(WithLogger):  # pylint: disable=too-many-public-methods
         return auth_config, False
 
 
+def _is_file_object(value: t.Any) -> bool:
+    """Check if a response value is a `FileType` object, without validating it."""
+    return (
+        isinstance(value, dict)
+        and isinstance(value.get("name"), str)
+        and isinstance(value.get("content"), str)
+    )
+
+
 def _write_file(file_path: t.Union[str, os.PathLike], content: t.Union[str, bytes]):
     """Write content to a file."""
     if isinstance(content, str):
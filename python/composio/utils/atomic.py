@@ -0,0 +1,142 @@
+"""
+Helpers for files shared by multiple processes.
+
+Files are written to a temporary file and renamed over the target, so
+readers never see a partially written file, and advisory locks make sure
+only one process does some work at a time.
+"""
+
+import contextlib
+import os
+import tempfile
+import time
+import typing as t
+from pathlib import Path
+
+
+if os.name == "nt":  # pragma: no cover
+    import msvcrt
+else:
+    import fcntl
+
+
+LOCK_POLL_INTERVAL = 0.05
+"""
+Seconds to wait for between attempts to acquire a lock held by another process.
+"""
+
+
+def atomic_write(path: Path, data: t.Union[str, bytes]) -> None:
+    """
+    Write data to a file atomically.
+
+    :param path: Path to the file, the parent directories are created
+    :param data: Content, strings are encoded as UTF-8
+    """
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as fp:
+            fp.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.remove(tmp)
+        raise
+
+
+class FileLock:
+    """
+    Advisory lock on a file, exclusive between processes.
+
+    The lock is released by the operating system if the holding process dies,
+    so there are no stale locks to clean up.
+
+    Example:
+    ```python
+        with FileLock(Path("cache.lock")):
+            ...
+    ```
+    """
+
+    def __init__(self, path: Path, timeout: t.Optional[float] = None) -> None:
+        """
+        Initialize file lock.
+
+        :param path: Path to the lock file, created if it doesn't exist
+        :param timeout: Maximum number of seconds to wait for the lock in
+            `acquire`, wait indefinitely if `None`
+        """
+        self.path = path
+        self.timeout = timeout
+        self._fd: t.Optional[int] = None
+
+    @property
+    def locked(self) -> bool:
+        """Whether the lock is held by this object."""
+        return self._fd is not None
+
+    def acquire(self, blocking: bool = True) -> bool:
+        """
+        Acquire the lock.
+
+        :param blocking: Wait for the lock if another process holds it
+        :return: `True` if the lock was acquired
+        """
+        if self._fd is not None:
+            raise RuntimeError(f"Lock on {self.path} is already acquired")
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        deadline = None if self.timeout is None else time.monotonic() + self.timeout
+        while True:
+            try:
+                _lock(fd)
+                self._fd = fd
+                return True
+            except OSError:
+                expired = deadline is not None and time.monotonic() > deadline
+                if not blocking or expired:
+                    os.close(fd)
+                    return False
+            time.sleep(LOCK_POLL_INTERVAL)
+
+    def release(self) -> None:
+        """Release the lock."""
+        if self._fd is None:
+            return
+        try:
+            _unlock(self._fd)
+        finally:
+            os.close(self._fd)
+            self._fd = None
+
+    def __enter__(self) -> "FileLock":
+        if not self.acquire():
+            raise TimeoutError(f"Timed out waiting for the lock on {self.path}")
+        return self
+
+    def __exit__(self, *args: t.Any) -> None:
+        self.release()
+
+
+if os.name == "nt":  # pragma: no cover
+
+    def _lock(fd: int) -> None:
+        os.lseek(fd, 0, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)  # type: ignore[attr-defined]
+
+    def _unlock(fd: int) -> None:
+        os.lseek(fd, 0, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)  # type: ignore[attr-defined]
+
+else:
+
+    def _lock(fd: int) -> None:
+        fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+
+    def _unlock(fd: int) -> None:
+        fcntl.flock(fd, fcntl.LOCK_UN)
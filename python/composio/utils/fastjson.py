@@ -0,0 +1,86 @@
+"""
+Fast JSON decoding helpers.
+
+`orjson` is used for decoding when it's installed, with the standard library
+`json` module as the fallback. Lists of models are validated straight from the
+raw response body by `pydantic`, without building intermediate dictionaries.
+"""
+
+import functools
+import json
+import re
+import typing as t
+
+import typing_extensions as te
+from pydantic import TypeAdapter
+
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore
+
+
+ModelType = t.TypeVar("ModelType")
+
+_LIST_START = re.compile(r"\s*\[")
+_LIST_START_BYTES = re.compile(rb"\s*\[")
+
+
+def loads(data: t.Union[str, bytes, bytearray, memoryview]) -> t.Any:
+    """
+    Decode a JSON document.
+
+    :param data: Encoded JSON document
+    :return: Decoded object
+    :raises ValueError: If the document is not valid JSON
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    if isinstance(data, memoryview):
+        data = data.tobytes()
+    return json.loads(data)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_list_adapter(model: t.Type, key: t.Optional[str]) -> TypeAdapter:
+    """Get a (cached) type adapter for a list of models, or an object wrapping one."""
+    if key is None:
+        return TypeAdapter(t.List[model])  # type: ignore[valid-type]
+
+    container = te.TypedDict(  # type: ignore[operator]
+        f"{model.__name__}List",
+        {key: t.List[model]},  # type: ignore[valid-type]
+        total=False,
+    )
+    return TypeAdapter(container)
+
+
+def validate_list(
+    data: t.Union[str, bytes, bytearray],
+    model: t.Type[ModelType],
+    key: t.Optional[str] = None,
+) -> t.Optional[t.List[ModelType]]:
+    """
+    Validate a list of models from a JSON document.
+
+    :param data: Encoded JSON document
+    :param model: Model to validate the items as
+    :param key: When set, the document is expected to be an object with the
+        list of items under this key, otherwise the document must be a list
+    :return: List of validated models, `None` if the document is an object
+        without `key`
+    :raises pydantic.ValidationError: If the document is not valid JSON or the
+        items are not valid models
+    """
+    value = _get_list_adapter(model, key).validate_json(data)
+    if key is None:
+        return value
+    return value.get(key)
+
+
+def is_json_list(data: t.Union[str, bytes, bytearray]) -> bool:
+    """Check if a JSON document is a list, without decoding it."""
+    if isinstance(data, str):
+        return _LIST_START.match(data) is not None
+    return _LIST_START_BYTES.match(data) is not None
@@ -0,0 +1,205 @@
+"""
+Helpers for sending and receiving file contents with action requests without
+loading whole files in memory.
+"""
+
+import base64
+import binascii
+import codecs
+import io
+import json
+import os
+import re
+import tempfile
+import typing as t
+import uuid
+
+from composio.constants import ENV_COMPOSIO_MAX_INLINE_FILE_SIZE
+from composio.exceptions import ComposioSDKError
+
+
+CHUNK_SIZE = 3 * 256 * 1024
+"""
+Number of bytes read from a file at once, a multiple of 3 so every chunk
+encodes to base64 without padding.
+"""
+
+SPOOL_MAX_SIZE = 8 * 1024 * 1024
+"""
+Size in bytes after which a request body is moved from memory to a temporary
+file.
+"""
+
+
+_URLSAFE_TO_STANDARD = bytes.maketrans(b"-_", b"+/")
+_NOT_BASE64 = re.compile(rb"[^A-Za-z0-9+/=]")
+
+
+class FileTooLargeError(ComposioSDKError):
+    """Raised when a file exceeds the maximum inline file size."""
+
+
+def get_max_inline_file_size() -> t.Optional[int]:
+    """Get the maximum inline file size, `None` if there's no limit."""
+    value = os.environ.get(ENV_COMPOSIO_MAX_INLINE_FILE_SIZE)
+    if value is None or value == "":
+        return None
+    return int(value)
+
+
+class FileContent:
+    """
+    Content of a local file, encoded when the request body is written.
+
+    Text files are sent as is and binary files are sent base64 encoded, the
+    file is read in chunks of `CHUNK_SIZE` bytes.
+    """
+
+    def __init__(self, path: str, binary: t.Optional[bool] = None) -> None:
+        """
+        Initialize file content.
+
+        :param path: Path to the file
+        :param binary: Whether to encode the content as base64, if not set the
+            content is sent as text if it's valid UTF-8
+        """
+        self.path = path
+        self.size = os.path.getsize(path)
+
+        limit = get_max_inline_file_size()
+        if limit is not None and self.size > limit:
+            raise FileTooLargeError(
+                f"File `{path}` is {self.size} bytes, which exceeds the maximum "
+                f"inline file size of {limit} bytes, increase the limit using "
+                f"`{ENV_COMPOSIO_MAX_INLINE_FILE_SIZE}` environment variable"
+            )
+
+        self.binary = not self._is_utf8() if binary is None else binary
+
+    def __repr__(self) -> str:
+        return f"FileContent(path={self.path!r}, binary={self.binary})"
+
+    def _chunks(self) -> t.Iterator[bytes]:
+        with open(self.path, "rb") as file:
+            while chunk := file.read(CHUNK_SIZE):
+                yield chunk
+
+    def _is_utf8(self) -> bool:
+        decoder = codecs.getincrementaldecoder("utf-8")()
+        try:
+            for chunk in self._chunks():
+                decoder.decode(chunk)
+            decoder.decode(b"", final=True)
+        except UnicodeDecodeError:
+            return False
+        return True
+
+    def iter_text(self) -> t.Iterator[str]:
+        """Iterate over the encoded content."""
+        if self.binary:
+            for chunk in self._chunks():
+                yield base64.b64encode(chunk).decode("utf-8")
+            return
+
+        decoder = codecs.getincrementaldecoder("utf-8")()
+        for chunk in self._chunks():
+            yield decoder.decode(chunk)
+        yield decoder.decode(b"", final=True)
+
+    def read(self) -> str:
+        """Read the encoded content."""
+        with io.StringIO() as buffer:
+            for text in self.iter_text():
+                buffer.write(text)
+            return buffer.getvalue()
+
+
+def dump_json(data: t.Any) -> t.IO[bytes]:
+    """
+    Serialize data to a JSON request body, streaming `FileContent` values.
+
+    The body is kept in memory up to `SPOOL_MAX_SIZE` bytes and written to a
+    temporary file after that. The caller is responsible for closing it.
+
+    :param data: Request data
+    :return: Readable file object with the body, positioned at the start
+    """
+    files: t.Dict[str, FileContent] = {}
+
+    def _default(obj: t.Any) -> str:
+        if isinstance(obj, FileContent):
+            placeholder = f"\x00file:{uuid.uuid4().hex}\x00"
+            files[json.dumps(placeholder)] = obj
+            return placeholder
+        raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+    skeleton = json.dumps(data, default=_default)
+    body: t.IO[bytes] = io.BytesIO()
+
+    def _write(text: str) -> None:
+        nonlocal body
+        body.write(text.encode("utf-8"))
+        if isinstance(body, io.BytesIO) and body.tell() > SPOOL_MAX_SIZE:
+            spooled = tempfile.TemporaryFile()  # pylint: disable=consider-using-with
+            spooled.write(body.getbuffer())
+            body = spooled
+
+    position = 0
+    for start, placeholder in sorted(
+        (skeleton.index(placeholder), placeholder) for placeholder in files
+    ):
+        _write(skeleton[position:start])
+        _write('"')
+        for text in files[placeholder].iter_text():
+            # Escaping is done per character, so chunks can be escaped
+            # independently, the quotes added by `json.dumps` are stripped.
+            _write(json.dumps(text)[1:-1])
+        _write('"')
+        position = start + len(placeholder)
+
+    _write(skeleton[position:])
+    body.seek(0)
+    return body
+
+
+def write_base64(
+    content: str,
+    path: t.Union[str, os.PathLike],
+    chunk_size: int = 4 * 256 * 1024,
+) -> None:
+    """
+    Decode standard or URL-safe base64 content to a file in chunks.
+
+    Like `base64.urlsafe_b64decode`, characters outside of the base64
+    alphabet are ignored. The file is removed if the content can't be decoded.
+
+    :param content: Base64 encoded content
+    :param path: Path to write the decoded content to
+    :param chunk_size: Number of characters decoded at once
+    :raises binascii.Error: If the content is not valid base64
+    """
+    carry = b""
+    try:
+        with open(path, "wb") as file:
+            for start in range(0, len(content), chunk_size):
+                stop = start + chunk_size
+                try:
+                    encoded = content[start:stop].encode("ascii")
+                except UnicodeEncodeError as e:
+                    raise binascii.Error(
+                        "Base64 content should contain only ASCII characters"
+                    ) from e
+                chunk = carry + _NOT_BASE64.sub(
+                    b"", encoded.translate(_URLSAFE_TO_STANDARD)
+                )
+                # Decode complete quanta only, the rest is prepended to the
+                # next chunk
+                end = len(chunk) - len(chunk) % 4
+                file.write(base64.b64decode(chunk[:end]))
+                carry = chunk[end:]
+            if carry:
+                file.write(base64.b64decode(carry))
+    except BaseException:
+        if os.path.exists(path):
+            os.remove(path)
+        raise
@@ -85,14 +85,24 @@ class _VerbosityWrapper:
 
         return msg[: self.size] + "..."
 
+    def _format(self, msg, args) -> str:
+        # Arguments are formatted before trimming, so the message is only
+        # built when the level is enabled
+        if args:
+            msg = str(msg) % args
+        return self._trim(msg)
+
     def info(self, msg, *args, **kwargs):
-        self.logger.info(self._trim(msg), *args, **kwargs)
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(self._format(msg, args), **kwargs)
 
     def debug(self, msg, *args, **kwargs):
-        self.logger.debug(self._trim(msg), *args, **kwargs)
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(self._format(msg, args), **kwargs)
 
     def warning(self, msg, *args, **kwargs):
-        self.logger.warning(self._trim(msg), *args, **kwargs)
+        if self.logger.isEnabledFor(logging.WARNING):
+            self.logger.warning(self._format(msg, args), **kwargs)
 
     def error(self, msg, *args, **kwargs):
         self.logger.error(msg, *args, **kwargs)
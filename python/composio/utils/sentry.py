@@ -3,28 +3,23 @@
 import atexit
 import json
 import os
+import sys
 import traceback
 import types
 import typing as t
 from functools import cache
-from pathlib import Path
-
-import requests
-import sentry_sdk
-import sentry_sdk.integrations.argv
-import sentry_sdk.integrations.atexit
-import sentry_sdk.integrations.dedupe
-import sentry_sdk.integrations.excepthook
-import sentry_sdk.integrations.fastapi
-import sentry_sdk.integrations.logging
-import sentry_sdk.integrations.modules
-import sentry_sdk.integrations.stdlib
-import sentry_sdk.integrations.threading
-import sentry_sdk.types
+
+from composio.constants import LOCAL_CACHE_DIRECTORY, USER_DATA_FILE_NAME
+
+
+if t.TYPE_CHECKING:
+    import sentry_sdk.types
 
 
 @cache
 def fetch_dsn() -> t.Optional[str]:
+    import requests  # pylint: disable=import-outside-toplevel
+
     request = requests.get(
         url="https://backend.composio.dev/api/v1/cli/sentry-dns",
         timeout=10,
@@ -35,10 +30,9 @@ def fetch_dsn() -> t.Optional[str]:
 
 
 def get_sentry_config() -> t.Optional[t.Dict]:
-    user_file = Path.home() / ".composio" / "user_data.json"
-    if not user_file.exists():
-        update_dsn()
-
+    # The DSN is fetched by `update_dsn` at exit, so importing `composio`
+    # never waits on the network
+    user_file = LOCAL_CACHE_DIRECTORY / USER_DATA_FILE_NAME
     if not user_file.exists():
         return None
 
@@ -54,9 +48,9 @@ def get_sentry_config() -> t.Optional[t.Dict]:
 
 
 def filter_sentry_errors(
-    event: sentry_sdk.types.Event,
-    hint: sentry_sdk.types.Hint,
-) -> t.Optional[sentry_sdk.types.Event]:
+    event: "sentry_sdk.types.Event",
+    hint: "sentry_sdk.types.Hint",
+) -> t.Optional["sentry_sdk.types.Event"]:
     if "exc_info" not in hint:
         return None
 
@@ -85,6 +79,37 @@ def init():
     if sentry_config.get("dsn") is None:
         return
 
+    # pylint: disable=import-outside-toplevel
+    import sentry_sdk
+    import sentry_sdk.integrations.argv
+    import sentry_sdk.integrations.atexit
+    import sentry_sdk.integrations.dedupe
+    import sentry_sdk.integrations.excepthook
+    import sentry_sdk.integrations.logging
+    import sentry_sdk.integrations.modules
+    import sentry_sdk.integrations.stdlib
+    import sentry_sdk.integrations.threading
+
+    integrations = [
+        sentry_sdk.integrations.argv.ArgvIntegration(),
+        sentry_sdk.integrations.atexit.AtexitIntegration(
+            callback=lambda x, y: None,
+        ),  # suppress atexit message
+        sentry_sdk.integrations.dedupe.DedupeIntegration(),
+        sentry_sdk.integrations.excepthook.ExcepthookIntegration(),
+        sentry_sdk.integrations.logging.LoggingIntegration(),
+        sentry_sdk.integrations.modules.ModulesIntegration(),
+        sentry_sdk.integrations.stdlib.StdlibIntegration(),
+        sentry_sdk.integrations.threading.ThreadingIntegration(),
+    ]
+
+    # Importing the FastAPI integration imports FastAPI itself, only set it
+    # up for processes which are using FastAPI already
+    if "fastapi" in sys.modules:
+        import sentry_sdk.integrations.fastapi
+
+        integrations.append(sentry_sdk.integrations.fastapi.FastApiIntegration())
+
     sentry_sdk.init(
         dsn=sentry_config["dsn"],
         traces_sample_rate=sentry_config.get("traces_sample_rate", 1.0),
@@ -92,25 +117,13 @@ def init():
         debug=False,
         before_send=filter_sentry_errors,
         default_integrations=False,
-        integrations=[
-            sentry_sdk.integrations.argv.ArgvIntegration(),
-            sentry_sdk.integrations.atexit.AtexitIntegration(
-                callback=lambda x, y: None,
-            ),  # suppress atexit message
-            sentry_sdk.integrations.dedupe.DedupeIntegration(),
-            sentry_sdk.integrations.excepthook.ExcepthookIntegration(),
-            sentry_sdk.integrations.fastapi.FastApiIntegration(),
-            sentry_sdk.integrations.logging.LoggingIntegration(),
-            sentry_sdk.integrations.modules.ModulesIntegration(),
-            sentry_sdk.integrations.stdlib.StdlibIntegration(),
-            sentry_sdk.integrations.threading.ThreadingIntegration(),
-        ],
+        integrations=integrations,
     )
 
 
 @atexit.register
 def update_dsn() -> None:
-    user_file = Path.home() / ".composio" / "user_data.json"
+    user_file = LOCAL_CACHE_DIRECTORY / USER_DATA_FILE_NAME
     if user_file.exists():
         try:
             data = json.loads(user_file.read_text(encoding="utf-8"))
@@ -126,6 +139,8 @@ def update_dsn() -> None:
     if dsn is None:
         return
 
+    # pylint: disable=import-outside-toplevel
+    from composio.utils.atomic import atomic_write
+
     data["sentry"] = {"dsn": dsn}
-    user_file.parent.mkdir(parents=True, exist_ok=True)
-    user_file.write_text(json.dumps(data), encoding="utf-8")
+    atomic_write(user_file, json.dumps(data))
@@ -2,6 +2,8 @@
 Shared utils.
 """
 
+import functools
+import json
 import typing as t
 import uuid
 from inspect import Parameter
@@ -41,6 +43,12 @@ FALLBACK_VALUES = {
 
 reserved_names = ["validate"]
 
+SCHEMA_CACHE_SIZE = 1024
+"""
+Maximum number of generated models, and of each kind of signature, kept in
+memory by the `cached_*` helpers.
+"""
+
 
 def json_schema_to_pydantic_type(
     json_schema: t.Dict[str, t.Any],
@@ -389,6 +397,86 @@ def get_pydantic_signature_format_from_schema_params(
     return all_parameters
 
 
+def _schema_key(schema: t.Dict) -> t.Optional[str]:
+    """Get the canonical JSON form of a schema, `None` if it's not serializable."""
+    try:
+        return json.dumps(schema, sort_keys=True, separators=(",", ":"))
+    except (TypeError, ValueError):
+        return None
+
+
+# The cached values are generated from a copy of the schema parsed back from
+# its key, so the schemas passed by callers are never modified.
+
+
+@functools.lru_cache(maxsize=SCHEMA_CACHE_SIZE)
+def _model_from_key(key: str) -> t.Type[BaseModel]:
+    return json_schema_to_model(json.loads(key))
+
+
+@functools.lru_cache(maxsize=SCHEMA_CACHE_SIZE)
+def _signature_from_key(key: str) -> t.Tuple[Parameter, ...]:
+    return tuple(get_signature_format_from_schema_params(json.loads(key)))
+
+
+@functools.lru_cache(maxsize=SCHEMA_CACHE_SIZE)
+def _pydantic_signature_from_key(key: str) -> t.Tuple[Parameter, ...]:
+    return tuple(get_pydantic_signature_format_from_schema_params(json.loads(key)))
+
+
+def cached_json_schema_to_model(json_schema: t.Dict[str, t.Any]) -> t.Type[BaseModel]:
+    """
+    Same as `json_schema_to_model`, but the model is generated once per schema
+    and shared by every caller using an equal schema.
+
+    :param json_schema: The JSON schema to convert.
+    :return: Pydantic `BaseModel` type
+    """
+    key = _schema_key(json_schema)
+    if key is None:
+        return json_schema_to_model(json_schema)
+    return _model_from_key(key)
+
+
+def cached_signature_format_from_schema_params(
+    schema_params: t.Dict,
+) -> t.List[Parameter]:
+    """
+    Same as `get_signature_format_from_schema_params`, but the parameters are
+    generated once per schema.
+
+    :param schema_params: A dictionary object containing schema params, with keys [properties, required etc.].
+    :return: List of required and optional parameters
+    """
+    key = _schema_key(schema_params)
+    if key is None:
+        return get_signature_format_from_schema_params(schema_params)
+    return list(_signature_from_key(key))
+
+
+def cached_pydantic_signature_format_from_schema_params(
+    schema_params: t.Dict,
+) -> t.List[Parameter]:
+    """
+    Same as `get_pydantic_signature_format_from_schema_params`, but the
+    parameters are generated once per schema.
+
+    :param schema_params: A dictionary object containing schema params, with keys [properties, required etc.].
+    :return: List of parameters
+    """
+    key = _schema_key(schema_params)
+    if key is None:
+        return get_pydantic_signature_format_from_schema_params(schema_params)
+    return list(_pydantic_signature_from_key(key))
+
+
+def clear_schema_caches() -> None:
+    """Drop the models and signatures cached by the `cached_*` helpers."""
+    _model_from_key.cache_clear()
+    _signature_from_key.cache_clear()
+    _pydantic_signature_from_key.cache_clear()
+
+
 def generate_request_id() -> str:
     """Generate a unique request ID."""
     return str(uuid.uuid4())
@@ -3,10 +3,6 @@
 import os
 import threading
 
-import requests
-import rich
-from semver import VersionInfo
-
 
 COMPOSIO_PYPI_METADATA = "https://pypi.org/pypi/composio-core/json"
 
@@ -15,6 +11,8 @@ _latest_version = None
 
 def _fetch_latest_version():
     global _latest_version
+    import requests  # pylint: disable=import-outside-toplevel
+
     request = requests.get(COMPOSIO_PYPI_METADATA, timeout=10.0)
     if request.status_code != 200:
         return
@@ -36,6 +34,10 @@ def create_latest_version_warning_hook(version: str):
             if _latest_version is None:
                 return
 
+            # pylint: disable=import-outside-toplevel
+            import rich
+            from semver import VersionInfo
+
             current_version = VersionInfo.parse(version)
             latest_version = VersionInfo.parse(_latest_version)
 
@@ -11,7 +11,7 @@ from autogen_core.tools import FunctionTool
 from composio import Action, ActionType, AppType, TagType
 from composio.tools import ComposioToolSet as BaseComposioToolSet
 from composio.tools.toolset import ProcessorsType
-from composio.utils.shared import get_signature_format_from_schema_params
+from composio.utils.shared import cached_signature_format_from_schema_params
 
 
 class ComposioToolSet(
@@ -139,7 +139,7 @@ class ComposioToolSet(
             ),
             closure=execute_action.__closure__,
         )
-        params = get_signature_format_from_schema_params(
+        params = cached_signature_format_from_schema_params(
             schema_params=schema["parameters"],
         )
         setattr(function, "__signature__", Signature(parameters=params))
@@ -197,7 +197,7 @@ class ComposioToolSet(
         )
 
         # Set signature and annotations
-        params = get_signature_format_from_schema_params(
+        params = cached_signature_format_from_schema_params(
             schema_params=schema["parameters"]
         )
         setattr(function, "__signature__", Signature(parameters=params))
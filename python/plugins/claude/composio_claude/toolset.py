@@ -23,7 +23,7 @@ from composio import Action, ActionType, AppType, TagType
 from composio.constants import DEFAULT_ENTITY_ID
 from composio.tools import ComposioToolSet as BaseComposioToolSet
 from composio.tools.schema import ClaudeSchema, SchemaType
-from composio.tools.toolset import ProcessorsType
+from composio.tools.toolset import DEFAULT_MAX_CONCURRENCY, ProcessorsType
 
 
 class ComposioToolSet(
@@ -164,6 +164,33 @@ class ComposioToolSet(
             _check_requested_actions=True,
         )
 
+    def execute_tool_calls(
+        self,
+        tool_calls: t.Sequence[ToolUseBlock],
+        entity_id: t.Optional[str] = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> t.List[t.Dict]:
+        """
+        Execute tool calls in parallel.
+
+        :param tool_calls: Tool calls metadata.
+        :param entity_id: Entity ID to use for executing function calls.
+        :param max_concurrency: Maximum number of tool calls executed at once.
+        :return: Output objects from the tool calls, in the same order.
+        """
+        return self.execute_actions(
+            calls=[
+                {
+                    "action": Action(value=tool_call.name),
+                    "params": t.cast(t.Dict, tool_call.input),
+                    "entity_id": entity_id or self.entity_id,
+                }
+                for tool_call in tool_calls
+            ],
+            max_concurrency=max_concurrency,
+            _check_requested_actions=True,
+        )
+
     def handle_tool_calls(
         self,
         llm_response: ToolsBetaMessage,
@@ -177,14 +204,12 @@ class ComposioToolSet(
         :param entity_id: Entity ID to use for executing function calls.
         :return: A list of output objects from the function calls.
         """
-        outputs = []
         entity_id = self.validate_entity_id(entity_id or self.entity_id)
-        for content in llm_response.content:
-            if isinstance(content, (ToolUseBlock, BetaToolUseBlock)):
-                outputs.append(
-                    self.execute_tool_call(
-                        tool_call=content,
-                        entity_id=entity_id or self.entity_id,
-                    )
-                )
-        return outputs
+        return self.execute_tool_calls(
+            tool_calls=[
+                content
+                for content in llm_response.content
+                if isinstance(content, (ToolUseBlock, BetaToolUseBlock))
+            ],
+            entity_id=entity_id or self.entity_id,
+        )
@@ -32,7 +32,7 @@ else:
     from composio.tools.toolset import ComposioToolSet as BaseComposioToolSet
     from composio.tools.toolset import ProcessorsType
     from composio.utils.pydantic import parse_pydantic_error
-    from composio.utils.shared import json_schema_to_model
+    from composio.utils.shared import cached_json_schema_to_model
 
     class ComposioToolSet(  # type: ignore[no-redef]
         BaseComposioToolSet,
@@ -122,7 +122,7 @@ else:
             return Wrapper(
                 name=action,
                 description=description,
-                args_schema=json_schema_to_model(
+                args_schema=cached_json_schema_to_model(
                     json_schema=schema_params,
                 ),
             )
@@ -18,8 +18,18 @@ from vertexai.generative_models import (
 from composio import Action, ActionType, AppType, TagType
 from composio.constants import DEFAULT_ENTITY_ID
 from composio.tools import ComposioToolSet as BaseComposioToolSet
+from composio.tools.toolset import DEFAULT_MAX_CONCURRENCY
 from composio.utils import help_msg
-from composio.utils.shared import json_schema_to_model
+from composio.utils.shared import cached_json_schema_to_model
+
+
+def _convert_map_composite(obj: t.Any) -> t.Any:
+    """Convert protobuf map composites in function call arguments to dicts."""
+    if isinstance(obj, MapComposite):
+        return {k: _convert_map_composite(v) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_convert_map_composite(item) for item in obj]
+    return obj
 
 
 class ComposioToolset(
@@ -90,7 +100,7 @@ class ComposioToolset(
         """Wraps composio tool as Google AI Python Gemini FunctionDeclaration object."""
         action = schema["name"]
         description = schema.get("description", action)
-        parameters = json_schema_to_model(schema["parameters"])
+        parameters = cached_json_schema_to_model(schema["parameters"])
 
         # Clean up properties by removing 'examples' field
         properties = parameters.schema().get("properties", {})
@@ -181,22 +191,39 @@ class ComposioToolset(
         :return: Object containing output data from the function call.
         """
         entity_id = self.validate_entity_id(entity_id or self.entity_id)
-
-        def convert_map_composite(obj):
-            if isinstance(obj, MapComposite):
-                return {k: convert_map_composite(v) for k, v in obj.items()}
-            if isinstance(obj, (list, tuple)):
-                return [convert_map_composite(item) for item in obj]
-            return obj
-
-        args = convert_map_composite(function_call.args)
-
         return self.execute_action(
             action=Action(value=function_call.name),
-            params=args,
+            params=_convert_map_composite(function_call.args),
             entity_id=entity_id,
         )
 
+    def execute_function_calls(
+        self,
+        function_calls: t.Sequence[t.Any],
+        entity_id: t.Optional[str] = DEFAULT_ENTITY_ID,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> t.List[t.Dict]:
+        """
+        Execute function calls in parallel.
+
+        :param function_calls: Function calls metadata from Gemini model response.
+        :param entity_id: Entity ID to use for executing the function calls.
+        :param max_concurrency: Maximum number of function calls executed at once.
+        :return: Output objects from the function calls, in the same order.
+        """
+        entity_id = self.validate_entity_id(entity_id or self.entity_id)
+        return self.execute_actions(
+            calls=[
+                {
+                    "action": Action(value=function_call.name),
+                    "params": _convert_map_composite(function_call.args),
+                    "entity_id": entity_id,
+                }
+                for function_call in function_calls
+            ],
+            max_concurrency=max_concurrency,
+        )
+
     def handle_response(
         self,
         response: GenerationResponse,
@@ -210,15 +237,13 @@ class ComposioToolset(
         :return: A list of output objects from the function calls.
         """
         entity_id = self.validate_entity_id(entity_id or self.entity_id)
-        outputs = []
+        function_calls = []
         for candidate in response.candidates:
             if isinstance(candidate.content, Content) and candidate.content.parts:
                 for part in candidate.content.parts:
                     if isinstance(part, Part) and part.function_call:
-                        outputs.append(
-                            self.execute_function_call(
-                                function_call=part.function_call,
-                                entity_id=entity_id,
-                            )
-                        )
-        return outputs
+                        function_calls.append(part.function_call)
+        return self.execute_function_calls(
+            function_calls=function_calls,
+            entity_id=entity_id,
+        )
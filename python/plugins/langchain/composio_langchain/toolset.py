@@ -14,8 +14,8 @@ from composio.tools.toolset import ProcessorsType
 from composio.utils import help_msg
 from composio.utils.pydantic import parse_pydantic_error
 from composio.utils.shared import (
-    get_signature_format_from_schema_params,
-    json_schema_to_model,
+    cached_json_schema_to_model,
+    cached_signature_format_from_schema_params,
 )
 
 
@@ -98,7 +98,7 @@ class ComposioToolSet(
             closure=function.__closure__,
         )
         action_func.__signature__ = Signature(  # type: ignore
-            parameters=get_signature_format_from_schema_params(
+            parameters=cached_signature_format_from_schema_params(
                 schema_params=schema_params
             )
         )
@@ -122,7 +122,7 @@ class ComposioToolSet(
             schema_params=schema_params,
             entity_id=entity_id,
         )
-        parameters = json_schema_to_model(json_schema=schema_params)
+        parameters = cached_json_schema_to_model(json_schema=schema_params)
         tool = StructuredTool.from_function(
             name=action,
             description=description,
@@ -11,7 +11,7 @@ from composio import ComposioToolSet as BaseComposioToolSet
 from composio import TagType
 from composio.tools.toolset import ProcessorsType
 from composio.utils import help_msg
-from composio.utils.shared import get_pydantic_signature_format_from_schema_params
+from composio.utils.shared import cached_pydantic_signature_format_from_schema_params
 
 
 class ComposioToolSet(
@@ -84,7 +84,7 @@ class ComposioToolSet(
             closure=function.__closure__,
         )
         action_func.__signature__ = Signature(  # type: ignore
-            parameters=get_pydantic_signature_format_from_schema_params(
+            parameters=cached_pydantic_signature_format_from_schema_params(
                 schema_params=schema_params
             )
         )
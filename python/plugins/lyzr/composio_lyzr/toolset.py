@@ -15,8 +15,8 @@ from composio.tools import ComposioToolSet as BaseComposioToolSet
 from composio.tools.toolset import ProcessorsType
 from composio.utils import help_msg
 from composio.utils.shared import (
-    get_signature_format_from_schema_params,
-    json_schema_to_model,
+    cached_json_schema_to_model,
+    cached_signature_format_from_schema_params,
 )
 
 
@@ -57,7 +57,7 @@ class ComposioToolSet(
             closure=function.__closure__,
         )
         action_func.__signature__ = Signature(  # type: ignore
-            parameters=get_signature_format_from_schema_params(
+            parameters=cached_signature_format_from_schema_params(
                 schema_params=schema["parameters"],
             )
         )
@@ -66,10 +66,10 @@ class ComposioToolSet(
             name=name,
             desc=description,
             function=action_func,
-            function_input=json_schema_to_model(
+            function_input=cached_json_schema_to_model(
                 json_schema=schema["parameters"],
             ),
-            function_output=json_schema_to_model(
+            function_output=cached_json_schema_to_model(
                 json_schema=schema["response"],
             ),
             default_params={},
@@ -21,7 +21,7 @@ from composio import ActionType, AppType, TagType
 from composio.constants import DEFAULT_ENTITY_ID
 from composio.tools import ComposioToolSet as BaseComposioToolSet
 from composio.tools.schema import OpenAISchema, SchemaType
-from composio.tools.toolset import ProcessorsType
+from composio.tools.toolset import DEFAULT_MAX_CONCURRENCY, ProcessorsType
 from composio.utils import help_msg
 
 
@@ -191,6 +191,33 @@ class ComposioToolSet(
             _check_requested_actions=True,
         )
 
+    def execute_tool_calls(
+        self,
+        tool_calls: t.Sequence[ChatCompletionMessageToolCall],
+        entity_id: t.Optional[str] = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> t.List[t.Dict]:
+        """
+        Execute tool calls in parallel.
+
+        :param tool_calls: Tool calls metadata.
+        :param entity_id: Entity ID to use for executing the function calls.
+        :param max_concurrency: Maximum number of tool calls executed at once.
+        :return: Output objects from the tool calls, in the same order.
+        """
+        return self.execute_actions(
+            calls=[
+                {
+                    "action": tool_call.function.name,
+                    "params": json.loads(tool_call.function.arguments),
+                    "entity_id": entity_id or self.entity_id,
+                }
+                for tool_call in tool_calls
+            ],
+            max_concurrency=max_concurrency,
+            _check_requested_actions=True,
+        )
+
     def handle_tool_calls(
         self,
         response: ChatCompletion,
@@ -205,18 +232,15 @@ class ComposioToolSet(
         :return: A list of output objects from the function calls.
         """
         entity_id = self.validate_entity_id(entity_id or self.entity_id)
-        outputs = []
+        tool_calls = []
         if response.choices:
             for choice in response.choices:
                 if choice.message.tool_calls:
-                    for tool_call in choice.message.tool_calls:
-                        outputs.append(
-                            self.execute_tool_call(
-                                tool_call=tool_call,
-                                entity_id=entity_id or self.entity_id,
-                            )
-                        )
-        return outputs
+                    tool_calls.extend(choice.message.tool_calls)
+        return self.execute_tool_calls(
+            tool_calls=tool_calls,
+            entity_id=entity_id or self.entity_id,
+        )
 
     def handle_assistant_tool_calls(
         self,
@@ -224,20 +248,20 @@ class ComposioToolSet(
         entity_id: t.Optional[str] = None,
     ) -> t.List:
         """Wait and handle assistant function calls"""
-        tool_outputs = []
-        for tool_call in t.cast(
+        tool_calls = t.cast(
             RequiredAction, run.required_action
-        ).submit_tool_outputs.tool_calls:
-            tool_response = self.execute_tool_call(
-                tool_call=t.cast(ChatCompletionMessageToolCall, tool_call),
-                entity_id=entity_id or self.entity_id,
-            )
-            tool_output = {
+        ).submit_tool_outputs.tool_calls
+        tool_responses = self.execute_tool_calls(
+            tool_calls=t.cast(t.List[ChatCompletionMessageToolCall], tool_calls),
+            entity_id=entity_id or self.entity_id,
+        )
+        return [
+            {
                 "tool_call_id": tool_call.id,
                 "output": json.dumps(tool_response),
             }
-            tool_outputs.append(tool_output)
-        return tool_outputs
+            for tool_call, tool_response in zip(tool_calls, tool_responses)
+        ]
 
     def wait_and_handle_assistant_tool_calls(
         self,
@@ -55,7 +55,7 @@ class ComposioToolSet(
         toolkit = Toolkit(name=name)
 
         # Get function parameters from schema
-        params = shared.get_signature_format_from_schema_params(parameters)
+        params = shared.cached_signature_format_from_schema_params(parameters)
 
         # Create function signature and annotations
         sig = Signature(parameters=params)
@@ -0,0 +1,124 @@
+"""
+Benchmark parsing a full actions listing.
+
+Compares decoding the listing to dictionaries and building `ActionModel`
+objects one by one against validating the models straight from the response
+body.
+
+Usage:
+    python scripts/bench_json.py [--file listing.json] [--actions 5000]
+
+Record a listing with:
+    curl -H "x-api-key: $COMPOSIO_API_KEY" \\
+        https://backend.composio.dev/api/v2/actions/list/all > listing.json
+"""
+
+import argparse
+import gc
+import json
+import time
+import tracemalloc
+import typing as t
+from pathlib import Path
+
+from composio.client.collections import ActionModel
+from composio.utils import fastjson
+
+
+def _make_listing(count: int) -> bytes:
+    """Make a listing shaped like the `/v2/actions/list/all` response."""
+    items = []
+    for i in range(count):
+        properties = {
+            f"param_{j}": {
+                "type": "string",
+                "title": f"Param {j}",
+                "description": f"Description of parameter {j} of action {i}. " * 4,
+                "examples": ["example"],
+            }
+            for j in range(8)
+        }
+        items.append(
+            {
+                "name": f"APP_{i % 250}_ACTION_{i}",
+                "display_name": f"Action {i}",
+                "description": f"Description of action {i}. " * 8,
+                "parameters": {
+                    "title": f"Action{i}Request",
+                    "type": "object",
+                    "properties": properties,
+                    "required": ["param_0"],
+                },
+                "response": {
+                    "title": f"Action{i}Response",
+                    "type": "object",
+                    "properties": {
+                        "data": {"type": "object", "title": "Data"},
+                        "successful": {"type": "boolean", "title": "Successful"},
+                        "error": {"type": "string", "title": "Error"},
+                    },
+                    "required": ["data", "successful"],
+                },
+                "appName": f"app_{i % 250}",
+                "appId": f"app-{i % 250}",
+                "tags": ["important", f"tag_{i % 7}"],
+                "enabled": True,
+                "logo": "https://cdn.composio.dev/logos/app.png",
+            }
+        )
+    return json.dumps({"items": items, "page": 1, "totalPages": 1}).encode()
+
+
+def _parse_dicts(content: bytes) -> t.List[ActionModel]:
+    return [ActionModel(**item) for item in json.loads(content)["items"]]
+
+
+def _parse_fast(content: bytes) -> t.List[ActionModel]:
+    return fastjson.validate_list(data=content, model=ActionModel, key="items") or []
+
+
+def _measure(
+    func: t.Callable[[bytes], t.List[ActionModel]],
+    content: bytes,
+    rounds: int,
+) -> t.Tuple[float, float]:
+    """Get the best time and the peak memory in MiB for parsing the listing."""
+    func(content)  # Warm up schema building and caches
+    best = float("inf")
+    for _ in range(rounds):
+        gc.collect()
+        start = time.perf_counter()
+        func(content)
+        best = min(best, time.perf_counter() - start)
+
+    gc.collect()
+    tracemalloc.start()
+    func(content)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best, peak / 1024 / 1024
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--file", type=Path, help="Recorded actions listing")
+    parser.add_argument("--actions", type=int, default=5000)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    if args.file is not None:
+        content = args.file.read_bytes()
+    else:
+        content = _make_listing(count=args.actions)
+
+    print(
+        f"Listing: {len(content) / 1024 / 1024:.1f} MiB, "
+        f"orjson: {'yes' if fastjson.orjson is not None else 'no'}"
+    )
+    for name, func in (("dicts", _parse_dicts), ("validate_json", _parse_fast)):
+        seconds, peak = _measure(func=func, content=content, rounds=args.rounds)
+        print(f"{name:>14}: {seconds * 1000:8.1f} ms, peak {peak:7.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
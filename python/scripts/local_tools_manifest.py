@@ -0,0 +1,13 @@
+"""
+Generate the local tools manifest.
+
+Usage:
+    python scripts/local_tools_manifest.py
+"""
+
+from composio.tools.local.manifest import MANIFEST_PATH, write_manifest
+
+
+if __name__ == "__main__":
+    manifest = write_manifest()
+    print(f"Wrote {len(manifest['tools'])} tools to {MANIFEST_PATH}")
@@ -3,10 +3,15 @@ Test `composio apps` command group.
 """
 
 import random
+import shutil
 import typing as t
 from pathlib import Path
 
+import pytest
+
+from composio.cli import apps
 from composio.client import enums
+from composio.client.enums.store import EnumStore
 
 from tests.conftest import skip_if_ci
 from tests.test_cli.base import BaseCliTest
@@ -95,3 +100,50 @@ class TestUpdate(BaseCliTest):
             if cls == to_update:
                 continue
             self.assert_stdout(f"{cls.__name__}s does not require update")
+
+
+def test_generate_type_stub(tmp_path: Path) -> None:
+    """Test stubs are only rewritten when the enum members change."""
+    enum_file = tmp_path / "tag.py"
+    shutil.copy(Path(enums.__file__).parent / "tag.py", enum_file)
+    stub_file = tmp_path / "tag.pyi"
+
+    assert apps.generate_type_stub(str(enum_file), ["GITHUB_REPOS", "SLACK_USERS"])
+    stub = stub_file.read_text(encoding="utf-8")
+    assert stub.startswith(apps.STUB_DIGEST_PREFIX)
+    assert "    GITHUB_REPOS: 'Tag'\n    SLACK_USERS: 'Tag'" in stub
+
+    mtime = stub_file.stat().st_mtime_ns
+    assert not apps.generate_type_stub(str(enum_file), ["GITHUB_REPOS", "SLACK_USERS"])
+    assert stub_file.stat().st_mtime_ns == mtime
+
+    assert apps.generate_type_stub(str(enum_file), ["GITHUB_REPOS"])
+    assert "SLACK_USERS" not in stub_file.read_text(encoding="utf-8")
+
+
+def test_generate_type_stubs(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test the stub changes are diffed against the cache before the refresh."""
+    store = EnumStore(path=tmp_path / "enums.db")
+    store.put(enums.Tag.cache_folder, "GITHUB_REPOS", {"app": "github", "value": "r"})
+    monkeypatch.setattr(apps, "get_enum_store", lambda: store)
+
+    def refresh_cache(client: t.Any) -> None:  # pylint: disable=unused-argument
+        store.sync(
+            enums.Tag.cache_folder,
+            records={"SLACK_USERS": {"app": "slack", "value": "users"}},
+        )
+
+    written = []
+    monkeypatch.setattr(apps, "refresh_cache", refresh_cache)
+    monkeypatch.setattr(
+        apps,
+        "generate_type_stub",
+        lambda enum_file, enum_names: written.append(enum_file) or True,
+    )
+    changes = apps.generate_type_stubs(t.cast(t.Any, None))
+    assert changes["tag.pyi"] == apps.StubChange(
+        added=["SLACK_USERS"],
+        removed=["GITHUB_REPOS"],
+        written=True,
+    )
+    assert len(written) == 4
@@ -0,0 +1,170 @@
+"""
+Test in-process caches.
+"""
+
+import time
+from unittest import mock
+
+import pytest
+
+from composio.client import Entity
+from composio.client.cache import (
+    ConnectedAccountCache,
+    action_schema_cache,
+    client_scope,
+    connected_account_cache,
+)
+from composio.client.collections import Actions, ConnectedAccountModel
+from composio.client.exceptions import HTTPError, NoItemsFound
+
+
+_SCHEMA = {
+    "name": "MOCK_ACTION",
+    "parameters": {"properties": {}, "title": "Request", "type": "object"},
+    "response": {"properties": {}, "title": "Response", "type": "object"},
+    "appName": "mock",
+    "appId": "mock",
+    "tags": [],
+}
+
+
+def _response(status_code: int, etag: str = "v1") -> mock.MagicMock:
+    return mock.MagicMock(
+        status_code=status_code,
+        headers={"ETag": etag},
+        json=lambda: _SCHEMA,
+    )
+
+
+def test_action_schema_cache_revalidation() -> None:
+    """Test schemas are served from cache and revalidated using ETags."""
+    action_schema_cache.invalidate()
+    action = mock.MagicMock(slug="MOCK_ACTION")
+    http = mock.MagicMock()
+    http.get.return_value = _response(status_code=200)
+    client = mock.MagicMock(http=http, base_url="https://one/api", api_key="key")
+    actions = Actions(client=client)
+
+    model = actions.get_schema(action=action)
+    assert model.name == "MOCK_ACTION"
+    assert actions.get_schema(action=action) is model
+    http.get.assert_called_once_with(url="/v2/actions/MOCK_ACTION", headers={})
+
+    with mock.patch.object(action_schema_cache, "ttl", -1.0):
+        action_schema_cache.set(
+            scope=client_scope(client),
+            slug=action.slug,
+            model=model,
+            etag="v1",
+        )
+        http.get.return_value = _response(status_code=304)
+        assert actions.get_schema(action=action) is model
+
+    http.get.assert_called_with(
+        url="/v2/actions/MOCK_ACTION",
+        headers={"If-None-Match": "v1"},
+    )
+
+    # Clients for other servers or projects don't share schemas
+    for base_url, api_key in (("https://two/api", "key"), ("https://one/api", "other")):
+        other = Actions(
+            client=mock.MagicMock(http=http, base_url=base_url, api_key=api_key)
+        )
+        http.get.return_value = _response(status_code=200)
+        assert other.get_schema(action=action) is not model
+    assert http.get.call_args_list[-1].kwargs["headers"] == {}
+    action_schema_cache.invalidate()
+
+
+def test_action_schema_cache_seed() -> None:
+    """Test seeded schemas are copies of the listed schemas."""
+    action_schema_cache.invalidate()
+    model = Actions.model(**_SCHEMA)
+    action_schema_cache.seed(scope="scope", models=[model])
+    model.parameters.properties["mutated"] = {}
+
+    entry = action_schema_cache.get(scope="scope", slug="mock_action")
+    assert entry is not None and entry.fresh
+    assert "mutated" not in entry.model.parameters.properties
+    assert action_schema_cache.get(scope="other", slug="mock_action") is None
+
+    action_schema_cache.invalidate(scope="scope", slug="mock_action")
+    assert action_schema_cache.get(scope="scope", slug="MOCK_ACTION") is None
+    action_schema_cache.invalidate()
+
+
+def _account(id: str, app: str, created_at: str) -> ConnectedAccountModel:
+    return ConnectedAccountModel(
+        id=id,
+        status="ACTIVE",
+        createdAt=created_at,
+        updatedAt=created_at,
+        appUniqueId=app,
+        appName=app,
+        integrationId="integration",
+        connectionParams={},
+        clientUniqueUserId="entity",
+    )
+
+
+def test_connected_account_cache() -> None:
+    """Test entity connections are cached per app and invalidated on 401."""
+    client = mock.MagicMock(api_key="api-key", base_url="https://one/api")
+    scope = client_scope(client)
+    assert "api-key" not in scope
+    connected_account_cache.invalidate(scope=scope)
+    client.connected_accounts.get.return_value = [
+        _account("old", "github", "2024-01-01T00:00:00.000Z"),
+        _account("new", "github", "2024-06-01T00:00:00.000Z"),
+        _account("slack", "slack", "2024-01-01T00:00:00.000Z"),
+    ]
+    entity = Entity(client=client, id="entity")
+
+    assert entity.get_connection(app="github").id == "new"
+    assert entity.get_connection(app="SLACK").id == "slack"
+    client.connected_accounts.get.assert_called_once_with(
+        entity_ids=["entity"], active=True
+    )
+
+    # Missing connections are not cached
+    with pytest.raises(NoItemsFound):
+        entity.get_connection(app="gmail")
+    assert client.connected_accounts.get.call_count == 2
+
+    # Other API keys have their own entries
+    other = Entity(
+        client=mock.MagicMock(api_key="other-key", base_url="https://one/api"),
+        id="entity",
+    )
+    other.client.connected_accounts.get.return_value = []
+    with pytest.raises(NoItemsFound):
+        other.get_connection(app="github")
+
+    collection = Actions(client=client)
+    with pytest.raises(HTTPError):
+        collection._raise_if_required(mock.MagicMock(status_code=401, content=b""))
+    assert (
+        connected_account_cache.get(scope=scope, entity_id="entity", app="github")
+        is None
+    )
+
+
+def test_connected_account_cache_bounds() -> None:
+    """Test the connected account cache is bounded and drops expired entries."""
+    cache = ConnectedAccountCache(ttl=60.0, maxsize=2)
+    accounts = {
+        app: _account(app, app, "2024-01-01T00:00:00.000Z")
+        for app in ("github", "slack", "gmail")
+    }
+    cache.set(scope="scope", entity_id="entity", accounts=accounts)
+    assert cache.get(scope="scope", entity_id="entity", app="github") is None
+    assert cache.get(scope="scope", entity_id="entity", app="gmail") is not None
+
+    for account in accounts.values():
+        cache.set_account(scope="scope", account=account)
+    assert cache.get_account(scope="scope", connected_account_id="github") is None
+    assert len(cache._by_id) == 2  # pylint: disable=protected-access
+
+    with mock.patch("time.monotonic", return_value=time.monotonic() + 120):
+        cache.set_account(scope="scope", account=accounts["github"])
+    assert len(cache._by_id) == 1  # pylint: disable=protected-access
@@ -2,15 +2,21 @@
 Test the auto-generate Enum
 """
 
-import logging
+import threading
+from pathlib import Path
 from typing import Dict, List
+from unittest import mock
 
 import pytest
 from pydantic import BaseModel
 
 from composio import action
+from composio.client import Composio
 from composio.client.enums import Action, App, Tag, Trigger
+from composio.client.enums import action as action_module
+from composio.client.enums import enum as enum_module
 from composio.client.enums.enum import EnumStringNotFound
+from composio.client.enums.store import EnumStore, get_enum_store
 from composio.tools.base.local import LocalAction, LocalTool
 
 
@@ -69,31 +75,23 @@ class TestBase:
         assert enum.is_local
 
     def test_load_remote_app(self) -> None:
-        if App.ATTIO.storage_path.exists():
-            App.ATTIO.storage_path.unlink()
+        get_enum_store().delete(App.cache_folder, App.ATTIO.slug)
 
         enum = App(value=App.ATTIO.slug)
         assert enum.slug == App.ATTIO.slug
         assert not enum.is_local  # This load()s the app from api
 
-    def test_load_remote_action(self, caplog: pytest.LogCaptureFixture) -> None:
-        with caplog.at_level(logging.DEBUG):
-            if Action.GITHUB_ACCEPT_A_REPOSITORY_INVITATION.storage_path.exists():
-                Action.GITHUB_ACCEPT_A_REPOSITORY_INVITATION.storage_path.unlink()
+    def test_load_remote_action(self) -> None:
+        slug = Action.GITHUB_ACCEPT_A_REPOSITORY_INVITATION.slug
+        get_enum_store().delete(Action.cache_folder, slug)
 
-            enum = Action(value=Action.GITHUB_ACCEPT_A_REPOSITORY_INVITATION.slug)
-            assert enum.slug == Action.GITHUB_ACCEPT_A_REPOSITORY_INVITATION.slug
-            assert not enum.is_local  # This load()s the action from api
-
-        assert (
-            "Storing ActionData to" in message
-            and ".composio/actions/GITHUB_ACCEPT_A_REPOSITORY_INVITATION" in message
-            for message in caplog.messages
-        )
+        enum = Action(value=slug)
+        assert enum.slug == slug
+        assert not enum.is_local  # This load()s the action from api
+        assert get_enum_store().get(Action.cache_folder, slug) is not None
 
     def test_load_remote_trigger(self) -> None:
-        if Trigger.GITHUB_COMMIT_EVENT.storage_path.exists():
-            Trigger.GITHUB_COMMIT_EVENT.storage_path.unlink()
+        get_enum_store().delete(Trigger.cache_folder, Trigger.GITHUB_COMMIT_EVENT.slug)
 
         enum = Trigger(value=Trigger.GITHUB_COMMIT_EVENT.slug)
         assert enum.slug == Trigger.GITHUB_COMMIT_EVENT.slug
@@ -173,3 +171,95 @@ def test_invalid_enum():
 
     with pytest.raises(EnumStringNotFound):
         App.SOME_BS.load()
+
+
+def test_load_many(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test missing actions are fetched concurrently and stored in one write."""
+    store = EnumStore(path=tmp_path / "enums.db")
+    store.put(
+        Action.cache_folder,
+        "FAKEAPP_STORED",
+        {"name": "FAKEAPP_STORED", "app": "fakeapp", "tags": []},
+    )
+    monkeypatch.setattr(enum_module, "get_enum_store", lambda: store)
+    monkeypatch.setattr(enum_module, "NO_REMOTE_ENUM_FETCHING", False)
+    monkeypatch.setattr(action_module, "_NO_AUTH_CACHE", {})
+
+    urls = []
+    lock = threading.Lock()
+
+    def _get(url: str) -> mock.Mock:
+        with lock:
+            urls.append(url)
+        name = url.rsplit("/", 1)[-1]
+        if "/apps/" in url:
+            return mock.Mock(status_code=200, json=lambda: {"no_auth": True})
+        return mock.Mock(
+            status_code=200,
+            json=lambda: {
+                "name": name,
+                "appName": name.split("_")[0].lower(),
+                "tags": [],
+                "description": "",
+            },
+        )
+
+    client = mock.Mock()
+    client.http.get.side_effect = _get
+    client.actions.endpoint = mock.MagicMock()
+    client.actions.endpoint.__truediv__ = lambda _, slug: f"/v2/actions/{slug}"
+    client.apps.endpoint = mock.MagicMock()
+    client.apps.endpoint.__truediv__ = lambda _, slug: f"/v1/apps/{slug}"
+    monkeypatch.setattr(Composio, "get_latest", lambda: client)
+
+    slugs = ["FAKEAPP_STORED"] + [f"FAKEAPP_ACTION_{i}" for i in range(5)]
+    slugs += ["OTHERAPP_ACTION"]
+    try:
+        with mock.patch.object(store, "put_many", wraps=store.put_many) as put_many:
+            actions = Action.load_many(slugs)
+        assert [action.slug for action in actions] == slugs
+        assert all(action.no_auth for action in actions[1:])
+        assert not actions[0].no_auth
+        put_many.assert_called_once()
+
+        # One request per missing action and one per app
+        assert len(urls) == 8
+        assert sorted(url for url in urls if "/apps/" in url) == [
+            "/v1/apps/fakeapp",
+            "/v1/apps/otherapp",
+        ]
+        assert store.get(Action.cache_folder, "OTHERAPP_ACTION") is not None
+
+        # The app `no_auth` flag is memoized
+        Action.load_many(["FAKEAPP_NEW"])
+        assert urls[-1] == "/v2/actions/FAKEAPP_NEW"
+    finally:
+        for slug in slugs + ["FAKEAPP_NEW"]:
+            Action.cache.pop(slug, None)
+
+
+def test_name_index(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test the name index suggestions and refresh on cache changes."""
+    store = EnumStore(path=tmp_path / "enums.db")
+    store.put_many(
+        Tag.cache_folder,
+        records=[
+            (slug, {"app": "github", "value": slug.lower()})
+            for slug in ("GITHUB_REPOS", "GITHUB_ISSUES", "SLACK_CHANNELS")
+        ],
+    )
+    monkeypatch.setattr(enum_module, "get_enum_store", lambda: store)
+    monkeypatch.setattr(enum_module, "NO_REMOTE_ENUM_FETCHING", True)
+
+    index = Tag.index()
+    assert Tag.index() is index
+    assert "GITHUB_REPOS" in index
+    assert index.suggest("GITHUB_REPO") == ["GITHUB_REPOS"]
+    assert index.suggest("SOMETHING_ELSE") == []
+
+    with pytest.raises(EnumStringNotFound, match="Did you mean 'SLACK_CHANNELS'"):
+        Tag.load_many(["SLACK_CHANELS"])
+
+    store.put(Tag.cache_folder, "SLACK_USERS", {"app": "slack", "value": "users"})
+    assert "SLACK_USERS" in Tag.index()
+    assert Tag.index() is not index
@@ -0,0 +1,221 @@
+"""
+Test HTTP clients.
+"""
+
+import asyncio
+import threading
+import typing as t
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest import mock
+
+from aiohttp import web
+
+from composio.client.base import AsyncCollection
+from composio.client.endpoints import Endpoint
+from composio.client.http import AsyncHttpClient, HttpClient, RetryPolicy
+from composio.client.metrics import MetricsCollector, RequestHook, RequestInfo
+
+
+class _AsyncCollection(AsyncCollection[dict]):
+    endpoint = Endpoint("/v1/items")
+    model = dict
+
+
+async def _serve(
+    handler: t.Callable,
+    test: t.Callable[[str], t.Awaitable[None]],
+) -> None:
+    app = web.Application()
+    app.router.add_route("*", "/{tail:.*}", handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    (port,) = [s.getsockname()[1] for s in site._server.sockets]  # type: ignore
+    try:
+        await test(f"http://127.0.0.1:{port}")
+    finally:
+        await runner.cleanup()
+
+
+def test_async_http_client_headers_and_pooling() -> None:
+    """Test async client sends the default headers and reuses its session."""
+    seen: t.List[t.Mapping] = []
+
+    async def handler(request: web.Request) -> web.Response:
+        seen.append(request.headers.copy())
+        return web.json_response({"items": [{"id": 1}, {"id": 2}]})
+
+    async def test(base_url: str) -> None:
+        http = AsyncHttpClient(base_url=base_url, api_key="api-key", runtime="test")
+        collection = _AsyncCollection(
+            client=t.cast(t.Any, type("Client", (), {"http": http})())
+        )
+        assert await collection.get() == [{"id": 1}, {"id": 2}]
+        session = http.session
+        response = await http.post("/v1/items", json={}, headers={"x-custom": "1"})
+        assert response.status_code == 200
+        assert http.session is session
+        await http.close()
+
+    asyncio.run(_serve(handler, test))
+    assert all(headers["x-api-key"] == "api-key" for headers in seen)
+    assert all(headers["x-runtime"] == "test" for headers in seen)
+    assert seen[1]["x-custom"] == "1"
+    assert seen[0]["x-request-id"] != seen[1]["x-request-id"]
+
+
+def test_async_http_client_retries_timeouts() -> None:
+    """Test async client retries requests which time out."""
+    calls = []
+
+    async def handler(request: web.Request) -> web.Response:
+        calls.append(request.path)
+        if len(calls) < 3:
+            await asyncio.sleep(1.0)
+        return web.json_response({})
+
+    async def test(base_url: str) -> None:
+        http = AsyncHttpClient(base_url=base_url, api_key="api-key", timeout=0.2)
+        response = await http.get("/v1/slow")
+        assert response.json() == {}
+        await http.close()
+
+    asyncio.run(_serve(handler, test))
+    assert len(calls) == 3
+
+
+def test_http_client_retries_keep_headers() -> None:
+    """Test sync client retries unavailable responses without losing headers."""
+    seen: t.List[t.Mapping] = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:  # pylint: disable=invalid-name
+            seen.append(self.headers)
+            status = 503 if len(seen) < 3 else 200
+            self.send_response(status)
+            self.send_header("Retry-After", "0")
+            self.send_header("Content-Length", "2")
+            self.end_headers()
+            self.wfile.write(b"{}")
+
+        def log_message(self, *args: t.Any) -> None:
+            pass
+
+    metrics = MetricsCollector()
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        http = HttpClient(
+            base_url=f"http://127.0.0.1:{server.server_address[1]}",
+            api_key="api-key",
+            pool_maxsize=4,
+            request_hooks=[metrics],
+        )
+        response = http.get("/v1/apps", headers={"x-custom": "1"})
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert response.status_code == 200
+    assert len(seen) == 3
+    assert all(headers["x-custom"] == "1" for headers in seen)
+    assert all(headers["x-api-key"] == "api-key" for headers in seen)
+    assert len({headers["x-request-id"] for headers in seen}) == 3
+
+    endpoint = metrics.snapshot()["GET /v1/apps"]
+    assert endpoint["count"] == 3
+    assert endpoint["retries"] == 2
+    assert endpoint["status_codes"] == {"503": 2, "200": 1}
+    assert endpoint["bytes_in"] == 6
+
+
+def test_async_http_client_request_hooks() -> None:
+    """Test async client calls the request hooks around every attempt."""
+    events: t.List[t.Tuple[str, RequestInfo, t.Any]] = []
+
+    class Hook(RequestHook):
+        def before_request(self, request: RequestInfo) -> None:
+            events.append(("before_request", request, None))
+
+        def after_response(  # type: ignore[no-untyped-def]
+            self, request, elapsed, response=None, error=None
+        ):
+            events.append(("after_response", request, response or error))
+
+        def on_retry(  # type: ignore[no-untyped-def]
+            self, request, delay, response=None, error=None
+        ):
+            events.append(("on_retry", request, delay))
+
+    class Broken(RequestHook):
+        def before_request(self, request: RequestInfo) -> None:
+            raise RuntimeError("Broken hook")
+
+    async def handler(request: web.Request) -> web.Response:
+        if len(events) < 3:
+            return web.Response(status=429, headers={"Retry-After": "0"})
+        return web.json_response({"id": request.match_info["tail"]})
+
+    async def test(base_url: str) -> None:
+        http = AsyncHttpClient(
+            base_url=base_url,
+            api_key="api-key",
+            request_hooks=[Broken(), Hook()],
+        )
+        response = await http.post("/v1/connectedAccounts/42", data=b"body")
+        assert response.status_code == 200
+        await http.close()
+
+    asyncio.run(_serve(handler, test))
+    assert [event for event, *_ in events] == [
+        "before_request",
+        "after_response",
+        "on_retry",
+        "before_request",
+        "after_response",
+    ]
+    first, second = events[0][1], events[3][1]
+    assert (first.method, first.endpoint, first.bytes_out) == (
+        "POST",
+        "/v1/connectedAccounts/{id}",
+        4,
+    )
+    assert (first.attempt, second.attempt) == (0, 1)
+    assert first.request_id != second.request_id
+    assert events[1][2].status_code == 429
+
+
+def test_retry_policy() -> None:
+    """Test retry decisions and backoff of the default retry policy."""
+    policy = RetryPolicy(backoff_factor=1.0, max_backoff=4.0, budget=10.0)
+
+    def response(status_code: int, **headers: str) -> t.Any:
+        return mock.Mock(status_code=status_code, headers=headers)
+
+    # Server errors and timeouts are only retried for idempotent methods
+    assert policy.is_retryable("get", response=response(503))
+    assert not policy.is_retryable("post", response=response(503))
+    assert not policy.is_retryable("post", error=TimeoutError())
+    assert not policy.is_retryable("get", response=response(500))
+
+    # Rejected requests can always be retried
+    assert policy.is_retryable("post", response=response(429))
+    assert policy.get_backoff(0, response=response(429, **{"Retry-After": "3"})) == 3.0
+
+    # Full jitter never exceeds the capped exponential backoff
+    assert all(0 <= policy.get_backoff(attempt) <= 4.0 for attempt in range(10))
+
+    # Retries stop once the attempts or the time budget are used up
+    assert policy.next_delay("get", attempt=3, slept=0.0) is None
+    assert policy.next_delay("get", attempt=0, slept=10.0, error=TimeoutError()) is None
+    assert (
+        policy.next_delay(
+            "get",
+            attempt=0,
+            slept=0.0,
+            response=response(503, **{"Retry-After": "60"}),
+        )
+        is None
+    )
@@ -0,0 +1,111 @@
+"""
+Test request metrics.
+"""
+
+from unittest import mock
+
+import pytest
+
+from composio.client import Composio
+from composio.client.metrics import MetricsCollector, RequestInfo, get_endpoint_name
+
+
+def _request(endpoint: str = "/v1/apps", method: str = "GET") -> RequestInfo:
+    return RequestInfo(
+        method=method,
+        url=f"https://backend.composio.dev/api{endpoint}",
+        endpoint=endpoint,
+        request_id="request-id",
+        bytes_out=10,
+    )
+
+
+def test_get_endpoint_name() -> None:
+    """Test object IDs, slugs and query strings are dropped from endpoint names."""
+    assert get_endpoint_name("/v1/apps?limit=10") == "/v1/apps"
+    assert (
+        get_endpoint_name("/v1/connectedAccounts/6b1c9ed8-0a4c-4c52-9b3e-29e7f8f7a2d1")
+        == "/v1/connectedAccounts/{id}"
+    )
+    assert get_endpoint_name("/v1/triggers/42/status") == "/v1/triggers/{id}/status"
+    assert (
+        get_endpoint_name("/v2/actions/GITHUB_STAR_REPO/execute")
+        == "/v2/actions/{id}/execute"
+    )
+    assert (
+        get_endpoint_name("/v1/triggers/enable/ca_V1StGXR8Z5jdHi6B/GITHUB_COMMIT_EVENT")
+        == "/v1/triggers/enable/{id}/{id}"
+    )
+    assert get_endpoint_name("/v1/apps/github") == "/v1/apps/{id}"
+
+
+def test_metrics_opt_in() -> None:
+    """Test clients only collect metrics when asked to."""
+    assert Composio(api_key="api-key").metrics() is None
+    assert Composio(api_key="api-key").request_hooks == []
+
+    client = Composio(api_key="api-key", collect_metrics=True)
+    assert isinstance(client.metrics(), MetricsCollector)
+    assert client.request_hooks == [client.metrics()]
+
+
+def test_metrics_collector() -> None:
+    """Test latencies, status codes, payload sizes and retries are recorded."""
+    collector = MetricsCollector(buckets=(0.1, 1.0))
+    response = mock.Mock(status_code=200, content=b"{}")
+    for elapsed in (0.05, 0.05, 0.5, 2.0):
+        collector.after_response(_request(), elapsed=elapsed, response=response)
+    collector.after_response(_request(), elapsed=1.0, error=TimeoutError())
+    collector.on_retry(_request(), delay=0.5, error=TimeoutError())
+
+    metrics = collector.snapshot()["GET /v1/apps"]
+    assert metrics["count"] == 5
+    assert metrics["latency"]["buckets"] == {"0.1": 2, "1.0": 2, "+Inf": 1}
+    # Interpolated within the (0.1, 1.0] bucket
+    assert metrics["latency"]["p50"] == pytest.approx(0.325)
+    assert metrics["latency"]["p99"] == 1.0
+    assert metrics["status_codes"] == {"200": 4, "error": 1}
+    assert metrics["bytes_in"] == 8
+    assert metrics["bytes_out"] == 50
+    assert metrics["retries"] == 1
+
+    collector.reset()
+    assert collector.snapshot() == {}
+
+
+def test_metrics_cache_lookups() -> None:
+    """Test cache hits and misses are recorded and exported."""
+    collector = MetricsCollector()
+    for hit in (True, False, False):
+        collector.observe_cache("results", hit=hit)
+    assert collector.cache_snapshot() == {"results": {"hits": 1, "misses": 2}}
+
+    lines = collector.to_prometheus().splitlines()
+    name = "composio_http_cache_lookups_total"
+    assert f"# TYPE {name} counter" in lines
+    assert f'{name}{{cache="results",result="hit"}} 1' in lines
+    assert f'{name}{{cache="results",result="miss"}} 2' in lines
+
+    collector.reset()
+    assert collector.cache_snapshot() == {}
+
+
+def test_metrics_prometheus_export() -> None:
+    """Test metrics are exported in the Prometheus text format."""
+    collector = MetricsCollector(buckets=(0.1, 1.0))
+    collector.after_response(
+        _request(endpoint='/v1/a"b', method="POST"),
+        elapsed=0.5,
+        response=mock.Mock(status_code=201, content=b"abc"),
+    )
+    lines = collector.to_prometheus().splitlines()
+    labels = 'method="POST",endpoint="/v1/a\\"b"'
+    histogram = "composio_http_request_duration_seconds"
+    assert f"# TYPE {histogram} histogram" in lines
+    assert f'{histogram}_bucket{{{labels},le="0.1"}} 0' in lines
+    assert f'{histogram}_bucket{{{labels},le="1.0"}} 1' in lines
+    assert f'{histogram}_bucket{{{labels},le="+Inf"}} 1' in lines
+    assert f"{histogram}_count{{{labels}}} 1" in lines
+    assert f'composio_http_requests_total{{{labels},status="201"}} 1' in lines
+    assert f"composio_http_bytes_in_total{{{labels}}} 3" in lines
+    assert f"composio_http_retries_total{{{labels}}} 0" in lines
@@ -0,0 +1,145 @@
+"""
+Test enum store.
+"""
+
+import json
+import multiprocessing
+import os
+from pathlib import Path
+
+import pytest
+
+from composio.client.enums.store import EnumStore, meta_key
+
+
+def test_enum_store(tmp_path: Path) -> None:
+    """Test records are looked up by slug and prefix."""
+    store = EnumStore(path=tmp_path / "enums.db")
+    store.put_many(
+        "actions",
+        records=[
+            ("GITHUB_STAR_REPO", {"name": "GITHUB_STAR_REPO", "app": "github"}),
+            ("GITHUB_LIST_ISSUES", {"name": "GITHUB_LIST_ISSUES", "app": "github"}),
+            ("GITHUBX_ACTION", {"name": "GITHUBX_ACTION", "app": "githubx"}),
+            ("SLACK_SEND_MESSAGE", {"name": "SLACK_SEND_MESSAGE", "app": "slack"}),
+        ],
+    )
+    store.put("apps", "GITHUB", {"name": "github"})
+
+    assert store.get("actions", "GITHUB_STAR_REPO") == {
+        "name": "GITHUB_STAR_REPO",
+        "app": "github",
+    }
+    assert store.get("actions", "GITHUB") is None
+    assert store.get("apps", "GITHUB") == {"name": "github"}
+    assert store.count("actions") == 4
+    assert store.slugs("actions", prefix="GITHUB_") == [
+        "GITHUB_LIST_ISSUES",
+        "GITHUB_STAR_REPO",
+    ]
+    assert [slug for slug, _ in store.records("actions", limit=1)] == ["GITHUBX_ACTION"]
+
+    store.delete("actions", "GITHUB_STAR_REPO")
+    assert store.slugs("actions", prefix="GITHUB_") == ["GITHUB_LIST_ISSUES"]
+
+    store.put_many("actions", records=[("NEW", {"name": "NEW"})], replace=True)
+    assert store.slugs("actions") == ["NEW"]
+    assert store.slugs("apps") == ["GITHUB"]
+
+    store.clear()
+    assert store.count("apps") == 0
+    store.close()
+
+
+def test_enum_store_migration(tmp_path: Path) -> None:
+    """Test records are migrated from the per-enum cache folders once."""
+    actions = tmp_path / "actions"
+    actions.mkdir()
+    (actions / "GITHUB_STAR_REPO").write_text(
+        json.dumps({"name": "GITHUB_STAR_REPO", "app": "github", "path": None})
+    )
+    (actions / "BROKEN").write_text("{")
+    (tmp_path / "apps").mkdir()
+    (tmp_path / "apps" / "GITHUB").write_text(json.dumps({"name": "github"}))
+
+    store = EnumStore(path=tmp_path / "enums.db", legacy_directory=tmp_path)
+    assert store.slugs("actions") == ["GITHUB_STAR_REPO"]
+    assert store.get("actions", "GITHUB_STAR_REPO") == {
+        "name": "GITHUB_STAR_REPO",
+        "app": "github",
+    }
+    assert store.get("apps", "GITHUB") == {"name": "github"}
+    store.delete("apps", "GITHUB")
+    store.close()
+
+    # Migration only runs the first time the store is opened
+    store = EnumStore(path=tmp_path / "enums.db", legacy_directory=tmp_path)
+    assert store.get("apps", "GITHUB") is None
+    store.close()
+
+
+def test_enum_store_sync(tmp_path: Path) -> None:
+    """Test only changed records are written when syncing a kind."""
+    store = EnumStore(path=tmp_path / "enums.db")
+    store.put("apps", "GITHUB", {"name": "github"})
+    written, removed = store.sync(
+        "actions",
+        records={"A": {"x": 1, "y": 2}, "B": {"x": 2}},
+        meta={meta_key("actions", "etag"): '"v1"'},
+    )
+    assert (written, removed) == (2, 0)
+    assert store.get_meta(meta_key("actions", "etag")) == '"v1"'
+
+    # Key order doesn't make a record change
+    written, removed = store.sync("actions", records={"A": {"y": 2, "x": 1}})
+    assert (written, removed) == (0, 1)
+    assert store.slugs("actions") == ["A"]
+    assert store.slugs("apps") == ["GITHUB"]
+
+    store.set_meta("other", "1")
+    store.clear("actions")
+    assert store.get_meta(meta_key("actions", "etag")) is None
+    assert store.get_meta("other") == "1"
+    store.set_meta("other", None)
+    assert store.get_meta("other") is None
+    store.close()
+
+
+def test_enum_store_get_many(tmp_path: Path) -> None:
+    """Test records are read in bulk."""
+    store = EnumStore(path=tmp_path / "enums.db")
+    store.put_many("actions", records=[(f"A_{i}", {"i": i}) for i in range(2000)])
+    records = store.get_many("actions", [f"A_{i}" for i in range(0, 2000, 2)] + ["B"])
+    assert len(records) == 1000
+    assert records["A_1998"] == {"i": 1998}
+    store.close()
+
+
+def _write_in_child(store: EnumStore, slug: str) -> None:
+    # The connection inherited from the parent is dropped on fork
+    assert store._connection is None  # pylint: disable=protected-access
+    store.put("actions", slug, {"pid": os.getpid()})
+    assert store.get("actions", "PARENT") == {"name": "parent"}
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="Requires fork()")
+def test_enum_store_after_fork(tmp_path: Path) -> None:
+    """Test forked children don't reuse the connection of the parent."""
+    store = EnumStore(path=tmp_path / "enums.db")
+    store.put("actions", "PARENT", {"name": "parent"})
+    parent_connection = store.connection
+
+    context = multiprocessing.get_context("fork")
+    processes = [
+        context.Process(target=_write_in_child, args=(store, f"CHILD_{i}"))
+        for i in range(4)
+    ]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join(timeout=60)
+        assert process.exitcode == 0
+
+    assert store.connection is parent_connection
+    assert store.slugs("actions") == [f"CHILD_{i}" for i in range(4)] + ["PARENT"]
+    store.close()
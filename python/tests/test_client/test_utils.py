@@ -0,0 +1,205 @@
+"""
+Test enum cache refresh.
+"""
+
+import json
+import multiprocessing
+import threading
+import time
+import typing as t
+from pathlib import Path
+from unittest import mock
+
+import pytest
+
+from composio.client import utils
+from composio.client.collections import AppModel
+from composio.client.enums.store import EnumStore
+
+
+def _app(key: str, no_auth: bool = False) -> AppModel:
+    return AppModel(
+        name=key,
+        key=key,
+        appId=key,
+        description="",
+        categories=[],
+        meta={},
+        no_auth=no_auth,
+    )
+
+
+def _action(name: str, app: str, tags: t.List[str]) -> t.Dict:
+    schema = {"properties": {}, "title": name, "type": "object"}
+    return {
+        "name": name,
+        "appName": app,
+        "appId": app,
+        "tags": tags,
+        "parameters": schema,
+        "response": schema,
+    }
+
+
+class _Client:
+    def __init__(self, apps: t.List[AppModel], actions: t.List[t.Dict]) -> None:
+        self.apps = mock.Mock(get=mock.Mock(return_value=apps))
+        self.triggers = mock.Mock(get=mock.Mock(return_value=[]))
+        self.actions = mock.Mock(endpoint="/v2/actions/list/all")
+        self.http = mock.Mock(get=mock.Mock(side_effect=self._get))
+        self.listing = json.dumps({"items": actions}).encode()
+        self.requests: t.List[t.Dict] = []
+
+    def _get(self, url: str, headers: t.Dict) -> t.Any:
+        self.requests.append(headers)
+        if headers.get("If-None-Match") == '"v1"' and self.listing == self.served:
+            return mock.Mock(status_code=304, content=b"", headers={})
+        self.served = self.listing
+        return mock.Mock(
+            status_code=200,
+            content=self.listing,
+            headers={"ETag": '"v1"'},
+        )
+
+    served = b""
+
+
+@pytest.fixture(name="store")
+def _store(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> EnumStore:
+    store = EnumStore(path=tmp_path / "enums.db")
+    monkeypatch.setattr(utils, "get_enum_store", lambda: store)
+    monkeypatch.setattr(
+        utils, "get_manifest", lambda: {"format": 1, "tools": {}, "actions": {}}
+    )
+    monkeypatch.setattr(utils, "NO_CACHE_REFRESH", False)
+    return store
+
+
+def test_refresh_cache_is_incremental(store: EnumStore) -> None:
+    """Test unchanged listings are skipped and only changes are written."""
+    client = _Client(
+        apps=[_app("github"), _app("hackernews", no_auth=True)],
+        actions=[
+            _action("GITHUB_STAR_REPO", "github", ["repos"]),
+            _action("GITHUB_LIST_ISSUES", "github", ["issues"]),
+            _action("HACKERNEWS_GET_FRONTPAGE", "hackernews", []),
+            _action("UNKNOWN_ACTION", "unknown", []),
+        ],
+    )
+    utils.refresh_cache(t.cast(t.Any, client))
+    assert store.slugs("actions") == [
+        "GITHUB_LIST_ISSUES",
+        "GITHUB_STAR_REPO",
+        "HACKERNEWS_GET_FRONTPAGE",
+    ]
+    assert store.slugs("tags") == ["GITHUB_ISSUES", "GITHUB_REPOS"]
+    assert t.cast(dict, store.get("actions", "HACKERNEWS_GET_FRONTPAGE"))["no_auth"]
+
+    # Unchanged catalogue, the listing is revalidated with the stored ETag and
+    # only the app metadata is applied to the stored actions
+    client.apps.get.return_value = [_app("github", no_auth=True), _app("hackernews")]
+    with mock.patch.object(store, "put_many") as put_many:
+        utils.refresh_cache(t.cast(t.Any, client))
+    put_many.assert_not_called()
+    assert client.requests[-1] == {"If-None-Match": '"v1"'}
+    assert t.cast(dict, store.get("actions", "GITHUB_STAR_REPO"))["no_auth"]
+    assert not t.cast(dict, store.get("actions", "HACKERNEWS_GET_FRONTPAGE"))["no_auth"]
+
+    # Changed catalogue, removed actions are dropped
+    client.listing = json.dumps(
+        {"items": [_action("GITHUB_STAR_REPO", "github", ["repos"])]}
+    ).encode()
+    with mock.patch.object(store, "sync", wraps=store.sync) as sync:
+        utils.refresh_cache(t.cast(t.Any, client))
+    assert store.slugs("actions") == ["GITHUB_STAR_REPO"]
+    assert store.slugs("tags") == ["GITHUB_REPOS"]
+    ((_, kwargs),) = [call for call in sync.call_args_list if call.args[0] == "actions"]
+    assert kwargs["records"].keys() == {"GITHUB_STAR_REPO"}
+
+
+def test_refresh_cache_beta_flag(store: EnumStore) -> None:
+    """Test toggling the beta flag resyncs an unchanged listing."""
+    client = _Client(
+        apps=[_app("github")],
+        actions=[
+            _action("GITHUB_STAR_REPO", "github", []),
+            _action("GITHUB_STAR_REPO_BETA", "github", []),
+        ],
+    )
+    utils.refresh_cache(t.cast(t.Any, client))
+    assert store.slugs("actions") == ["GITHUB_STAR_REPO"]
+
+    utils.refresh_cache(t.cast(t.Any, client), beta=True)
+    assert client.requests[-1] == {}
+    assert store.slugs("actions") == ["GITHUB_STAR_REPO", "GITHUB_STAR_REPO_BETA"]
+
+    utils.refresh_cache(t.cast(t.Any, client), beta=True)
+    assert client.requests[-1] == {"If-None-Match": '"v1"'}
+
+    utils.refresh_cache(t.cast(t.Any, client))
+    assert store.slugs("actions") == ["GITHUB_STAR_REPO"]
+
+
+def test_check_cache_refresh_in_background(store: EnumStore) -> None:
+    """Test the cache can be refreshed without blocking the caller."""
+    release = threading.Event()
+    client = _Client(
+        apps=[_app("github")],
+        actions=[_action("GITHUB_A", "github", [])],
+    )
+    original = client.http.get.side_effect
+    client.http.get.side_effect = lambda **kw: release.wait() and original(**kw)
+
+    utils.check_cache_refresh(t.cast(t.Any, client), background=True)
+    assert store.count("actions") == 0
+
+    release.set()
+    assert utils.wait_for_cache_refresh(timeout=10.0)
+    assert store.slugs("actions") == ["GITHUB_A"]
+
+    # The cache is up to date now
+    client.apps.get.reset_mock()
+    utils.check_cache_refresh(t.cast(t.Any, client))
+    client.apps.get.assert_not_called()
+
+
+def _refresh_in_process(path: str, downloads: str) -> None:
+    store = EnumStore(path=Path(path))
+    client = _Client(
+        apps=[_app("github")],
+        actions=[_action("GITHUB_A", "github", [])],
+    )
+
+    def _get() -> t.List[AppModel]:
+        with open(downloads, "a", encoding="utf-8") as fp:
+            fp.write("apps\n")
+        time.sleep(0.2)
+        return [_app("github")]
+
+    client.apps.get.side_effect = _get
+    with mock.patch.object(utils, "get_enum_store", lambda: store), mock.patch.object(
+        utils, "get_manifest", lambda: {"format": 1, "tools": {}, "actions": {}}
+    ), mock.patch.object(utils, "NO_CACHE_REFRESH", False):
+        utils.check_cache_refresh(t.cast(t.Any, client), background=False)
+
+
+def test_check_cache_refresh_across_processes(tmp_path: Path) -> None:
+    """Test processes sharing a cache download the catalogue only once."""
+    downloads = tmp_path / "downloads"
+    downloads.touch()
+    context = multiprocessing.get_context("spawn")
+    processes = [
+        context.Process(
+            target=_refresh_in_process,
+            args=(str(tmp_path / "enums.db"), str(downloads)),
+        )
+        for _ in range(4)
+    ]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join(timeout=60)
+        assert process.exitcode == 0
+
+    assert downloads.read_text(encoding="utf-8").splitlines() == ["apps"]
+    assert EnumStore(path=tmp_path / "enums.db").slugs("actions") == ["GITHUB_A"]
@@ -0,0 +1,84 @@
+"""
+Test the cost of importing `composio`.
+"""
+
+import os
+import subprocess
+import sys
+import typing as t
+
+import pytest
+
+
+IMPORT_TIME_BUDGET = 0.25
+"""
+Budget in seconds for the cumulative import time of the `composio` package,
+as reported by `python -X importtime`.
+"""
+
+HEAVY_MODULES = (
+    "aiohttp",
+    "composio.client",
+    "composio.tools",
+    "fastapi",
+    "paramiko",
+    "pydantic",
+    "requests",
+    "sentry_sdk",
+)
+
+
+def _run(code: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={
+            **os.environ,
+            "COMPOSIO_DISABLE_SENTRY": "true",
+            "COMPOSIO_DISABLE_VERSION_CHECK": "true",
+        },
+    )
+
+
+def _import_times(stderr: str) -> t.Dict[str, float]:
+    """Parse the cumulative import times in seconds by module name."""
+    times = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        times[name.strip()] = int(cumulative) / 1e6
+    return times
+
+
+def test_import_time_budget() -> None:
+    """Test `import composio` doesn't import the SDK up front."""
+    result = _run(
+        "import sys, composio; "
+        f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    )
+    assert result.stdout.strip() == ""
+
+    elapsed = min(
+        _import_times(_run("import composio").stderr)["composio"] for _ in range(3)
+    )
+    assert elapsed < IMPORT_TIME_BUDGET, (
+        f"`import composio` took {elapsed:.3f}s, "
+        f"budget is {IMPORT_TIME_BUDGET:.3f}s"
+    )
+
+
+@pytest.mark.parametrize(
+    "name",
+    ("Action", "App", "ComposioToolSet", "Composio", "WorkspaceType", "action"),
+)
+def test_lazy_attributes(name: str) -> None:
+    """Test the public names are importable from the package."""
+    import composio  # pylint: disable=import-outside-toplevel
+
+    assert name in dir(composio)
+    assert getattr(composio, name) is not None
+    with pytest.raises(AttributeError):
+        getattr(composio, "SomethingElse")
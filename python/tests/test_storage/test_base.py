@@ -2,6 +2,9 @@
 Test storage helper.
 """
 
+import os
+import subprocess
+import sys
 import tempfile
 from pathlib import Path
 
@@ -26,3 +29,20 @@ def test_local_storage() -> None:
 
         dstore = _Store.load(path=path)
         assert dstore.name == "name"
+
+
+def test_cache_directory_override(tmp_path: Path) -> None:
+    """Test the cache directory can be set with `COMPOSIO_CACHE_DIR`."""
+    output = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "from composio.constants import LOCAL_CACHE_DIRECTORY; "
+            "print(LOCAL_CACHE_DIRECTORY)",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={**os.environ, "COMPOSIO_CACHE_DIR": str(tmp_path)},
+    ).stdout
+    assert output.strip() == str(tmp_path)
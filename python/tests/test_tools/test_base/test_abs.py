@@ -1,10 +1,12 @@
 """Test abstractions"""
 
+import json
 import re
-from typing import Dict
+from typing import Dict, List, Optional
 
+import jsonref
 import pytest
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 from composio.tools.base.abs import (
     DEPRECATED_MARKER,
@@ -13,6 +15,7 @@ from composio.tools.base.abs import (
     Tool,
     ToolBuilder,
     action_registry,
+    remove_json_ref,
     tool_registry,
 )
 
@@ -175,3 +178,27 @@ class TestToolBuilder:
         ToolBuilder.setup_children(obj=SomeTool)
 
         assert SomeTool.description == "Some Tool With description."
+
+
+def test_remove_json_ref() -> None:
+    """Test local references are inlined the same way `jsonref` does it."""
+
+    class Address(BaseModel):
+        street: str = Field(..., description="Street")
+
+    class Person(BaseModel):
+        address: Address = Field(..., description="Home address")
+        previous: List[Address] = Field(default_factory=list)
+        work: Optional[Address] = None
+
+    schema = Person.model_json_schema(by_alias=True)
+    expected = json.loads(
+        jsonref.dumps(
+            jsonref.replace_refs(schema, lazy_load=False, merge_props=True),
+            indent=2,
+        )
+    )
+    inlined = remove_json_ref(schema)
+    assert json.dumps(inlined) == json.dumps(expected)
+    assert inlined["properties"]["address"]["description"] == "Home address"
+    assert inlined["properties"]["address"] is not inlined["$defs"]["Address"]
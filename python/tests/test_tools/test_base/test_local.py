@@ -1,9 +1,12 @@
 """Test local tools abstraction."""
 
+from pathlib import Path
 from typing import Dict, List
 
+import pytest
 from pydantic import BaseModel, Field
 
+from composio.tools.base.abs import ActionBuilder
 from composio.tools.base.local import LocalAction, LocalTool
 
 
@@ -15,6 +18,15 @@ class Response(BaseModel):
     message: str = Field(..., description="Message for the user")
 
 
+class ReadRequest(BaseModel):
+    path: str = Field(
+        ...,
+        description="File to read",
+        json_schema_extra={"file_readable": True},
+    )
+    mode: str = Field("r", description="Read mode")
+
+
 class SomeAction(LocalAction[Request, Response]):
     def execute(self, request: Request, metadata: Dict) -> Response:
         return Response(message=f"Hello, {request}")
@@ -52,3 +64,26 @@ class TestLocalTool:
 
         assert not response["successful"]
         assert "Following fields are missing: {'name'}" in response["error"]
+
+    def test_process_request(self, tmp_path: Path) -> None:
+        file = tmp_path / "note.txt"
+        file.write_text("hello")
+
+        plan = ActionBuilder.get_parameter_plan(model=ReadRequest)
+        assert plan.fields == {"path", "mode"}
+        assert plan.file_readable == {"path"}
+        assert not plan.file_uploadable
+
+        request = {"path": str(file), "mode": str(file)}
+        assert SomeTool._process_request(  # pylint: disable=protected-access
+            request=request, plan=plan
+        ) == {"path": "hello", "mode": str(file)}
+
+        with pytest.raises(KeyError):
+            SomeTool._process_request(  # pylint: disable=protected-access
+                request={"other": 1}, plan=plan
+            )
+
+    def test_request_plan_is_cached(self) -> None:
+        assert SomeAction.request.plan is SomeAction.request.plan
+        assert SomeAction.request.plan.fields == {"name"}
@@ -1,12 +1,14 @@
 """Test runtime decorator."""
 
 import re
+from pathlib import Path
 
 import pytest
 import typing_extensions as te
 from pydantic import BaseModel, Field
 
-from composio.tools.base.abs import tool_registry
+from composio.tools.base import runtime
+from composio.tools.base.abs import Action, tool_registry
 from composio.tools.base.runtime import InvalidRuntimeAction, action
 
 
@@ -175,3 +177,33 @@ def test_untyped_param() -> None:
             :return repositories: Repositories
             """
             return []
+
+
+def test_schema_disk_cache(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test runtime action schemas are cached on disk."""
+    monkeypatch.setattr(runtime, "SCHEMA_CACHE_DIRECTORY", tmp_path)
+
+    @action(toolname="cached")
+    def add(a: int, b: int) -> int:
+        """
+        Add two numbers
+
+        :param a: Number a
+        :param b: Number b
+        :return result: Sum of the numbers
+        """
+        return a + b
+
+    schema = add.schema()
+    (cached,) = tmp_path.glob("*.json")
+    assert cached.stem == runtime._schema_cache_key(  # pylint: disable=protected-access
+        action=add
+    )
+
+    def compile_schema(cls):  # pylint: disable=unused-argument
+        raise AssertionError("Schema should be loaded from the cache")
+
+    add._schema = None  # pylint: disable=protected-access
+    with monkeypatch.context() as patch:
+        patch.setattr(Action, "compile_schema", classmethod(compile_schema))
+        assert add.schema() == schema
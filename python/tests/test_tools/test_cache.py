@@ -0,0 +1,169 @@
+"""
+Test action result cache.
+"""
+
+import typing as t
+from pathlib import Path
+
+import pytest
+
+from composio import Action, App
+from composio.client.metrics import MetricsCollector
+from composio.tools.cache import CachePolicy, ResultCache
+from composio.tools.toolset import ComposioToolSet
+
+
+def test_execute_action_uses_result_cache(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test read-only results are reused until another action of the app runs."""
+    executed = []
+
+    def _execute_local(action: Action, params: t.Dict, **_: t.Any) -> t.Dict:
+        executed.append(action.slug)
+        return {"successful": True, "data": {"calls": len(executed)}, "error": None}
+
+    toolset = ComposioToolSet(
+        result_cache={"actions": {Action.FILETOOL_LIST_FILES: CachePolicy()}},
+        connected_account_validation="lazy",
+    )
+    monkeypatch.setattr(toolset, "_execute_local", _execute_local)
+
+    first = toolset.execute_action(Action.FILETOOL_LIST_FILES, {})
+    first["data"]["calls"] = 100
+    assert toolset.execute_action(Action.FILETOOL_LIST_FILES, {}) == {
+        "successful": True,
+        "data": {"calls": 1},
+        "error": None,
+    }
+    toolset.execute_action(Action.FILETOOL_LIST_FILES, {"path": "src"})
+    assert executed == ["FILETOOL_LIST_FILES"] * 2
+
+    toolset.execute_action(Action.FILETOOL_WRITE, {"text": "..."})
+    toolset.execute_action(Action.FILETOOL_LIST_FILES, {})
+    assert executed == ["FILETOOL_LIST_FILES"] * 2 + [
+        "FILETOOL_WRITE",
+        "FILETOOL_LIST_FILES",
+    ]
+
+    assert toolset.result_cache is not None
+    assert toolset.result_cache.snapshot() == {
+        "FILETOOL_LIST_FILES": {"hits": 1, "misses": 3, "invalidations": 0},
+        "FILETOOL_WRITE": {"hits": 0, "misses": 0, "invalidations": 1},
+    }
+
+
+def test_result_cache_post_processing(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test raw results are cached and post-processed on every hit."""
+    executed = []
+
+    def _execute_local(**_: t.Any) -> t.Dict:
+        executed.append(True)
+        return {"successful": True, "data": {"files": ["a"]}, "error": None}
+
+    def _count(response: t.Dict) -> t.Dict:
+        return {**response, "data": {"count": len(response["data"]["files"])}}
+
+    toolset = ComposioToolSet(
+        result_cache={"apps": {App.FILETOOL: CachePolicy()}},
+        connected_account_validation="lazy",
+    )
+    monkeypatch.setattr(toolset, "_execute_local", _execute_local)
+
+    for _ in range(2):
+        response = toolset.execute_action(
+            Action.FILETOOL_LIST_FILES,
+            {},
+            processors={"post": {Action.FILETOOL_LIST_FILES: _count}},
+        )
+        assert response["data"] == {"count": 1}
+    assert len(executed) == 1
+
+
+def test_result_cache_invalidated_after_writes() -> None:
+    """Test results cached while a write was running are dropped after it."""
+    cache = ResultCache(policies={"actions": {"filetool_list_files": CachePolicy()}})
+    response = {"successful": True, "data": {}}
+    assert cache.get(Action.FILETOOL_WRITE, {}, "default") is None
+    cache.set(Action.FILETOOL_LIST_FILES, {}, "default", response)
+    cache.set(Action.FILETOOL_WRITE, {}, "default", response)
+    assert cache.get(Action.FILETOOL_LIST_FILES, {}, "default") is None
+
+
+def test_result_cache_skips_apps_without_results(tmp_path: Path) -> None:
+    """Test apps without results are not invalidated and lookups are recorded."""
+    metrics = MetricsCollector()
+    policies = {
+        "actions": {"filetool_list_files": CachePolicy()},
+        "tags": {"important": CachePolicy(backend="disk")},
+    }
+    cache = ResultCache(
+        policies=policies,  # type: ignore
+        directory=tmp_path,
+        metrics=metrics,
+    )
+    response = {"successful": True, "data": {}}
+    assert cache.get(Action.FILETOOL_LIST_FILES, {}, "default") is None
+    cache.set(Action.FILETOOL_LIST_FILES, {}, "default", response)
+    assert cache.get(Action.FILETOOL_LIST_FILES, {}, "default") == response
+
+    assert cache.get(Action.SHELLTOOL_EXEC_COMMAND, {}, "default") is None
+    assert cache.get(Action.FILETOOL_WRITE, {}, "default") is None
+    cache.set(Action.FILETOOL_WRITE, {}, "default", response)
+    assert cache.snapshot() == {
+        "FILETOOL_LIST_FILES": {"hits": 1, "misses": 1, "invalidations": 0},
+        "FILETOOL_WRITE": {"hits": 0, "misses": 0, "invalidations": 1},
+    }
+    assert metrics.cache_snapshot() == {"results": {"hits": 1, "misses": 1}}
+
+    # Results cached on disk by other processes are dropped as well
+    (tmp_path / "tag-important" / "FILETOOL").mkdir(parents=True)
+    cache.invalidate(app="filetool")
+    assert not (tmp_path / "tag-important" / "FILETOOL").exists()
+
+
+def test_result_cache_policies(tmp_path: Path) -> None:
+    """Test policy lookup, eviction and the disk backend."""
+    cache = ResultCache(
+        policies={
+            "apps": {App.FILETOOL: CachePolicy(maxsize=1)},
+            "actions": {"filetool_open_file": CachePolicy(ttl=0)},
+        },
+    )
+    response = {"successful": True, "data": {}}
+    for path in ("a", "b"):
+        cache.set(Action.FILETOOL_LIST_FILES, {"path": path}, "default", response)
+    assert cache.get(Action.FILETOOL_LIST_FILES, {"path": "a"}, "default") is None
+    assert cache.get(Action.FILETOOL_LIST_FILES, {"path": "b"}, "default") == response
+
+    # A disabled policy makes the action a write
+    assert cache.get(Action.FILETOOL_OPEN_FILE, {}, "default") is None
+    assert cache.get(Action.FILETOOL_LIST_FILES, {"path": "b"}, "default") is None
+
+    # Failed executions are not cached
+    policies = {"apps": {App.FILETOOL: CachePolicy(backend="disk")}}
+    disk = ResultCache(policies=policies, directory=tmp_path)  # type: ignore
+    disk.set(Action.FILETOOL_LIST_FILES, {}, "default", {"successful": False})
+    assert disk.get(Action.FILETOOL_LIST_FILES, {}, "default") is None
+
+    # Results on disk are shared between caches
+    disk.set(Action.FILETOOL_LIST_FILES, {}, "default", response)
+    other = ResultCache(policies=policies, directory=tmp_path)  # type: ignore
+    assert other.get(Action.FILETOOL_LIST_FILES, {}, "default") == response
+    assert other.get(Action.FILETOOL_LIST_FILES, {}, "someone") is None
+
+    disk.invalidate(app="filetool")
+    assert other.get(Action.FILETOOL_LIST_FILES, {}, "default") is None
+
+
+def test_result_cache_disk_eviction(tmp_path: Path) -> None:
+    """Test results on disk are evicted in batches, least recently used first."""
+    policies = {"apps": {App.FILETOOL: CachePolicy(backend="disk", maxsize=10)}}
+    cache = ResultCache(policies=policies, directory=tmp_path)  # type: ignore
+    response = {"successful": True, "data": {}}
+    for i in range(11):
+        cache.set(Action.FILETOOL_LIST_FILES, {"path": str(i)}, "default", response)
+
+    assert len(list(tmp_path.glob("*/*/*.json"))) == 9
+
+    # Below the limit again, writes don't evict
+    cache.set(Action.FILETOOL_LIST_FILES, {"path": "11"}, "default", response)
+    assert len(list(tmp_path.glob("*/*/*.json"))) == 10
@@ -0,0 +1,112 @@
+"""
+Test client-side rate limits.
+"""
+
+import asyncio
+import threading
+import time
+import typing as t
+
+import pytest
+
+from composio import Action, App
+from composio.exceptions import RateLimitTimeoutError
+from composio.tools.limiter import RateLimit, RateLimiter
+from composio.tools.toolset import ActionCall, ComposioToolSet
+
+
+def _toolset(
+    monkeypatch: pytest.MonkeyPatch,
+    limit: RateLimit,
+    duration: float = 0.0,
+) -> t.Tuple[ComposioToolSet, t.List[int]]:
+    """Get a toolset limiting `FILETOOL`, and the executions running at each start."""
+    running = []
+    lock = threading.Lock()
+    active = 0
+
+    def _execute_local(**_: t.Any) -> t.Dict:
+        nonlocal active
+        with lock:
+            active += 1
+            running.append(active)
+        time.sleep(duration)
+        with lock:
+            active -= 1
+        return {"successful": True, "data": {}, "error": None}
+
+    toolset = ComposioToolSet(
+        rate_limits={App.FILETOOL: limit},
+        connected_account_validation="lazy",
+    )
+    monkeypatch.setattr(toolset, "_execute_local", _execute_local)
+    # Setting up the workspace looks up the GitHub access token of the entity
+    monkeypatch.setattr(
+        toolset,
+        "_try_get_github_access_token_for_current_entity",
+        lambda *_: None,
+    )
+    return toolset, running
+
+
+def test_rate_limit(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test executions over the rate wait for their turn."""
+    toolset, running = _toolset(monkeypatch, RateLimit(rate=20, burst=1))
+    start = time.monotonic()
+    for _ in range(3):
+        toolset.execute_action(Action.FILETOOL_LIST_FILES, {})
+    assert time.monotonic() - start >= 0.09
+    assert len(running) == 3
+
+    snapshot = toolset.rate_limiter.snapshot()
+    assert snapshot["FILETOOL"]["executions"] == 3
+    assert snapshot["FILETOOL"]["waits"] == 2
+
+
+def test_rate_limit_timeout(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test waits longer than the timeout raise."""
+    toolset, running = _toolset(monkeypatch, RateLimit(rate=1, timeout=0.1))
+    toolset.execute_action(Action.FILETOOL_LIST_FILES, {})
+    with pytest.raises(RateLimitTimeoutError, match="rate limit of `FILETOOL`"):
+        toolset.execute_action(Action.FILETOOL_LIST_FILES, {})
+    assert len(running) == 1
+
+
+def test_concurrency_limit(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test the number of executions running at once is capped."""
+    toolset, running = _toolset(
+        monkeypatch,
+        RateLimit(max_concurrency=2),
+        duration=0.05,
+    )
+    calls = [ActionCall(action=Action.FILETOOL_LIST_FILES, params={})] * 6
+    toolset.execute_actions(calls=calls, max_concurrency=6)
+    assert len(running) == 6
+    assert max(running) == 2
+
+    running.clear()
+    asyncio.run(toolset.aexecute_actions(calls=calls, max_concurrency=6))
+    assert len(running) == 6
+    assert max(running) == 2
+
+
+def test_limit_per_connected_account() -> None:
+    """Test connected accounts of an app get their own limits."""
+    limiter = RateLimiter(
+        limits={
+            App.FILETOOL: RateLimit(rate=1, per_connected_account=True),
+            "shelltool": RateLimit(rate=1),
+        }
+    )
+    for account in ("first", "second"):
+        with limiter.limit(Action.FILETOOL_LIST_FILES, connected_account_id=account):
+            pass
+    with limiter.limit(Action.SHELLTOOL_EXEC_COMMAND, connected_account_id="first"):
+        pass
+
+    stats = {"executions": 1, "waits": 0, "wait_time": 0.0}
+    assert limiter.snapshot() == {
+        "FILETOOL/first": stats,
+        "FILETOOL/second": stats,
+        "SHELLTOOL": stats,
+    }
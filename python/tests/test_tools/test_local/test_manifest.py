@@ -0,0 +1,82 @@
+"""Test local tools manifest."""
+
+import json
+import os
+import subprocess
+import sys
+import textwrap
+
+from composio.tools.local.manifest import MANIFEST_PATH, read_manifest
+
+
+def _run(code: str) -> str:
+    return subprocess.run(
+        [sys.executable, "-c", textwrap.dedent(code)],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={
+            **os.environ,
+            "COMPOSIO_DISABLE_SENTRY": "true",
+            "COMPOSIO_DISABLE_VERSION_CHECK": "true",
+            "COMPOSIO_NO_CACHE_REFRESH": "true",
+        },
+    ).stdout
+
+
+def test_manifest_is_up_to_date() -> None:
+    """Test the shipped manifest matches the local tools."""
+    generated = _run(
+        """
+        import json
+        from composio.tools.local.manifest import generate_manifest
+
+        print(json.dumps(generate_manifest(), sort_keys=True))
+        """
+    )
+    assert read_manifest() == json.loads(generated), (
+        f"{MANIFEST_PATH.name} is outdated, "
+        "run `python scripts/local_tools_manifest.py` to regenerate it"
+    )
+
+
+def test_tool_modules_are_imported_on_use() -> None:
+    """Test schemas are served from the manifest and tools import on execution."""
+    output = _run(
+        """
+        import sys
+        from composio import Action
+        from composio.tools.env.factory import HostWorkspace, WorkspaceType
+        from composio.tools.local.handler import LocalClient
+
+        def loaded():
+            return sorted(
+                name
+                for name in sys.modules
+                if name.startswith("composio.tools.local.") and name.endswith(".tool")
+            )
+
+        schemas = LocalClient.get_action_schemas(
+            apps=["MATHEMATICAL"],
+            actions=["FILETOOL_OPEN_FILE"],
+        )
+        print([schema["name"] for schema in schemas])
+        print(loaded())
+
+        workspace = HostWorkspace(config=WorkspaceType.Host())
+        workspace.setup()
+        response = workspace.execute_action(
+            action=Action.MATHEMATICAL_CALCULATOR,
+            request_data={"operation": "1 + 2"},
+            metadata={},
+        )
+        print(response["data"]["result"])
+        print(loaded())
+        """
+    )
+    assert output.splitlines() == [
+        "['MATHEMATICAL_CALCULATOR', 'FILETOOL_OPEN_FILE']",
+        "[]",
+        "3",
+        "['composio.tools.local.mathematical.tool']",
+    ]
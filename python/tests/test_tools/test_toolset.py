@@ -2,8 +2,11 @@
 Test composio toolset.
 """
 
+import asyncio
 import logging
 import re
+import threading
+import time
 import typing as t
 from unittest import mock
 
@@ -14,8 +17,9 @@ from composio import Action, App
 from composio.exceptions import ApiKeyNotProvidedError, ComposioSDKError
 from composio.tools.base.abs import action_registry, tool_registry
 from composio.tools.base.runtime import action as custom_action
+from composio.tools.local import load_local_tool
 from composio.tools.local.filetool.tool import Filetool, FindFile
-from composio.tools.toolset import ComposioToolSet
+from composio.tools.toolset import RETRY, ActionCall, ComposioToolSet
 from composio.utils.pypi import reset_installed_list
 
 from composio_langchain.toolset import ComposioToolSet as LangchainToolSet
@@ -74,6 +78,7 @@ class TestValidateTools:
     @classmethod
     def setup_class(cls) -> None:
         cls.toolset = ComposioToolSet()
+        load_local_tool(App.BROWSER_TOOL.slug)
         tool_registry["local"][App.BROWSER_TOOL.slug].requires = [cls.package]
         action_registry["local"][Action.BROWSER_TOOL_CLICK_ELEMENT.slug].requires = [
             cls.package
@@ -153,6 +158,76 @@ class TestConnectedAccountProvider:
                 params={},
             )
 
+    def test_lazy_validation(self) -> None:
+        """Test lazy mode validates the account for an app on first use."""
+        toolset = ComposioToolSet(
+            connected_account_ids={App.FILETOOL: self.connected_account},
+            connected_account_validation="lazy",
+        )
+        assert toolset._remote_client is None
+
+        with mock.patch.object(toolset, "_remote_client") as client:
+            for _ in range(2):
+                assert (
+                    toolset._get_connected_account(Action.FILETOOL_FIND_FILE)
+                    == self.connected_account
+                )
+
+        client.get_entity.return_value.get_connection.assert_called_once_with(
+            app=App.FILETOOL,
+            connected_account_id=self.connected_account,
+        )
+
+    def test_eager_validation_without_accounts(self) -> None:
+        """Test eager mode doesn't create the client when there's nothing to validate."""
+        toolset = ComposioToolSet(connected_account_validation="eager")
+        assert toolset._remote_client is None
+
+    def test_github_access_token_without_connection(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test the GitHub token lookup handles a missing connection."""
+        monkeypatch.delenv("_COMPOSIO_GITHUB_ACCESS_TOKEN", raising=False)
+        toolset = ComposioToolSet()
+        with mock.patch.object(toolset, "_remote_client") as client:
+            client.get_entity.return_value.get_connection.return_value = None
+            assert toolset._try_get_github_access_token_for_current_entity() is None
+
+    def test_lazy_validation_async(self) -> None:
+        """Test lazy validation runs once and off the loop for async executions."""
+        toolset = ComposioToolSet(
+            connected_account_ids={App.FILETOOL: self.connected_account},
+            connected_account_validation="lazy",
+        )
+        setattr(
+            toolset,
+            "_execute_local",
+            lambda **_: {"successful": True, "data": {}, "error": None},
+        )
+        setattr(
+            toolset,
+            "_try_get_github_access_token_for_current_entity",
+            lambda *_: None,
+        )
+        threads = []
+
+        def _get_connection(**_: t.Any) -> None:
+            threads.append(threading.get_ident())
+            time.sleep(0.05)
+
+        async def _execute() -> int:
+            await toolset.aexecute_actions(
+                calls=[ActionCall(action=Action.FILETOOL_LIST_FILES, params={})] * 4
+            )
+            return threading.get_ident()
+
+        with mock.patch.object(toolset, "_remote_client") as client:
+            client.get_entity.return_value.get_connection.side_effect = _get_connection
+            loop_thread = asyncio.run(_execute())
+
+        assert len(threads) == 1
+        assert threads[0] != loop_thread
+
 
 def test_api_key_missing(monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.setenv("COMPOSIO_API_KEY", "")
@@ -256,6 +331,74 @@ def test_processors_on_get_tools(monkeypatch: pytest.MonkeyPatch) -> None:
     assert postprocessor_called
 
 
+def test_aexecute_action_prepares_off_the_loop(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test the blocking execution preparation doesn't run on the event loop."""
+    toolset = ComposioToolSet()
+    prepare = toolset._prepare_execution  # pylint: disable=protected-access
+    threads = []
+
+    def _prepare_execution(**kwargs: t.Any) -> t.Any:
+        threads.append(threading.get_ident())
+        return prepare(**kwargs)
+
+    monkeypatch.setattr(toolset, "_prepare_execution", _prepare_execution)
+    monkeypatch.setattr(
+        toolset,
+        "_execute_local",
+        lambda **_: {"successful": True, "data": {}, "error": None},
+    )
+
+    async def _execute() -> int:
+        await toolset.aexecute_action(Action.FILETOOL_LIST_FILES, {})
+        return threading.get_ident()
+
+    loop_thread = asyncio.run(_execute())
+    assert len(threads) == 1
+    assert threads[0] != loop_thread
+
+
+def test_processors_dispatch_order() -> None:
+    """Test processors are resolved by slug and run in the documented order."""
+    calls = []
+
+    def processor(name: str) -> t.Callable[[dict], dict]:
+        def _process(data: dict) -> dict:
+            calls.append(name)
+            return data
+
+        return _process
+
+    # pylint: disable=protected-access
+    toolset = ComposioToolSet()
+    toolset._merge_processors(
+        {
+            "pre": {
+                "filetool_find_file": processor("action pre"),
+                "filetool": processor("app pre"),
+            },
+            "post": {
+                App.FILETOOL: processor("app post"),
+                Action.FILETOOL_FIND_FILE: processor("action post"),
+            },
+        }
+    )
+    action = Action.FILETOOL_FIND_FILE
+    toolset._process_respone(
+        action=action,
+        response=toolset._process_request(action=action, request={}),
+    )
+    assert calls == ["app pre", "action pre", "action post", "app post"]
+
+    toolset._merge_processors({"pre": {App.FILETOOL: lambda _: RETRY}})
+    with pytest.raises(
+        ComposioSDKError,
+        match="Received RETRY from App preprocessor function",
+    ):
+        toolset._process_request(action=action, request={})
+
+
 def test_check_connected_accounts_flag() -> None:
     """Test the `check_connected_accounts` flag on `get_tools()`."""
 
@@ -570,3 +713,65 @@ def test_invalid_handle_tool_calls() -> None:
     toolset.get_tools(actions=[Action.GMAIL_FETCH_EMAILS])
     with mock.patch.object(toolset, "_execute_remote"):
         toolset.execute_action(Action.HACKERNEWS_GET_FRONTPAGE, {})
+
+
+def test_execute_actions() -> None:
+    """Test actions are executed in parallel and results keep the call order."""
+    toolset = ComposioToolSet()
+    barrier = threading.Barrier(3, timeout=5.0)
+
+    def _execute_action(action, params, **kwargs):
+        barrier.wait()
+        return {"action": action, "params": params}
+
+    calls: t.List[ActionCall] = [
+        {"action": Action.FILETOOL_FIND_FILE, "params": {"index": index}}
+        for index in range(3)
+    ]
+    with mock.patch.object(toolset, "_workspace"), mock.patch.object(
+        toolset, "execute_action", side_effect=_execute_action
+    ) as mocked:
+        outputs = toolset.execute_actions(calls=calls, max_concurrency=3)
+
+    assert mocked.call_count == 3
+    assert outputs == [
+        {"action": Action.FILETOOL_FIND_FILE, "params": {"index": index}}
+        for index in range(3)
+    ]
+
+
+def test_get_action_schemas_is_memoized() -> None:
+    """Test action schemas are memoized until the schema processors change."""
+    toolset = ComposioToolSet()
+    with mock.patch.object(
+        toolset,
+        "_get_action_schemas",
+        wraps=toolset._get_action_schemas,  # pylint: disable=protected-access
+    ) as get_action_schemas:
+        (schema,) = toolset.get_action_schemas(actions=[Action.MATHEMATICAL_CALCULATOR])
+        schema.description = "Changed by the caller"
+
+        (cached,) = toolset.get_action_schemas(actions=[Action.MATHEMATICAL_CALCULATOR])
+        assert get_action_schemas.call_count == 1
+        assert cached.description != "Changed by the caller"
+
+        def add_note(properties: t.Dict) -> t.Dict:
+            properties["operation"]["description"] += " Note."
+            return properties
+
+        toolset._merge_processors(  # pylint: disable=protected-access
+            {"schema": {Action.MATHEMATICAL_CALCULATOR: add_note}}
+        )
+        (processed,) = toolset.get_action_schemas(
+            actions=[Action.MATHEMATICAL_CALCULATOR]
+        )
+        assert get_action_schemas.call_count == 2
+        assert processed.parameters.properties["operation"]["description"].endswith(
+            " Note."
+        )
+
+        toolset._merge_processors(  # pylint: disable=protected-access
+            {"schema": {Action.MATHEMATICAL_CALCULATOR: add_note}}
+        )
+        toolset.get_action_schemas(actions=[Action.MATHEMATICAL_CALCULATOR])
+        assert get_action_schemas.call_count == 2
@@ -0,0 +1,60 @@
+"""
+Test helpers for files shared by multiple processes.
+"""
+
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from composio.utils.atomic import FileLock, atomic_write
+
+
+def test_atomic_write(tmp_path: Path) -> None:
+    """Test files are replaced without leaving temporary files around."""
+    path = tmp_path / "nested" / "data.json"
+    atomic_write(path, "{}")
+    atomic_write(path, b'{"key": 1}')
+    assert path.read_text(encoding="utf-8") == '{"key": 1}'
+    assert [file.name for file in path.parent.iterdir()] == ["data.json"]
+
+
+def test_atomic_write_failure(tmp_path: Path) -> None:
+    """Test the original file is kept if writing fails."""
+    path = tmp_path / "data.json"
+    atomic_write(path, "original")
+    with pytest.raises(TypeError):
+        atomic_write(path, object())  # type: ignore
+    assert path.read_text(encoding="utf-8") == "original"
+    assert [file.name for file in tmp_path.iterdir()] == ["data.json"]
+
+
+def test_file_lock(tmp_path: Path) -> None:
+    """Test the lock is exclusive."""
+    path = tmp_path / "cache.lock"
+    with FileLock(path) as lock:
+        assert lock.locked
+        other = FileLock(path, timeout=0.1)
+        assert not other.acquire(blocking=False)
+        assert not other.acquire()
+        with pytest.raises(TimeoutError):
+            with other:
+                pass
+    assert not lock.locked
+
+    other = FileLock(path)
+    assert other.acquire(blocking=False)
+    other.release()
+
+
+def test_file_lock_waits(tmp_path: Path) -> None:
+    """Test acquiring a held lock waits for it to be released."""
+    path = tmp_path / "cache.lock"
+    lock = FileLock(path)
+    lock.acquire()
+    threading.Timer(0.2, lock.release).start()
+
+    start = time.monotonic()
+    with FileLock(path, timeout=5.0):
+        assert time.monotonic() - start >= 0.1
@@ -0,0 +1,52 @@
+"""
+Test fast JSON helpers.
+"""
+
+import json
+from unittest import mock
+
+import pydantic
+import pytest
+
+from composio.utils import fastjson
+
+
+class _Item(pydantic.BaseModel):
+    name: str
+    tags: list = []
+
+
+def test_loads() -> None:
+    """Test documents decode the same with and without `orjson`."""
+    document = b'{"name": "h\\u00e9llo", "values": [1, 2.5, null, true]}'
+    expected = json.loads(document)
+    assert fastjson.loads(document) == expected
+    assert fastjson.loads(memoryview(document)) == expected
+    with mock.patch.object(fastjson, "orjson", None):
+        assert fastjson.loads(document) == expected
+        assert fastjson.loads(memoryview(document)) == expected
+        assert fastjson.loads(document.decode()) == expected
+
+
+def test_validate_list() -> None:
+    """Test lists of models are validated from the raw document."""
+    items = [{"name": "one", "tags": ["a"]}, {"name": "two"}]
+    document = json.dumps({"items": items, "totalPages": 1}).encode()
+
+    assert fastjson.validate_list(data=document, model=_Item, key="items") == [
+        _Item(**item) for item in items
+    ]
+    assert fastjson.validate_list(data=json.dumps(items), model=_Item) == [
+        _Item(**item) for item in items
+    ]
+    assert fastjson.validate_list(data=b"{}", model=_Item, key="items") is None
+    with pytest.raises(pydantic.ValidationError):
+        fastjson.validate_list(data=b'[{"tags": []}]', model=_Item)
+
+
+def test_is_json_list() -> None:
+    """Test list documents are detected without decoding them."""
+    assert fastjson.is_json_list(b" \n[1, 2]")
+    assert fastjson.is_json_list("[]")
+    assert not fastjson.is_json_list(b'{"items": []}')
+    assert not fastjson.is_json_list(b"")
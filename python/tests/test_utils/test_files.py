@@ -0,0 +1,94 @@
+"""
+Test file content helpers.
+"""
+
+import base64
+import binascii
+import json
+import os
+import textwrap
+from pathlib import Path
+
+import pytest
+
+from composio.constants import ENV_COMPOSIO_MAX_INLINE_FILE_SIZE
+from composio.utils import files
+from composio.utils.files import FileContent, FileTooLargeError, dump_json, write_base64
+
+
+def test_dump_json_streams_file_content(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test file contents are encoded in chunks and the body spools to disk."""
+    monkeypatch.setattr(files, "CHUNK_SIZE", 3)
+    monkeypatch.setattr(files, "SPOOL_MAX_SIZE", 16)
+
+    text = tmp_path / "text.txt"
+    # Multi-byte characters get split across chunks
+    text.write_text('héllo "wörld"\n', encoding="utf-8")
+    binary = tmp_path / "image.png"
+    binary.write_bytes(bytes(range(256)) * 4)
+
+    body = dump_json(
+        {
+            "text": FileContent(path=str(text)),
+            "file": {
+                "name": binary.name,
+                "content": FileContent(path=str(binary), binary=True),
+            },
+            "value": 1,
+        }
+    )
+    with body:
+        assert not hasattr(body, "getbuffer")
+        data = json.loads(body.read())
+
+    assert data["text"] == text.read_text(encoding="utf-8")
+    assert base64.b64decode(data["file"]["content"]) == binary.read_bytes()
+    assert data["value"] == 1
+
+
+def test_file_content_encoding(tmp_path: Path) -> None:
+    """Test text files are read as is and binary files as base64."""
+    text = tmp_path / "text.txt"
+    text.write_text("hello", encoding="utf-8")
+    binary = tmp_path / "binary.bin"
+    binary.write_bytes(b"\xff\xfe\x00")
+
+    assert FileContent(path=str(text)).read() == "hello"
+    assert FileContent(path=str(binary)).read() == base64.b64encode(
+        b"\xff\xfe\x00"
+    ).decode("utf-8")
+
+
+def test_max_inline_file_size(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test files larger than the configured limit are rejected."""
+    file = tmp_path / "file.txt"
+    file.write_bytes(os.urandom(32))
+
+    monkeypatch.setenv(ENV_COMPOSIO_MAX_INLINE_FILE_SIZE, "16")
+    with pytest.raises(FileTooLargeError, match="exceeds the maximum inline file size"):
+        FileContent(path=str(file))
+
+    monkeypatch.setenv(ENV_COMPOSIO_MAX_INLINE_FILE_SIZE, "32")
+    assert FileContent(path=str(file), binary=True).size == 32
+
+
+def test_write_base64(tmp_path: Path) -> None:
+    """Test base64 content is decoded to the file in chunks."""
+    content = os.urandom(1000)
+    encoded = base64.urlsafe_b64encode(content).decode("utf-8")
+    # Line breaks are ignored like `base64.urlsafe_b64decode` does
+    encoded = "\n".join(textwrap.wrap(encoded, width=76))
+
+    path = tmp_path / "file.bin"
+    write_base64(content=encoded, path=path, chunk_size=7)
+    assert path.read_bytes() == content
+
+    with pytest.raises(binascii.Error):
+        write_base64(content=encoded[:-3], path=path, chunk_size=7)
+    assert not path.exists()
+
+    with pytest.raises(binascii.Error, match="only ASCII characters"):
+        write_base64(content=encoded + "é", path=path)
+    assert not path.exists()
@@ -4,6 +4,7 @@ from unittest import mock
 import pytest
 
 from composio import ComposioToolSet
+from composio.utils.logging import WithLogger
 
 
 @pytest.mark.parametrize(
@@ -22,3 +23,21 @@ def test_log_verbosity(verbosity: int, size: int):
     toolset = ComposioToolSet(verbosity_level=verbosity)
     with mock.patch.object(Logger, "info", new=_assert):
         toolset.logger.info("-" * 2048)
+
+
+def test_lazy_formatting():
+    """Test arguments are only formatted when the level is enabled."""
+    argument = mock.MagicMock(__repr__=lambda _: "x" * 2048)
+    logger = WithLogger(verbosity_level=0).logger
+    with mock.patch.object(Logger, "debug") as debug, mock.patch.object(
+        Logger, "isEnabledFor", return_value=False
+    ):
+        logger.debug("Got %r", argument)
+    debug.assert_not_called()
+
+    with mock.patch.object(Logger, "debug") as debug, mock.patch.object(
+        Logger, "isEnabledFor", return_value=True
+    ):
+        logger.debug("Got %r", argument)
+    (message,), _ = debug.call_args
+    assert message == "Got " + "x" * 252 + "..."
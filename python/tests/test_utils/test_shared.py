@@ -152,3 +152,33 @@ def test_pydantic_model_from_param_schema() -> None:
         model(attr=attrs, attrmap=None)
     with pytest.raises(pydantic.ValidationError):
         model(attr=attrs, attrmap=["list directly"])
+
+
+def test_cached_schema_helpers() -> None:
+    """Test models and signatures are generated once per schema."""
+    shared.clear_schema_caches()
+    schema = {
+        "title": "CreateIssueRequest",
+        "properties": {
+            "repo": {"type": "string", "description": "Repository name."},
+            "body": {"description": "Issue body."},
+        },
+        "required": ["repo"],
+    }
+    reordered = {key: schema[key] for key in reversed(list(schema))}
+
+    model = shared.cached_json_schema_to_model(json_schema=schema)
+    assert shared.cached_json_schema_to_model(json_schema=reordered) is model
+    assert "type" not in schema["properties"]["body"]
+    model(repo="composio")
+    with pytest.raises(pydantic.ValidationError):
+        model()
+
+    del schema["properties"]["body"]
+    params = shared.cached_signature_format_from_schema_params(schema)
+    assert [param.name for param in params] == ["repo"]
+    params.clear()
+    assert len(shared.cached_signature_format_from_schema_params(schema)) == 1
+
+    shared.clear_schema_caches()
+    assert shared.cached_json_schema_to_model(json_schema=reordered) is not model